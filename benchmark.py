@@ -4,28 +4,140 @@ Example script that demonstrates running the same code across different Python v
 This script can be executed with any of the three Python versions to show performance differences.
 Tests all 5 different data sizes for each test with 5 repetitions.
 Results are saved to CSV format for analysis.
+
+Which benchmarks, sizes, repeats and interpreters are used comes from a TOML
+profile (see benchmark_config.py); the CLI can narrow the selection further:
+
+    python benchmark.py --profile smoke
+    python benchmark.py --only fib,object --levels Small,Medium
+    python benchmark.py --list
 """
 
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
 import sys
+import time
 import platform
 import csv
+import re
+import sysconfig
 from datetime import datetime
 from pathlib import Path
+from queue import Empty
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from benchmark_config import (
+    DEFAULT_PROFILE,
+    load_profile,
+    match_benchmarks,
+    match_levels,
+    match_override,
+    parse_duration,
+    split_csv_arg,
+    unmatched_overrides
+)
+from benchmark_report import build_report
+from benchmark_scheduler import (
+    BUDGET_CALIBRATION_FRACTION,
+    BUDGET_MAX_REPEATS,
+    estimate_costs,
+    load_history,
+    print_schedule,
+    remaining_time,
+    schedule_plan
+)
 
 # Import benchmark functions from the tests package
 from tests import (
+    BenchmarkUnavailable,
+    calibrate_timer,
     run_fibonacci_benchmark,
     run_bubble_sort_benchmark,
     run_list_comprehension_benchmark,
     run_function_call_benchmark,
+    run_function_call_variant_benchmark,
+    FUNCTION_CALL_VARIANTS,
     run_exception_handling_benchmark,
     run_object_instantiation_benchmark,
     run_attribute_access_benchmark,
     run_multithread_cpu_benchmark,
     run_multithread_io_benchmark,
     run_concurrent_futures_cpu_benchmark,
-    run_concurrent_futures_io_benchmark
+    run_concurrent_futures_io_benchmark,
+    run_process_pool_cpu_benchmark,
+    run_process_pool_io_benchmark,
+    run_interpreter_pool_cpu_benchmark,
+    run_interpreter_pool_io_benchmark,
+    run_interpreter_startup_benchmark,
+    run_data_passing_benchmark,
+    DATA_PASSING_BACKENDS,
+    run_pipeline_benchmark,
+    PIPELINE_QUEUE_KINDS,
+    run_allocation_benchmark,
+    ALLOCATION_KERNELS,
+    PYTHONMALLOC_VARIANTS,
+    run_text_benchmark,
+    TEXT_WORKLOADS,
+    TEXT_DRIVERS,
+    run_hashtable_benchmark,
+    HASH_OPERATIONS,
+    HASH_KEY_TYPES,
+    run_buffer_benchmark,
+    BUFFER_OPERATIONS,
+    BUFFER_ALL_OPERATIONS,
+    run_dispatch_benchmark,
+    run_pool_lifecycle_benchmark,
+    DISPATCH_METHODS,
+    run_thread_stress_benchmark,
+    THREAD_STRESS_MODES,
+    THREAD_STACK_SIZES,
+    run_mapreduce_benchmark,
+    MAPREDUCE_REDUCTIONS,
+    MAPREDUCE_CONTAINERS,
+    MAPREDUCE_BACKENDS,
+    run_startup_benchmark,
+    run_import_time_benchmark,
+    summarize_startup,
+    print_startup_summary,
+    STARTUP_FLAG_VARIANTS,
+    PYC_CACHE_VARIANTS,
+    IMPORT_TIME_MODULES,
+    run_warmup_benchmark,
+    WARMUP_KERNELS,
+    JIT_MODES
+)
+from tests.base_test import CSV_FIELDNAMES
+from tests.fibonacci_test import fibonacci
+from tests.sorting_test import bubble_sort, create_test_array
+from tests.list_comprehension_test import list_comprehension_test
+from tests.function_call_test import function_call_overhead_test
+from tests.exception_test import exception_handling_test
+from tests.object_test import object_instantiation_test, attribute_access_test
+from tests.multithread_test import (
+    multithread_cpu_test,
+    multithread_io_test,
+    concurrent_futures_cpu_test,
+    concurrent_futures_io_test,
+    process_pool_cpu_test,
+    process_pool_io_test
+)
+from tests.subinterpreter_test import (
+    interpreter_pool_cpu_test,
+    interpreter_pool_io_test,
+    interpreter_startup_test,
+    data_passing_fixture
 )
+from tests.pipeline_test import pipeline_fixture
+from tests.startup_test import python_startup_test, pyc_cache_fixture
+from tests.text_test import text_workload_test, text_fixture
+from tests.hashtable_test import prepare_hashtable
+from tests.buffer_test import prepare_buffer, readinto_fixture
+from tests.dispatch_test import pool_lifecycle_test, dispatch_fixture
+from tests.thread_stress_test import thread_stress_test
+from tests.mapreduce_test import mapreduce_fixture
 
 # Test size arrays - 5 different sizes for each test type
 FIBONACCI_SIZES = [20, 25, 30, 32, 35]
@@ -38,50 +150,735 @@ MULTITHREAD_CPU_SIZES = [2, 4, 8, 16, 32]  # Number of threads
 MULTITHREAD_IO_SIZES = [2, 4, 8, 16, 32]  # Number of threads
 MULTITHREAD_CPU_ITERATIONS = [50000, 100000, 200000, 500000, 1000000]  # Iterations per thread
 MULTITHREAD_IO_DURATIONS = [0.005, 0.01, 0.02, 0.05, 0.1]  # Duration per task in seconds
+STARTUP_LAUNCH_COUNTS = [1, 5, 10, 20, 50]  # Interpreter launches per sample
+WARMUP_CALL_COUNTS = [50, 100, 200, 500, 1000]  # Timed calls per warmup curve
+INTERPRETER_COUNTS = [1, 2, 4, 8, 16]  # Sub-interpreters created per sample
+DATA_PASSING_PAYLOAD_SIZES = [64, 4096, 65536, 1048576, 16777216]  # Bytes per round trip
+PIPELINE_SIZES = [  # [messages, stages, workers per stage, message bytes]
+    [200, 2, 2, 64], [1000, 3, 2, 256], [2000, 3, 4, 1024], [5000, 4, 4, 4096], [10000, 4, 8, 65536]
+]
+
+ALLOCATION_SIZES = {  # Operations (churn), elements (growth) or objects (fragmentation)
+    'churn': [100000, 200000, 500000, 1000000, 2000000],
+    'list_growth': [10000, 100000, 1000000, 5000000, 10000000],
+    'bytearray_growth': [10000, 100000, 1000000, 5000000, 10000000],
+    'dict_growth': [10000, 100000, 1000000, 5000000, 10000000],
+    'fragmentation': [100000, 500000, 1000000, 2000000, 5000000],
+}
+TEXT_RECORD_SIZES = [100, 1000, 10000, 50000, 100000]  # Records per document / CSV file
+TEXT_SIZES = {  # Records, patterns, log lines or string pieces
+    'json_loads': TEXT_RECORD_SIZES,
+    'json_dumps': TEXT_RECORD_SIZES,
+    're_compile': [10, 50, 100, 200, 500],
+    're_match': [1000, 10000, 100000, 500000, 1000000],
+    'str_join': [1000, 10000, 100000, 1000000, 5000000],
+    'str_concat': [1000, 10000, 100000, 1000000, 5000000],
+    'stringio': [1000, 10000, 100000, 1000000, 5000000],
+    'fstring': TEXT_RECORD_SIZES,
+    'csv_round_trip': TEXT_RECORD_SIZES,
+}
+HASH_TABLE_SIZES = [1000, 10000, 100000, 1000000, 10000000]  # Entries per table
+BUFFER_SIZES = [64, 4096, 1048576, 16777216, 67108864]  # Message bytes (64 B to 64 MB)
+DISPATCH_TASK_COUNTS = [10, 1000, 10000, 100000, 1000000]  # Tasks the fixed dispatch work is split into
+POOL_WORKER_COUNTS = [1, 4, 16, 64, 256]  # Threads per pool for creation/teardown
+THREAD_STRESS_COUNTS = [500, 1000, 2000, 5000, 10000]  # Threads alive at once
+MAPREDUCE_SIZES = [  # [keys, keys per chunk]: a small run, then a chunk-size sweep over 10M keys
+    [1000000, 100000], [10000000, 1000000], [10000000, 100000], [10000000, 10000], [10000000, 1000]
+]
 
 # Size level names for display
 SIZE_LEVELS = ["Small", "Medium", "Large", "XLarge", "XXLarge"]
 
 
+def _run_attribute_access(size: int, repeats: int) -> dict:
+    """Create `size` objects once, then benchmark attribute access on them."""
+    return run_attribute_access_benchmark(object_instantiation_test(size), repeats)
+
+
+def _run_function_call_variant(variant: str):
+    """Bind a call-convention variant into a (size, repeats) runner."""
+    return lambda size, repeats: run_function_call_variant_benchmark(variant, size, repeats)
+
+
+def _run_startup_variant(variant: str):
+    """Bind a startup variant into a (launches, repeats) runner."""
+    return lambda size, repeats: run_startup_benchmark(variant, size, repeats=repeats)
+
+
+def _run_import_time(module: str):
+    """Bind a module into a (launches, repeats) import-time runner."""
+    return lambda size, repeats: run_import_time_benchmark(module, size, repeats=repeats)
+
+
+def _run_warmup(kernel: str, jit_mode: str):
+    """Bind a warmup kernel and JIT mode into a (calls, repeats) runner."""
+    return lambda size, repeats: run_warmup_benchmark(kernel, size, jit_mode, repeats)
+
+
+def _run_data_passing(backend: str):
+    """Bind a data-passing backend into a (payload_bytes, repeats) runner."""
+    return lambda size, repeats: run_data_passing_benchmark(backend, size, repeats=repeats)
+
+
+def _run_allocation(kernel: str, allocator: str):
+    """Bind an allocation kernel and PYTHONMALLOC variant into a (size, repeats) runner."""
+    return lambda size, repeats: run_allocation_benchmark(kernel, size, allocator, repeats)
+
+
+def _run_text(workload: str, driver: str):
+    """Bind a text workload and driver into a (size, repeats) runner."""
+    return lambda size, repeats: run_text_benchmark(workload, size, driver, repeats)
+
+
+def _text_kernel(workload: str):
+    """Single-threaded text kernel: generate the corpus, return (text_workload_test, args)."""
+    prepare, func = TEXT_WORKLOADS[workload]
+    return lambda size: (text_workload_test, (func, [prepare(size, 0)]))
+
+
+def _run_hashtable(operation: str, key_type: str):
+    """Bind a hash-table operation and key type into a (entries, repeats) runner."""
+    return lambda size, repeats: run_hashtable_benchmark(operation, key_type, size, repeats)
+
+
+def _run_buffer(operation: str):
+    """Bind a buffer operation into a (message bytes, repeats) runner."""
+    return lambda size, repeats: run_buffer_benchmark(operation, size, repeats)
+
+
+def _run_dispatch(method: str):
+    """Bind a dispatch method into a (tasks, repeats) runner."""
+    return lambda size, repeats: run_dispatch_benchmark(method, size, repeats)
+
+
+def _run_thread_stress(mode: str, stack: str):
+    """Bind a thread stress mode and stack size variant into a (threads, repeats) runner."""
+    return lambda size, repeats: run_thread_stress_benchmark(size, mode, stack, repeats)
+
+
+def _run_mapreduce(reduction: str, container: str, backend: str):
+    """Bind a reduction, container and backend into a ([keys, chunk_size], repeats) runner."""
+    return lambda size, repeats: run_mapreduce_benchmark(reduction, container, backend, *size, repeats=repeats)
+
+
+def _describe_mapreduce(size) -> str:
+    """Format a map-reduce size as a CSV size_value."""
+    elements, chunk_size = size
+    return f"{elements:,} keys, {chunk_size:,}-key chunks"
+
+
+def _run_pipeline(kind: str):
+    """Bind a pipeline queue kind into a ([messages, stages, fan_out, message_size], repeats) runner."""
+    return lambda size, repeats: run_pipeline_benchmark(kind, *size, repeats=repeats)
+
+
+def _describe_pipeline(size) -> str:
+    """Format a pipeline size as a CSV size_value."""
+    messages, stages, fan_out, message_size = size
+    return f"{messages:,} msgs, {stages} stages x {fan_out} workers, {message_size:,} B"
+
+
+def _pipeline_work(size) -> float:
+    """Pipeline cost scales with messages times stages; fan-out and payload size are second order."""
+    return float(size[0] * size[1])
+
+
+def _describe_cpu_threads(size: List[int]) -> str:
+    """Format a [threads, iterations] size as a CSV size_value."""
+    thread_count, iterations = size
+    return f"{thread_count} threads, {iterations:,} iter/thread"
+
+
+def _describe_io_threads(size: List[float]) -> str:
+    """Format a [threads, duration] size as a CSV size_value."""
+    thread_count, duration = size
+    return f"{int(thread_count)} threads, {duration}s/task"
+
+
+def _describe_cpu_workers(unit: str, singular: str):
+    """Format a [workers, iterations] size as a CSV size_value for processes or interpreters."""
+    return lambda size: f"{size[0]} {unit}, {size[1]:,} iter/{singular}"
+
+
+def _describe_io_workers(unit: str):
+    """Format a [workers, duration] size as a CSV size_value for processes or interpreters."""
+    return lambda size: f"{int(size[0])} {unit}, {size[1]}s/task"
+
+
+def _io_threads_work(size: List[float]) -> float:
+    """Relative cost of a [threads, duration] I/O run: the threads sleep in parallel."""
+    thread_count, duration = size
+    return duration + thread_count * 1e-4
+
+
+# Benchmark registry. Each entry has:
+#   key        - short name used by profiles and --only (glob patterns allowed)
+#   test_type  - display name written to the CSV
+#   sizes      - default size ladder, one entry per SIZE_LEVELS level
+#   run        - callable(size, repeats) returning a run_benchmark results dict
+#   describe   - optional callable(size) giving the CSV size_value
+#   work       - optional callable(size) giving relative cost, used by --budget
+#                (default: linear in the size, or the product of list sizes)
+#   kernel     - optional callable(size) doing any setup and returning the
+#                (function, args) pair that is actually timed; used by the
+#                pytest-benchmark entry points
+#   fixture    - optional callable(size) returning a context manager, for
+#                kernels whose setup must be torn down afterwards (pools,
+#                temporary files): it yields the (function, args) pair to time
+#                and cleans up on exit. Entries with neither are timed inside
+#                child interpreters, so pytest only runs them once as a check
+BENCHMARKS: List[Dict[str, Any]] = [
+    {'key': 'fib', 'test_type': 'Fibonacci', 'sizes': FIBONACCI_SIZES,
+     'run': run_fibonacci_benchmark, 'work': lambda n: 1.618 ** n,
+     'kernel': lambda n: (fibonacci, (n,))},
+    {'key': 'sort', 'test_type': 'Bubble Sort', 'sizes': BUBBLE_SORT_SIZES,
+     'run': run_bubble_sort_benchmark, 'work': lambda n: n * n,
+     'kernel': lambda n: (bubble_sort, (create_test_array(n, reverse=True),))},
+    {'key': 'listcomp', 'test_type': 'List Comprehension', 'sizes': LIST_COMPREHENSION_SIZES,
+     'run': run_list_comprehension_benchmark, 'kernel': lambda n: (list_comprehension_test, (n,))},
+    {'key': 'call', 'test_type': 'Function Call', 'sizes': FUNCTION_CALL_SIZES,
+     'run': run_function_call_benchmark, 'kernel': lambda n: (function_call_overhead_test, (n,))},
+    *[
+        {'key': f'call_{variant}', 'test_type': f'Function Call [{variant}]', 'sizes': FUNCTION_CALL_SIZES,
+         'run': _run_function_call_variant(variant),
+         'kernel': lambda n, func=func: (func, (n,))}
+        for variant, func in FUNCTION_CALL_VARIANTS.items()
+    ],
+    {'key': 'exception', 'test_type': 'Exception Handling', 'sizes': EXCEPTION_SIZES,
+     'run': run_exception_handling_benchmark, 'kernel': lambda n: (exception_handling_test, (n,))},
+    {'key': 'object', 'test_type': 'Object Instantiation', 'sizes': OBJECT_COUNT_SIZES,
+     'run': run_object_instantiation_benchmark, 'kernel': lambda n: (object_instantiation_test, (n,))},
+    {'key': 'attr', 'test_type': 'Attribute Access', 'sizes': OBJECT_COUNT_SIZES,
+     'run': _run_attribute_access,
+     'kernel': lambda n: (attribute_access_test, (object_instantiation_test(n),))},
+    {'key': 'mt_cpu', 'test_type': 'Multi-thread CPU',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_CPU_SIZES, MULTITHREAD_CPU_ITERATIONS)],
+     'run': lambda size, repeats: run_multithread_cpu_benchmark(size[0], size[1], repeats),
+     'describe': _describe_cpu_threads, 'kernel': lambda size: (multithread_cpu_test, tuple(size))},
+    {'key': 'mt_io', 'test_type': 'Multi-thread I/O',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_IO_SIZES, MULTITHREAD_IO_DURATIONS)],
+     'run': lambda size, repeats: run_multithread_io_benchmark(int(size[0]), size[1], repeats),
+     'describe': _describe_io_threads, 'work': _io_threads_work,
+     'kernel': lambda size: (multithread_io_test, (int(size[0]), size[1]))},
+    {'key': 'cf_cpu', 'test_type': 'Concurrent Futures CPU',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_CPU_SIZES, MULTITHREAD_CPU_ITERATIONS)],
+     'run': lambda size, repeats: run_concurrent_futures_cpu_benchmark(size[0], size[1], repeats),
+     'describe': _describe_cpu_threads, 'kernel': lambda size: (concurrent_futures_cpu_test, tuple(size))},
+    {'key': 'cf_io', 'test_type': 'Concurrent Futures I/O',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_IO_SIZES, MULTITHREAD_IO_DURATIONS)],
+     'run': lambda size, repeats: run_concurrent_futures_io_benchmark(int(size[0]), size[1], repeats),
+     'describe': _describe_io_threads, 'work': _io_threads_work,
+     'kernel': lambda size: (concurrent_futures_io_test, (int(size[0]), size[1]))},
+    {'key': 'pp_cpu', 'test_type': 'Process Pool CPU',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_CPU_SIZES, MULTITHREAD_CPU_ITERATIONS)],
+     'run': lambda size, repeats: run_process_pool_cpu_benchmark(size[0], size[1], repeats),
+     'describe': _describe_cpu_workers('processes', 'process'), 'kernel': lambda size: (process_pool_cpu_test, tuple(size))},
+    {'key': 'pp_io', 'test_type': 'Process Pool I/O',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_IO_SIZES, MULTITHREAD_IO_DURATIONS)],
+     'run': lambda size, repeats: run_process_pool_io_benchmark(int(size[0]), size[1], repeats),
+     'describe': _describe_io_workers('processes'), 'work': _io_threads_work,
+     'kernel': lambda size: (process_pool_io_test, (int(size[0]), size[1]))},
+    {'key': 'ip_cpu', 'test_type': 'Interpreter Pool CPU',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_CPU_SIZES, MULTITHREAD_CPU_ITERATIONS)],
+     'run': lambda size, repeats: run_interpreter_pool_cpu_benchmark(size[0], size[1], repeats),
+     'describe': _describe_cpu_workers('interpreters', 'interpreter'),
+     'kernel': lambda size: (interpreter_pool_cpu_test, tuple(size))},
+    {'key': 'ip_io', 'test_type': 'Interpreter Pool I/O',
+     'sizes': [list(pair) for pair in zip(MULTITHREAD_IO_SIZES, MULTITHREAD_IO_DURATIONS)],
+     'run': lambda size, repeats: run_interpreter_pool_io_benchmark(int(size[0]), size[1], repeats),
+     'describe': _describe_io_workers('interpreters'), 'work': _io_threads_work,
+     'kernel': lambda size: (interpreter_pool_io_test, (int(size[0]), size[1]))},
+    {'key': 'ip_startup', 'test_type': 'Interpreter Startup', 'sizes': INTERPRETER_COUNTS,
+     'run': run_interpreter_startup_benchmark, 'kernel': lambda n: (interpreter_startup_test, (n,))},
+    *[
+        {'key': f'xfer_{backend}', 'test_type': f'Data Passing [{backend}]', 'sizes': DATA_PASSING_PAYLOAD_SIZES,
+         'run': _run_data_passing(backend), 'fixture': lambda n, backend=backend: data_passing_fixture(backend, n)}
+        for backend in DATA_PASSING_BACKENDS
+    ],
+    *[
+        {'key': f'pipe_{kind}', 'test_type': f'Pipeline [{kind}]', 'sizes': PIPELINE_SIZES,
+         'run': _run_pipeline(kind), 'describe': _describe_pipeline, 'work': _pipeline_work,
+         'fixture': lambda size, kind=kind: pipeline_fixture(kind, *size)}
+        for kind in PIPELINE_QUEUE_KINDS
+    ],
+    # Allocation kernels run in a fresh child so the heap starts clean and PYTHONMALLOC applies;
+    # pytest times the default allocator in-process
+    *[
+        {'key': f'alloc_{kernel}_{allocator}', 'test_type': f'Allocation [{kernel}, {allocator}]',
+         'sizes': ALLOCATION_SIZES[kernel], 'run': _run_allocation(kernel, allocator),
+         **({'kernel': lambda n, func=func: (func, (n,))} if allocator == 'default' else {})}
+        for kernel, func in ALLOCATION_KERNELS.items()
+        for allocator in PYTHONMALLOC_VARIANTS
+    ],
+    *[
+        {'key': f'text_{workload}_{driver}', 'test_type': f'Text [{workload}, {driver}]',
+         'sizes': TEXT_SIZES[workload], 'run': _run_text(workload, driver),
+         **({'kernel': _text_kernel(workload)} if driver == 'single' else
+            {'fixture': lambda n, workload=workload: text_fixture(workload, n, 'threads')})}
+        for workload in TEXT_WORKLOADS
+        for driver in TEXT_DRIVERS
+    ],
+    *[
+        {'key': f'hash_{operation}_{key_type}', 'test_type': f'Hash Table [{operation}, {key_type}]',
+         'sizes': HASH_TABLE_SIZES, 'run': _run_hashtable(operation, key_type),
+         'kernel': lambda n, operation=operation, key_type=key_type: prepare_hashtable(operation, key_type, n)[:2]}
+        for operation in HASH_OPERATIONS
+        for key_type in HASH_KEY_TYPES
+    ],
+    # readinto reads from a temporary file created and removed around the samples
+    *[
+        {'key': f'buffer_{operation}', 'test_type': f'Buffer [{operation}]', 'sizes': BUFFER_SIZES,
+         'run': _run_buffer(operation),
+         **({'kernel': lambda n, operation=operation: prepare_buffer(operation, n)}
+            if operation in BUFFER_OPERATIONS else {'fixture': readinto_fixture})}
+        for operation in BUFFER_ALL_OPERATIONS
+    ],
+    *[
+        {'key': f'dispatch_{method}', 'test_type': f'Thread Pool Dispatch [{method}]',
+         'sizes': DISPATCH_TASK_COUNTS, 'run': _run_dispatch(method),
+         'fixture': lambda n, method=method: dispatch_fixture(method, n)}
+        for method in DISPATCH_METHODS
+    ],
+    {'key': 'pool_lifecycle', 'test_type': 'Thread Pool Lifecycle', 'sizes': POOL_WORKER_COUNTS,
+     'run': run_pool_lifecycle_benchmark, 'kernel': lambda n: (pool_lifecycle_test, (n,))},
+    *[
+        {'key': f'stress_{mode}_{stack}', 'test_type': f'Thread Stress [{mode}, {stack} stack]',
+         'sizes': THREAD_STRESS_COUNTS, 'run': _run_thread_stress(mode, stack),
+         'kernel': lambda n, mode=mode, stack_size=stack_size: (thread_stress_test, (n, mode, stack_size))}
+        for mode in THREAD_STRESS_MODES
+        for stack, stack_size in THREAD_STACK_SIZES.items()
+    ],
+    *[
+        {'key': f'mapreduce_{reduction}_{container}_{backend}',
+         'test_type': f'Map-Reduce [{reduction}, {container}, {backend}]', 'sizes': MAPREDUCE_SIZES,
+         'run': _run_mapreduce(reduction, container, backend), 'describe': _describe_mapreduce,
+         'work': lambda size: float(size[0]),
+         'fixture': lambda size, reduction=reduction, container=container, backend=backend:
+             mapreduce_fixture(reduction, container, backend, *size)}
+        for reduction in MAPREDUCE_REDUCTIONS
+        for container in MAPREDUCE_CONTAINERS
+        for backend in MAPREDUCE_BACKENDS
+    ],
+    *[
+        {'key': f'startup_{variant}', 'test_type': f'Startup [{variant}]', 'sizes': STARTUP_LAUNCH_COUNTS,
+         'run': _run_startup_variant(variant),
+         'kernel': lambda n, flags=flags: (python_startup_test, (sys.executable, flags, n))}
+        for variant, flags in STARTUP_FLAG_VARIANTS.items()
+    ],
+    # The .pyc cache variants manage a temporary cache directory
+    *[
+        {'key': f'startup_{variant}', 'test_type': f'Startup [{variant}]', 'sizes': STARTUP_LAUNCH_COUNTS,
+         'run': _run_startup_variant(variant),
+         'fixture': lambda n, variant=variant: pyc_cache_fixture(variant, n)}
+        for variant in PYC_CACHE_VARIANTS
+    ],
+    # Import times are reported by the child interpreters themselves
+    *[
+        {'key': f'import_{module}', 'test_type': f'Import Time [{module}]', 'sizes': STARTUP_LAUNCH_COUNTS,
+         'run': _run_import_time(module)}
+        for module in IMPORT_TIME_MODULES
+    ],
+    # Warmup curves are captured in fresh child interpreters
+    *[
+        {'key': f'warmup_{kernel}_{jit_mode}', 'test_type': f'Warmup [{kernel}, {jit_mode}]',
+         'sizes': WARMUP_CALL_COUNTS, 'run': _run_warmup(kernel, jit_mode)}
+        for kernel in WARMUP_KERNELS
+        for jit_mode in JIT_MODES
+    ],
+]
+
+BENCHMARKS_BY_KEY = {spec['key']: spec for spec in BENCHMARKS}
+
+RESULTS_DIR = Path("results")
+
+# Row statuses that --resume treats as already done; 'error' rows are retried
+COMPLETED_STATUSES = {'ok', 'timeout'}
+
+
+def interpreter_label() -> str:
+    """
+    Label for the running interpreter, distinguishing builds of the same version.
+
+    Returns:
+        Version with a 't' suffix on free-threaded builds (e.g. "3.14.0t"),
+        prefixed with the implementation name when it is not CPython
+    """
+    label = sys.version.split()[0] + ('t' if sysconfig.get_config_var('Py_GIL_DISABLED') else '')
+    implementation = platform.python_implementation()
+    return label if implementation == 'CPython' else f"{implementation} {label}"
+
+
 def save_results_to_csv(results: list, filename: str) -> None:
     """
     Save benchmark results to CSV file.
-    
+
     Args:
         results: List of result dictionaries
         filename: Output CSV filename
     """
     if not results:
         return
-    
+
     # Create results directory if it doesn't exist
-    results_dir = Path("results")
+    results_dir = RESULTS_DIR
     results_dir.mkdir(exist_ok=True)
-    
+
     csv_path = results_dir / filename
-    
+
     with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = [
-            'test_name', 'test_type', 'size_level', 'size_value', 'python_version',
-            'platform', 'architecture', 'repeats', 'mean_time', 'min_time', 'max_time',
-            'std_dev', 'median_time', 'timestamp'
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES, restval='')
+
         writer.writeheader()
         for result in results:
             writer.writerow(result)
-    
+
     print(f"Results saved to: {csv_path}")
 
 
-def run_benchmarks(repeats: int = 5) -> None:
+class ResultStream:
+    """
+    Append-only CSV writer that makes every row durable as soon as it is written.
+
+    Rows are flushed and fsync'd one at a time so a run that is killed or runs
+    out of memory keeps everything it finished before that point.
+    """
+
+    def __init__(self, csv_path: Path):
+        """
+        Initialize the stream.
+
+        Args:
+            csv_path: CSV file to append to (created with a header if missing)
+        """
+        self.csv_path = Path(csv_path)
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> "ResultStream":
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        needs_header = not self.csv_path.exists() or self.csv_path.stat().st_size == 0
+        fieldnames = CSV_FIELDNAMES
+        if not needs_header:
+            # Resumed files keep their own columns, even if written by an older version
+            with open(self.csv_path, newline='', encoding='utf-8') as existing:
+                fieldnames = next(csv.reader(existing), None) or CSV_FIELDNAMES
+        self._file = open(self.csv_path, 'a', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, restval='', extrasaction='ignore')
+        if needs_header:
+            self._writer.writeheader()
+            self._sync()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """
+        Append one result row and force it to disk.
+
+        Args:
+            row: Result dictionary keyed by CSV_FIELDNAMES
+        """
+        self._writer.writerow(row)
+        self._sync()
+        self.rows_written += 1
+
+    def _sync(self) -> None:
+        """Flush Python and OS buffers for the underlying file."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def _run_key(interpreter: str, test_type: str, size_level: str, size_value: Any) -> Tuple[str, str, str, str]:
+    """Identity of one (benchmark, size) run, as stored in the CSV."""
+    return (interpreter, test_type, size_level, str(size_value))
+
+
+def _row_interpreter(row: Dict[str, str]) -> str:
+    """Interpreter label of a CSV row; files from before the interpreter column only have the version."""
+    return row.get('interpreter') or row['python_version']
+
+
+def results_filename_prefix(interpreter: str) -> str:
+    """
+    Filename prefix of the results CSVs written under an interpreter.
+
+    Args:
+        interpreter: Label from interpreter_label (e.g. "3.14.0t")
+
+    Returns:
+        Prefix such as "benchmark_results_3_14_0t", distinct for every label
+    """
+    return f"benchmark_results_{re.sub(r'[^0-9A-Za-z]+', '_', interpreter)}"
+
+
+def load_completed_runs(csv_path: Path) -> Set[Tuple[str, str, str, str]]:
+    """
+    Read the (benchmark, size) runs already recorded in a results CSV.
+
+    Args:
+        csv_path: Results CSV written by ResultStream
+
+    Returns:
+        Set of run keys whose status counts as completed
+    """
+    completed = set()
+    if not Path(csv_path).exists():
+        return completed
+
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            # Files from before the status column only contain finished runs
+            if (row.get('status') or 'ok') in COMPLETED_STATUSES:
+                completed.add(_run_key(_row_interpreter(row), row['test_type'],
+                                       row['size_level'], row['size_value']))
+    return completed
+
+
+def find_latest_results(interpreter: str) -> Optional[Path]:
+    """
+    Find the most recent results CSV for an interpreter.
+
+    Args:
+        interpreter: Label from interpreter_label (e.g. "3.13.5" or "3.14.0t")
+
+    Returns:
+        Path to the newest matching CSV, or None if there is none
+    """
+    candidates = sorted(RESULTS_DIR.glob(f"{results_filename_prefix(interpreter)}_*.csv"))
+    return candidates[-1] if candidates else None
+
+
+def _summarize_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the parts of a results dict that a CSV row needs."""
+    return {
+        'name': results['name'],
+        'statistics': results['statistics'],
+        'metrics': results.get('metrics'),
+        'unreliable_samples': results.get('unreliable_samples'),
+        'execution_times': results.get('execution_times')
+    }
+
+
+def _run_in_child(key: str, size: Any, repeats: int, queue: Any) -> None:
+    """
+    Watchdog child entry point: run one registry benchmark and report back.
+
+    Only the summary is sent back, so large return values (object lists,
+    comprehension results) never cross the process boundary.
+    """
+    try:
+        results = BENCHMARKS_BY_KEY[key]['run'](size, repeats)
+        queue.put(('ok', _summarize_results(results)))
+    except BenchmarkUnavailable as e:
+        queue.put(('skipped', str(e)))
+    except BaseException as e:
+        queue.put(('error', f"{type(e).__name__}: {e}"))
+
+
+def run_with_timeout(spec: Dict[str, Any], size: Any, repeats: int,
+                     timeout: Optional[float]) -> Tuple[str, Optional[Dict[str, Any]], str]:
+    """
+    Run one benchmark size, in a watchdog child process when a timeout is set.
+
+    Args:
+        spec: Registry entry to run
+        size: Size value for this run
+        repeats: Number of repeats
+        timeout: Wall-clock limit in seconds, or None to run in-process
+
+    Returns:
+        Tuple of (status, summary or None, notes); status is 'ok', 'timeout',
+        'skipped' (BenchmarkUnavailable) or 'error'
+    """
+    if not timeout:
+        try:
+            return 'ok', _summarize_results(spec['run'](size, repeats)), ''
+        except BenchmarkUnavailable as e:
+            return 'skipped', None, str(e)
+        except Exception as e:
+            return 'error', None, f"{type(e).__name__}: {e}"
+
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    # Not a daemon: some benchmarks start worker processes of their own
+    child = context.Process(target=_run_in_child, args=(spec['key'], size, repeats, queue))
+    child.start()
+    try:
+        child.join(timeout)
+    except BaseException:
+        child.terminate()
+        raise
+    if child.is_alive():
+        child.terminate()
+        child.join()
+        queue.close()
+        return 'timeout', None, f"exceeded {timeout:g}s"
+
+    try:
+        status, payload = queue.get(timeout=1.0)
+    except Empty:
+        return 'error', None, f"child exited with code {child.exitcode}"
+    finally:
+        queue.close()
+
+    if status == 'ok':
+        return 'ok', payload, ''
+    return status, None, payload
+
+
+def calibrate_run(spec: Dict[str, Any], size: Any) -> float:
+    """
+    Wall time of one repeat of a run, for --budget calibration.
+
+    The run goes through run_with_timeout with the entry's timeout, so a
+    hanging benchmark cannot stall calibration.
+
+    Raises:
+        BenchmarkUnavailable: If the benchmark cannot run on this interpreter
+        RuntimeError: If the run timed out or failed
+    """
+    start_time = time.perf_counter_ns()
+    status, _, notes = run_with_timeout(spec, size, 1, spec.get('timeout'))
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
+    if status == 'skipped':
+        raise BenchmarkUnavailable(notes)
+    if status != 'ok':
+        raise RuntimeError(f"{status}: {notes}")
+    return elapsed
+
+
+def build_plan(
+    profile: Dict[str, Any],
+    only: Optional[List[str]] = None,
+    levels: Optional[List[str]] = None,
+    timeout: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Resolve a profile plus CLI filters into the list of benchmarks to run.
+
+    CLI filters take precedence over the profile's own benchmark and level
+    selections. Size ladders from the profile's [sizes] table (exact keys
+    or glob patterns) replace the registry defaults level by level.
+
+    Args:
+        profile: Profile dictionary from load_profile
+        only: Benchmark patterns from --only, or None to use the profile's
+        levels: Size level names from --levels, or None to use the profile's
+        timeout: Per-run timeout from --timeout, or None to use the profile's
+
+    Returns:
+        List of plan entries, each a registry spec plus a 'runs' list of
+        (size_level, size, repeats) tuples (repeats None means the run-wide
+        default), a 'skipped' list and a 'timeout' in seconds (or None)
+
+    Raises:
+        ValueError: If a filter matches nothing or a size override is malformed
+    """
+    specs = match_benchmarks(BENCHMARKS, only if only is not None else profile.get('benchmarks'))
+    wanted_levels = match_levels(SIZE_LEVELS, levels if levels is not None else profile.get('levels'))
+    size_overrides = profile.get('sizes', {})
+    timeouts = profile.get('timeouts', {})
+
+    known_keys = [spec['key'] for spec in BENCHMARKS]
+    for table, overrides in (('sizes', size_overrides), ('timeouts', timeouts)):
+        unknown = unmatched_overrides(known_keys, overrides)
+        if unknown:
+            raise ValueError(f"[{table}] entries for unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    plan = []
+    for spec in specs:
+        sizes = match_override(spec['key'], size_overrides)
+        if sizes is None:
+            sizes = spec['sizes']
+        if len(sizes) > len(SIZE_LEVELS):
+            raise ValueError(f"Too many sizes for {spec['key']!r}: at most {len(SIZE_LEVELS)} allowed")
+        runs = [
+            (level, size, None) for level, size in zip(SIZE_LEVELS, sizes)
+            if level in wanted_levels
+        ]
+        if timeout is not None:
+            spec_timeout = timeout
+        else:
+            spec_timeout = match_override(spec['key'], timeouts)
+            if spec_timeout is None:
+                spec_timeout = profile.get('timeout')
+        if runs:
+            plan.append({**spec, 'runs': runs, 'skipped': [], 'timeout': spec_timeout or None})
+
+    return plan
+
+
+def _build_row(
+    spec: Dict[str, Any],
+    size_level: str,
+    size_value: Any,
+    repeats: int,
+    timestamp: str,
+    summary: Optional[Dict[str, Any]] = None,
+    status: str = 'ok',
+    notes: str = ''
+) -> Dict[str, Any]:
+    """Build one CSV row; timing columns stay empty for runs without a summary."""
+    stats = summary['statistics'] if summary else {}
+    return {
+        'test_name': summary['name'] if summary else f"{spec['test_type']} ({size_value})",
+        'test_type': spec['test_type'],
+        'size_level': size_level,
+        'size_value': size_value,
+        'python_version': sys.version.split()[0],
+        'platform': platform.platform(),
+        'architecture': platform.architecture()[0],
+        'repeats': repeats,
+        'mean_time': stats.get('mean', ''),
+        'min_time': stats.get('min', ''),
+        'max_time': stats.get('max', ''),
+        'std_dev': stats.get('std_dev', ''),
+        'median_time': stats.get('median', ''),
+        'timestamp': timestamp,
+        'status': status,
+        'notes': notes,
+        'metrics': json.dumps(summary['metrics']) if summary and summary.get('metrics') else '',
+        'unreliable_samples': summary['unreliable_samples'] if summary and summary.get('unreliable_samples') is not None else '',
+        'samples': json.dumps(summary['execution_times']) if summary and summary.get('execution_times') else '',
+        'interpreter': interpreter_label()
+    }
+
+
+def run_benchmarks(
+    repeats: int = 5,
+    plan: Optional[List[Dict[str, Any]]] = None,
+    output: Optional[Path] = None,
+    resume: bool = False,
+    deadline: Optional[float] = None
+) -> None:
     """
     Run all benchmarks with 5 different data sizes and save results to CSV.
-    
+
+    Each row is streamed to the CSV as soon as its benchmark finishes, so an
+    interrupted run keeps its completed rows and can be resumed.
+
     Args:
         repeats: Number of times to repeat each test (default: 5)
+        plan: Benchmarks and sizes to run, from build_plan (default: everything)
+        output: CSV path to write (default: a new timestamped file in results/)
+        resume: Skip (benchmark, size) runs already completed in the output file
+        deadline: time.monotonic() value after which remaining runs are skipped
     """
+    if plan is None:
+        plan = build_plan({})
+
+    interpreter = interpreter_label()
+    if output is None and resume:
+        output = find_latest_results(interpreter)
+    if output is None:
+        filename = f"{results_filename_prefix(interpreter)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        output = RESULTS_DIR / filename
+    completed = load_completed_runs(output) if resume else set()
+
     print("=" * 60)
     print("Python Performance Test - Running Benchmarks")
     print("=" * 60)
@@ -89,271 +886,222 @@ def run_benchmarks(repeats: int = 5) -> None:
     print(f"Platform: {platform.platform()}")
     print(f"Architecture: {platform.architecture()}")
     print(f"Repeats per test: {repeats}")
+    timer = calibrate_timer()
+    print(f"Timer: resolution {timer['resolution_ns']} ns, overhead {timer['overhead_ns']} ns subtracted, "
+          f"samples under {timer['min_trusted_ns'] / 1e6:.3f} ms flagged")
+    print(f"Results file: {output}")
+    if resume:
+        print(f"Resuming: {len(completed)} completed runs will be skipped")
     print("=" * 60)
-    
-    # Collect all results
-    all_results = []
+
     timestamp = datetime.now().isoformat()
-    
-    # Test 1: Fibonacci - test all 5 sizes
-    print("\nRunning Fibonacci tests...")
-    for i, size in enumerate(FIBONACCI_SIZES):
-        fibonacci_results = run_fibonacci_benchmark(size, repeats)
-        stats = fibonacci_results['statistics']
-        all_results.append({
-            'test_name': fibonacci_results['name'],
-            'test_type': 'Fibonacci',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': size,
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 2: Bubble Sort - test all 5 sizes
-    print("Running Bubble Sort tests...")
-    for i, size in enumerate(BUBBLE_SORT_SIZES):
-        bubble_sort_results = run_bubble_sort_benchmark(size, repeats)
-        stats = bubble_sort_results['statistics']
-        all_results.append({
-            'test_name': bubble_sort_results['name'],
-            'test_type': 'Bubble Sort',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': size,
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 3: List Comprehension - test all 5 sizes
-    print("Running List Comprehension tests...")
-    for i, size in enumerate(LIST_COMPREHENSION_SIZES):
-        list_comp_results = run_list_comprehension_benchmark(size, repeats)
-        stats = list_comp_results['statistics']
-        all_results.append({
-            'test_name': list_comp_results['name'],
-            'test_type': 'List Comprehension',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': size,
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 4: Function Call Overhead - test all 5 sizes
-    print("Running Function Call tests...")
-    for i, size in enumerate(FUNCTION_CALL_SIZES):
-        function_call_results = run_function_call_benchmark(size, repeats)
-        stats = function_call_results['statistics']
-        all_results.append({
-            'test_name': function_call_results['name'],
-            'test_type': 'Function Call',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': size,
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 5: Exception Handling - test all 5 sizes
-    print("Running Exception Handling tests...")
-    for i, size in enumerate(EXCEPTION_SIZES):
-        exception_results = run_exception_handling_benchmark(size, repeats)
-        stats = exception_results['statistics']
-        all_results.append({
-            'test_name': exception_results['name'],
-            'test_type': 'Exception Handling',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': size,
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 6: Object Instantiation - test all 5 sizes
-    print("Running Object Instantiation tests...")
-    for i, size in enumerate(OBJECT_COUNT_SIZES):
-        object_inst_results = run_object_instantiation_benchmark(size, repeats)
-        stats = object_inst_results['statistics']
-        all_results.append({
-            'test_name': object_inst_results['name'],
-            'test_type': 'Object Instantiation',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': size,
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 7: Attribute Access - test all 5 sizes
-    print("Running Attribute Access tests...")
-    for i, size in enumerate(OBJECT_COUNT_SIZES):
-        # Create objects for this size
-        object_inst_results = run_object_instantiation_benchmark(size, repeats)
-        # Test attribute access on these objects
-        attr_access_results = run_attribute_access_benchmark(object_inst_results['result'], repeats)
-        stats = attr_access_results['statistics']
-        all_results.append({
-            'test_name': attr_access_results['name'],
-            'test_type': 'Attribute Access',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': size,
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 8: Multi-thread CPU - test all 5 thread counts
-    print("Running Multi-thread CPU tests...")
-    for i, thread_count in enumerate(MULTITHREAD_CPU_SIZES):
-        iterations = MULTITHREAD_CPU_ITERATIONS[i]
-        multithread_cpu_results = run_multithread_cpu_benchmark(thread_count, iterations, repeats)
-        stats = multithread_cpu_results['statistics']
-        all_results.append({
-            'test_name': multithread_cpu_results['name'],
-            'test_type': 'Multi-thread CPU',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': f"{thread_count} threads, {iterations:,} iter/thread",
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 9: Multi-thread I/O - test all 5 thread counts
-    print("Running Multi-thread I/O tests...")
-    for i, thread_count in enumerate(MULTITHREAD_IO_SIZES):
-        duration = MULTITHREAD_IO_DURATIONS[i]
-        multithread_io_results = run_multithread_io_benchmark(thread_count, duration, repeats)
-        stats = multithread_io_results['statistics']
-        all_results.append({
-            'test_name': multithread_io_results['name'],
-            'test_type': 'Multi-thread I/O',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': f"{thread_count} threads, {duration}s/task",
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 10: Concurrent Futures CPU - test all 5 thread counts
-    print("Running Concurrent Futures CPU tests...")
-    for i, thread_count in enumerate(MULTITHREAD_CPU_SIZES):
-        iterations = MULTITHREAD_CPU_ITERATIONS[i]
-        concurrent_cpu_results = run_concurrent_futures_cpu_benchmark(thread_count, iterations, repeats)
-        stats = concurrent_cpu_results['statistics']
-        all_results.append({
-            'test_name': concurrent_cpu_results['name'],
-            'test_type': 'Concurrent Futures CPU',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': f"{thread_count} threads, {iterations:,} iter/thread",
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Test 11: Concurrent Futures I/O - test all 5 thread counts
-    print("Running Concurrent Futures I/O tests...")
-    for i, thread_count in enumerate(MULTITHREAD_IO_SIZES):
-        duration = MULTITHREAD_IO_DURATIONS[i]
-        concurrent_io_results = run_concurrent_futures_io_benchmark(thread_count, duration, repeats)
-        stats = concurrent_io_results['statistics']
-        all_results.append({
-            'test_name': concurrent_io_results['name'],
-            'test_type': 'Concurrent Futures I/O',
-            'size_level': SIZE_LEVELS[i],
-            'size_value': f"{thread_count} threads, {duration}s/task",
-            'python_version': sys.version.split()[0],
-            'platform': platform.platform(),
-            'architecture': platform.architecture()[0],
-            'repeats': repeats,
-            'mean_time': stats['mean'],
-            'min_time': stats['min'],
-            'max_time': stats['max'],
-            'std_dev': stats['std_dev'],
-            'median_time': stats['median'],
-            'timestamp': timestamp
-        })
-    
-    # Save results to CSV
-    python_version = sys.version.split()[0].replace('.', '_')
-    filename = f"benchmark_results_{python_version}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    save_results_to_csv(all_results, filename)
-    
+    resumed = 0
+
+    with ResultStream(output) as stream:
+        for spec in plan:
+            print(f"Running {spec['test_type']} tests...")
+            describe = spec.get('describe')
+            for size_level, size, run_repeats in spec['runs']:
+                size_value = describe(size) if describe else size
+                run_repeats = run_repeats or repeats
+                if _run_key(interpreter, spec['test_type'], size_level, size_value) in completed:
+                    resumed += 1
+                    continue
+
+                remaining = remaining_time(deadline)
+                if remaining == 0:
+                    stream.write(_build_row(spec, size_level, size_value, run_repeats, timestamp,
+                                            status='skipped', notes="budget exhausted before run started"))
+                    continue
+                timeout = spec.get('timeout')
+                if timeout and remaining is not None:
+                    timeout = min(timeout, remaining)
+
+                status, summary, notes = run_with_timeout(spec, size, run_repeats, timeout)
+                if status != 'ok':
+                    print(f"   {spec['test_type']} [{size_level}]: {status} ({notes})")
+                elif summary.get('unreliable_samples'):
+                    print(f"   {spec['test_type']} [{size_level}]: {summary['unreliable_samples']} of {run_repeats} "
+                          f"samples too close to the timer resolution")
+                stream.write(_build_row(spec, size_level, size_value, run_repeats, timestamp,
+                                        summary, status, notes))
+
+            for size_level, size, reason in spec.get('skipped', []):
+                size_value = describe(size) if describe else size
+                stream.write(_build_row(spec, size_level, size_value, 0, timestamp,
+                                        status='skipped', notes=reason))
+
+    print(f"Results saved to: {output}")
+
     print("\n" + "=" * 60)
     print("Benchmark completed!")
-    print(f"Total tests run: {len(all_results)}")
+    print(f"Total tests run: {stream.rows_written}")
+    if resumed:
+        print(f"Skipped (already completed): {resumed}")
     print("=" * 60)
 
 
+def run_under_interpreters(interpreters: List[str], argv: List[str]) -> int:
+    """
+    Re-run this script under each interpreter with the same arguments.
+
+    Args:
+        interpreters: Interpreter executables to run
+        argv: Command-line arguments to forward
+
+    Returns:
+        Number of interpreters whose run failed
+    """
+    failures = 0
+    for interpreter in interpreters:
+        print(f"\n>>> Running benchmarks under {interpreter}")
+        command = [interpreter, str(Path(__file__).resolve()), *argv, '--interpreters=']
+        try:
+            completed = subprocess.run(command, check=False)
+        except OSError as e:
+            print(f"Could not start {interpreter}: {e}")
+            failures += 1
+            continue
+        if completed.returncode != 0:
+            print(f"Benchmarks under {interpreter} exited with code {completed.returncode}")
+            failures += 1
+    return failures
+
+
+def report(csv_paths: List[Path], output: Optional[Path] = None, baseline: Optional[str] = None) -> int:
+    """
+    Build the HTML comparison report.
+
+    Args:
+        csv_paths: Results CSVs to compare (default: every results CSV in RESULTS_DIR)
+        output: HTML file to write (default: timestamped file in RESULTS_DIR)
+        baseline: Interpreter label to compare against
+
+    Returns:
+        Process exit code
+    """
+    if not csv_paths:
+        csv_paths = sorted(RESULTS_DIR.glob("benchmark_results_*.csv"), key=lambda path: path.stat().st_mtime)
+    if not csv_paths:
+        print(f"error: no results CSVs found in {RESULTS_DIR}/", file=sys.stderr)
+        return 2
+    if output is None:
+        output = RESULTS_DIR / f"benchmark_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+
+    try:
+        written = build_report(csv_paths, output, SIZE_LEVELS, baseline)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(f"Report written to: {written}")
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Run the Python performance benchmark suite.")
+    parser.add_argument('--profile', default=DEFAULT_PROFILE,
+                        help=f"Built-in profile (smoke, ci, full) or path to a TOML profile (default: {DEFAULT_PROFILE})")
+    parser.add_argument('--only', help="Comma-separated benchmark keys or glob patterns, e.g. fib,object,call_*")
+    parser.add_argument('--levels', help="Comma-separated size levels, e.g. Small,Medium")
+    parser.add_argument('--repeats', type=int, help="Repeats per test (overrides the profile)")
+    parser.add_argument('--interpreters',
+                        help="Comma-separated interpreters to run under (overrides the profile; empty for current only)")
+    parser.add_argument('--timeout', type=float,
+                        help="Per-run wall-clock limit in seconds; runs each size in a watchdog child process")
+    parser.add_argument('--output', type=Path, help="Results CSV to write (default: new timestamped file in results/)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip runs already completed in --output (default: latest results file for this interpreter)")
+    parser.add_argument('--budget',
+                        help="Fit the run into this wall-clock budget (e.g. 90s, 10m, 1h) by choosing sizes and repeats")
+    parser.add_argument('--startup-summary', action='store_true',
+                        help="Compare startup and import times across the selected interpreters, then exit")
+    parser.add_argument('--list', action='store_true', help="List the selected benchmarks and sizes, then exit")
+    parser.add_argument('--report', nargs='*', type=Path, metavar='CSV',
+                        help="Build an HTML comparison report from results CSVs (default: all in results/), then exit")
+    parser.add_argument('--report-output', type=Path,
+                        help="HTML file for --report (default: new timestamped file in results/)")
+    parser.add_argument('--baseline', help="Interpreter label --report compares against (default: lowest version)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parse_args(argv)
+
+    if args.report is not None:
+        return report(args.report, args.report_output, args.baseline)
+
+    try:
+        profile = load_profile(args.profile)
+        plan = build_plan(profile, split_csv_arg(args.only), split_csv_arg(args.levels), args.timeout)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    repeats = args.repeats if args.repeats is not None else profile.get('repeats', 5)
+    if repeats < 1:
+        print("error: --repeats must be at least 1", file=sys.stderr)
+        return 2
+
+    interpreters = split_csv_arg(args.interpreters)
+    if interpreters is None:
+        interpreters = profile.get('interpreters', [])
+    if args.startup_summary:
+        print_startup_summary(summarize_startup(interpreters or [sys.executable], repeats=repeats))
+        return 0
+    if interpreters and not args.list:
+        return 1 if run_under_interpreters(interpreters, argv) else 0
+
+    deadline = None
+    budget_value = args.budget if args.budget is not None else profile.get('budget')
+    if budget_value is not None:
+        try:
+            budget = parse_duration(str(budget_value))
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+        deadline = time.monotonic() + budget
+        # --list only shows the schedule, so it runs nothing and leaves benchmarks without history uncalibrated
+        estimates = estimate_costs(plan, load_history(RESULTS_DIR, interpreter_label()),
+                                   calibrate=None if args.list else calibrate_run,
+                                   calibration_budget=budget * BUDGET_CALIBRATION_FRACTION)
+        plan = schedule_plan(plan, remaining_time(deadline), estimates, SIZE_LEVELS,
+                             max_repeats=args.repeats or BUDGET_MAX_REPEATS)
+        print_schedule(plan, estimates, budget)
+
+    if args.list:
+        print(f"Profile: {profile['name']} (repeats={repeats})")
+        for spec in plan:
+            describe = spec.get('describe')
+            sizes = ", ".join(
+                f"{level}={describe(size) if describe else size}" + (f" x{run_repeats}" if run_repeats else "")
+                for level, size, run_repeats in spec['runs']
+            )
+            print(f"  {spec['key']:<24} {spec['test_type']:<32} {sizes}")
+        return 0
+
+    run_benchmarks(repeats, plan, args.output, args.resume, deadline)
+    return 0
+
+
 if __name__ == "__main__":
-    run_benchmarks()
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Benchmark profile loading and benchmark/size selection.
+
+A profile is a TOML file that decides which benchmarks run, at which sizes,
+how many repeats each gets and under which interpreters. Built-in profiles
+live in the ``profiles/`` directory next to this module ("smoke", "ci" and
+"full"); any other TOML file can be passed by path.
+
+Profile keys (all optional):
+
+    repeats = 3                      # Repeats per (benchmark, size)
+    benchmarks = ["fib", "mt_*"]     # Glob patterns over benchmark keys
+    levels = ["Small", "Medium"]     # Size levels to keep
+    interpreters = ["venv-3.13/Scripts/python.exe"]  # Re-run under each
+    timeout = 600                    # Per-run wall-clock limit in seconds
+    budget = "10m"                   # Fit the run into this much time
+
+    [sizes]                          # Per-benchmark size ladder overrides
+    fib = [15, 20]
+    mt_cpu = [[2, 10000], [4, 20000]]
+    "hash_*" = [100]                 # Glob patterns cover a whole family
+
+    [timeouts]                       # Per-benchmark timeout overrides
+    fib = 120
+
+In [sizes] and [timeouts] an exact benchmark key takes precedence over
+patterns; otherwise the first matching pattern in the table applies.
+"""
+
+import re
+import tomllib
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+PROFILES_DIR = Path(__file__).parent / "profiles"
+BUILTIN_PROFILES = ["smoke", "ci", "full"]
+DEFAULT_PROFILE = "full"
+
+_DURATION_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600}
+
+_PROFILE_KEYS = {"repeats", "benchmarks", "levels", "interpreters", "sizes", "timeout", "timeouts", "budget"}
+
+
+def load_profile(name_or_path: str) -> Dict[str, Any]:
+    """
+    Load a benchmark profile by built-in name or TOML file path.
+
+    Args:
+        name_or_path: Built-in profile name (e.g. "smoke") or path to a TOML file
+
+    Returns:
+        Dictionary of profile settings
+
+    Raises:
+        FileNotFoundError: If no built-in profile or file matches
+        ValueError: If the profile contains unknown or malformed keys
+    """
+    if name_or_path in BUILTIN_PROFILES:
+        path = PROFILES_DIR / f"{name_or_path}.toml"
+    else:
+        path = Path(name_or_path)
+    if not path.is_file():
+        raise FileNotFoundError(
+            f"Profile {name_or_path!r} not found (built-in profiles: {', '.join(BUILTIN_PROFILES)})"
+        )
+
+    with open(path, 'rb') as profile_file:
+        profile = tomllib.load(profile_file)
+
+    unknown = set(profile) - _PROFILE_KEYS
+    if unknown:
+        raise ValueError(f"Unknown keys in profile {path}: {', '.join(sorted(unknown))}")
+    if 'repeats' in profile and (not isinstance(profile['repeats'], int) or profile['repeats'] < 1):
+        raise ValueError(f"'repeats' in profile {path} must be a positive integer")
+    if 'timeout' in profile and (not isinstance(profile['timeout'], (int, float)) or profile['timeout'] < 0):
+        raise ValueError(f"'timeout' in profile {path} must be a non-negative number of seconds")
+    if 'budget' in profile:
+        parse_duration(str(profile['budget']))
+    for key in ('benchmarks', 'levels', 'interpreters'):
+        if key in profile and not isinstance(profile[key], list):
+            raise ValueError(f"'{key}' in profile {path} must be a list")
+
+    profile['name'] = path.stem
+    return profile
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse a duration such as "90s", "10m", "1.5h" or a bare number of seconds.
+
+    Args:
+        value: Duration string
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the string is not a positive duration
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*', value.lower())
+    if not match or float(match.group(1)) <= 0:
+        raise ValueError(f"Invalid duration {value!r} (expected e.g. 90s, 10m, 1h)")
+    return float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+
+
+def split_csv_arg(value: Optional[str]) -> Optional[List[str]]:
+    """
+    Split a comma-separated CLI argument into a list of stripped items.
+
+    Args:
+        value: Raw argument value, or None if the option was not given
+
+    Returns:
+        List of non-empty items, or None if value is None
+    """
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def match_benchmarks(specs: Sequence[Dict[str, Any]], patterns: Optional[Sequence[str]]) -> List[Dict[str, Any]]:
+    """
+    Select benchmark specs whose key or test type matches any pattern.
+
+    Patterns are shell-style globs compared case-insensitively against the
+    spec key (e.g. "fib", "call_*") and its display test type.
+
+    Args:
+        specs: Benchmark registry entries
+        patterns: Glob patterns, or None/empty to select everything
+
+    Returns:
+        Matching specs in registry order
+
+    Raises:
+        ValueError: If a pattern matches no benchmark
+    """
+    if not patterns:
+        return list(specs)
+
+    selected = []
+    for pattern in patterns:
+        lowered = pattern.lower()
+        matched = [
+            spec for spec in specs
+            if fnmatch(spec['key'].lower(), lowered) or fnmatch(spec['test_type'].lower(), lowered)
+        ]
+        if not matched:
+            raise ValueError(f"No benchmark matches {pattern!r}")
+        selected.extend(spec for spec in matched if spec not in selected)
+
+    return [spec for spec in specs if spec in selected]
+
+
+def match_override(key: str, overrides: Dict[str, Any]) -> Optional[Any]:
+    """
+    Find the [sizes] or [timeouts] entry that applies to a benchmark key.
+
+    Args:
+        key: Benchmark key
+        overrides: Table mapping benchmark keys or glob patterns to values
+
+    Returns:
+        The exact key's value, else the first matching pattern's, else None
+    """
+    if key in overrides:
+        return overrides[key]
+    for pattern, value in overrides.items():
+        if fnmatch(key.lower(), pattern.lower()):
+            return value
+    return None
+
+
+def unmatched_overrides(keys: Sequence[str], overrides: Dict[str, Any]) -> List[str]:
+    """
+    List the entries of a [sizes] or [timeouts] table that match no benchmark.
+
+    Args:
+        keys: All benchmark keys
+        overrides: Table mapping benchmark keys or glob patterns to values
+
+    Returns:
+        Table keys and patterns that match none of the benchmark keys
+    """
+    return [
+        pattern for pattern in overrides
+        if not any(fnmatch(key.lower(), pattern.lower()) for key in keys)
+    ]
+
+
+def match_levels(available: Sequence[str], requested: Optional[Sequence[str]]) -> List[str]:
+    """
+    Resolve requested size level names against the known levels.
+
+    Args:
+        available: All size level names, in order
+        requested: Level names to keep (case-insensitive), or None/empty for all
+
+    Returns:
+        Canonical level names in ladder order
+
+    Raises:
+        ValueError: If a requested level is unknown
+    """
+    if not requested:
+        return list(available)
+
+    by_name = {level.lower(): level for level in available}
+    wanted = set()
+    for level in requested:
+        if level.lower() not in by_name:
+            raise ValueError(f"Unknown size level {level!r} (choose from {', '.join(available)})")
+        wanted.add(by_name[level.lower()])
+
+    return [level for level in available if level in wanted]
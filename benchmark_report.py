@@ -0,0 +1,420 @@
+"""
+Cross-interpreter comparison report.
+
+Loads results CSVs written by benchmark.py for several interpreters and
+renders one self-contained HTML file (charts embedded as PNG data URIs) with:
+
+1. Speedup heatmaps, one per benchmark family (split into pages of at most
+   HEATMAP_MAX_ROWS rows): every benchmark and size level against every
+   interpreter, relative to a baseline interpreter.
+2. Scaling charts for the thread, process and sub-interpreter families:
+   throughput against worker count, one line per interpreter.
+3. Error bars and +/- intervals: 95% confidence intervals of the mean,
+   computed from the per-sample times in the CSV 'samples' column (or from
+   the std_dev column for files written before it existed).
+
+pandas and matplotlib are required; seaborn is used for the heatmap when
+installed.
+"""
+
+import base64
+import csv
+import html
+import io
+import json
+import math
+import re
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+# z value for the 95% confidence intervals drawn as error bars
+CONFIDENCE_Z = 1.96
+
+# Families whose size_value starts with a worker count, charted against it
+SCALING_TEST_TYPES = [
+    'Multi-thread CPU', 'Concurrent Futures CPU', 'Process Pool CPU', 'Interpreter Pool CPU',
+    'Multi-thread I/O', 'Concurrent Futures I/O', 'Process Pool I/O', 'Interpreter Pool I/O',
+]
+
+# Rows per speedup heatmap; larger families are split over several heatmaps
+HEATMAP_MAX_ROWS = 40
+
+# "4 threads, 100,000 iter/thread" or "4 processes, 0.01s/task"
+_WORKERS_PATTERN = re.compile(r'^(\d+) (?:threads|processes|interpreters), ([\d,.]+)')
+
+
+def load_report_dependencies() -> Tuple[Any, Any, Any]:
+    """
+    Import the plotting stack.
+
+    Returns:
+        Tuple of (pandas, matplotlib.pyplot, seaborn or None)
+
+    Raises:
+        RuntimeError: If pandas or matplotlib is not installed
+    """
+    try:
+        import pandas
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as pyplot
+    except ImportError as e:
+        raise RuntimeError(
+            f"the report needs pandas and matplotlib ({e.name} is not installed); "
+            f"install the project dependencies, e.g. `uv pip install -e .`"
+        ) from e
+
+    try:
+        import seaborn
+    except ImportError:
+        seaborn = None
+    return pandas, pyplot, seaborn
+
+
+def _version_key(label: str) -> Tuple:
+    """Sort key ordering interpreter labels by version, free-threaded after default builds."""
+    return tuple(int(part) for part in re.findall(r'\d+', label)), label
+
+
+def confidence_interval(samples: List[float], std_dev: Optional[float], repeats: int) -> float:
+    """
+    Half-width of the 95% confidence interval of the mean time.
+
+    Args:
+        samples: Per-sample times (may be empty for older files)
+        std_dev: Recorded standard deviation, used when samples are missing
+        repeats: Recorded repeat count, used when samples are missing
+
+    Returns:
+        Half-width in seconds (0.0 when it cannot be estimated)
+    """
+    if len(samples) >= 2:
+        return CONFIDENCE_Z * statistics.stdev(samples) / math.sqrt(len(samples))
+    if std_dev and repeats > 1:
+        return CONFIDENCE_Z * std_dev / math.sqrt(repeats)
+    return 0.0
+
+
+def load_results(paths: List[Path], pandas: Any) -> Any:
+    """
+    Load completed runs from results CSVs.
+
+    When the same interpreter, benchmark and size level appear more than once,
+    the row from the file given last wins.
+
+    Args:
+        paths: Results CSVs, oldest first
+        pandas: The pandas module
+
+    Returns:
+        DataFrame with one row per (interpreter, test_type, size_level) and
+        columns median, ci (95% half-width) and samples
+    """
+    rows = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                if (row.get('status') or 'ok') != 'ok' or not row.get('median_time'):
+                    continue
+                samples = json.loads(row['samples']) if row.get('samples') else []
+                std_dev = float(row['std_dev']) if row.get('std_dev') else None
+                repeats = int(row['repeats']) if row.get('repeats') else len(samples)
+                rows.append({
+                    'interpreter': row.get('interpreter') or row['python_version'],
+                    'test_type': row['test_type'],
+                    'size_level': row['size_level'],
+                    'size_value': row['size_value'],
+                    'median': float(row['median_time']),
+                    'ci': confidence_interval(samples, std_dev, repeats),
+                    'samples': samples,
+                    'source': Path(path).name,
+                })
+
+    frame = pandas.DataFrame(rows, columns=['interpreter', 'test_type', 'size_level', 'size_value',
+                                            'median', 'ci', 'samples', 'source'])
+    return frame.drop_duplicates(['interpreter', 'test_type', 'size_level'], keep='last')
+
+
+def speedup_table(results: Any, baseline: str, interpreters: List[str], levels: List[str],
+                  pandas: Any) -> Tuple[Any, Any]:
+    """
+    Compute speedups of every interpreter relative to the baseline.
+
+    Speedup is baseline median / interpreter median, so values above 1 mean
+    faster than the baseline. Its error combines both relative intervals.
+
+    Args:
+        results: DataFrame from load_results
+        baseline: Interpreter label the others are compared with
+        interpreters: Interpreter labels, in column order
+        levels: Size level names in ascending order
+        pandas: The pandas module
+
+    Returns:
+        Tuple of (speedups, errors): DataFrames indexed by (test_type, size_level)
+        in level order, with one column per interpreter; runs missing for an
+        interpreter, or where either median is not positive (e.g. an import
+        that costs nothing because startup already did it), are NaN; runs
+        missing for the baseline are left out
+    """
+    base = results[results['interpreter'] == baseline].set_index(['test_type', 'size_level'])
+    order = {level: index for index, level in enumerate(levels)}
+    keys = sorted(base.index, key=lambda key: (key[0], order.get(key[1], len(order))))
+
+    speedups, errors = {}, {}
+    for interpreter in interpreters:
+        other = results[results['interpreter'] == interpreter].set_index(['test_type', 'size_level'])
+        speedup_column, error_column = {}, {}
+        for key in keys:
+            if key not in other.index:
+                continue
+            base_median, base_ci = base.loc[key, 'median'], base.loc[key, 'ci']
+            median, ci = other.loc[key, 'median'], other.loc[key, 'ci']
+            if base_median <= 0 or median <= 0:
+                continue
+            speedup = base_median / median
+            speedup_column[key] = speedup
+            if interpreter == baseline:
+                error_column[key] = ci / median
+            else:
+                error_column[key] = speedup * math.hypot(base_ci / base_median, ci / median)
+        speedups[interpreter] = speedup_column
+        errors[interpreter] = error_column
+
+    index = pandas.MultiIndex.from_tuples(keys, names=['test_type', 'size_level'])
+    return (pandas.DataFrame(speedups).reindex(index=index, columns=interpreters),
+            pandas.DataFrame(errors).reindex(index=index, columns=interpreters))
+
+
+def _figure_data_uri(figure: Any, pyplot: Any) -> str:
+    """Render a figure as an embeddable PNG data URI and close it."""
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png', dpi=110, bbox_inches='tight')
+    pyplot.close(figure)
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def benchmark_family(test_type: str) -> str:
+    """Family a test type belongs to: 'Buffer [bytes_slice]' -> 'Buffer'."""
+    return test_type.split(' [', 1)[0]
+
+
+def heatmap_pages(speedups: Any, max_rows: int = HEATMAP_MAX_ROWS) -> List[Tuple[str, Any]]:
+    """
+    Split a speedup table into one heatmap per benchmark family.
+
+    Families with more than max_rows rows are split into pages titled
+    "Family (1/3)" and so on, so no heatmap grows past a readable height.
+
+    Args:
+        speedups: DataFrame from speedup_table
+        max_rows: Most rows on one heatmap
+
+    Returns:
+        List of (title, rows of speedups) in the table's order
+    """
+    families = {}
+    for key in speedups.index:
+        families.setdefault(benchmark_family(key[0]), []).append(key)
+
+    pages = []
+    for family, keys in families.items():
+        count = -(-len(keys) // max_rows)
+        for page in range(count):
+            title = family if count == 1 else f"{family} ({page + 1}/{count})"
+            pages.append((title, speedups.loc[keys[page * max_rows:(page + 1) * max_rows]]))
+    return pages
+
+
+def plot_speedup_heatmap(speedups: Any, pyplot: Any, seaborn: Any,
+                         title: str = 'Speedup vs baseline (higher is faster)') -> str:
+    """
+    Draw a benchmark x size x interpreter speedup heatmap.
+
+    Colours use log2(speedup) so 2x faster and 2x slower are equally strong;
+    cells are annotated with the speedup itself. Speedups that are not
+    positive are left blank.
+
+    Returns:
+        PNG data URI
+    """
+    import numpy  # installed with pandas
+
+    speedups = speedups.set_axis([f"{test_type} [{size_level}]" for test_type, size_level in speedups.index])
+    speedups = speedups.where(speedups > 0)
+    log_speedups = numpy.log2(speedups.astype(float))
+    height = max(3.0, 0.28 * len(speedups) + 1.5)
+    width = max(6.0, 1.6 * len(speedups.columns) + 5.0)
+    figure, axes = pyplot.subplots(figsize=(width, height))
+    limit = max(0.5, float(log_speedups.abs().max().max()) if log_speedups.notna().any().any() else 0.5)
+
+    if seaborn is not None:
+        seaborn.heatmap(log_speedups, annot=speedups, fmt='.2f', cmap='RdYlGn', center=0.0,
+                        vmin=-limit, vmax=limit, linewidths=0.5, cbar_kws={'label': 'log2(speedup)'}, ax=axes)
+    else:
+        image = axes.imshow(log_speedups.to_numpy(dtype=float), cmap='RdYlGn', vmin=-limit, vmax=limit,
+                            aspect='auto')
+        figure.colorbar(image, ax=axes, label='log2(speedup)')
+        axes.set_xticks(range(len(speedups.columns)), labels=speedups.columns)
+        axes.set_yticks(range(len(speedups.index)), labels=speedups.index)
+        for row, label in enumerate(speedups.index):
+            for column, interpreter in enumerate(speedups.columns):
+                value = speedups.loc[label, interpreter]
+                if not math.isnan(value):
+                    axes.text(column, row, f"{value:.2f}", ha='center', va='center', fontsize=8)
+
+    axes.set_xlabel('Interpreter')
+    axes.set_ylabel('')
+    axes.set_title(title)
+    return _figure_data_uri(figure, pyplot)
+
+
+def plot_scaling(results: Any, test_type: str, interpreters: List[str], pyplot: Any) -> Optional[str]:
+    """
+    Draw throughput against worker count for one scaling family.
+
+    CPU families plot iterations per second (workers x iterations per
+    worker / time); I/O families plot tasks per second (workers / time).
+    Error bars are the 95% confidence intervals scaled to throughput.
+
+    Returns:
+        PNG data URI, or None if no interpreter has results for the family
+    """
+    family = results[results['test_type'] == test_type]
+    if family.empty:
+        return None
+
+    figure, axes = pyplot.subplots(figsize=(7.0, 4.0))
+    io_bound = 'I/O' in test_type
+    for interpreter in interpreters:
+        points = []
+        for _, row in family[family['interpreter'] == interpreter].iterrows():
+            match = _WORKERS_PATTERN.match(row['size_value'])
+            if not match or not row['median']:
+                continue
+            workers = int(match.group(1))
+            work = workers if io_bound else workers * float(match.group(2).replace(',', ''))
+            throughput = work / row['median']
+            points.append((workers, throughput, throughput * row['ci'] / row['median']))
+        if points:
+            points.sort()
+            axes.errorbar([p[0] for p in points], [p[1] for p in points], yerr=[p[2] for p in points],
+                          marker='o', capsize=3, label=interpreter)
+
+    axes.set_xscale('log', base=2)
+    axes.set_xlabel('Workers')
+    axes.set_ylabel('Tasks per second' if io_bound else 'Iterations per second')
+    axes.set_title(test_type)
+    axes.grid(True, alpha=0.3)
+    axes.legend()
+    return _figure_data_uri(figure, pyplot)
+
+
+def _interval_table(values: Any, errors: Any, value_format: str) -> str:
+    """Render value +/- error cells as an HTML table."""
+    cells = values.astype(object)
+    for label in values.index:
+        for column in values.columns:
+            value, error = values.loc[label, column], errors.loc[label, column]
+            cells.loc[label, column] = '' if math.isnan(value) else f"{value:{value_format}} ± {error:{value_format}}"
+    return cells.to_html(classes='results', border=0, escape=True)
+
+
+def render_html(sources: List[Path], baseline: str, interpreters: List[str], heatmaps: List[Tuple[str, str]],
+                scaling_charts: List[Tuple[str, str]], speedup_html: str, timing_html: str) -> str:
+    """Assemble the report page."""
+    heatmap_figures = "\n".join(
+        f'<figure><img alt="{html.escape(title)} speedup heatmap" src="{uri}"></figure>' for title, uri in heatmaps
+    )
+    charts = "\n".join(
+        f'<figure><img alt="{html.escape(title)}" src="{uri}"></figure>' for title, uri in scaling_charts
+    ) or "<p>No thread, process or sub-interpreter results in these files.</p>"
+    source_items = "\n".join(f"<li>{html.escape(str(path))}</li>" for path in sources)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Python Performance Comparison</title>
+<style>
+body {{ font-family: system-ui, sans-serif; margin: 2rem; color: #222; }}
+h1, h2 {{ font-weight: 600; }}
+figure {{ display: inline-block; margin: 0.5rem; }}
+img {{ max-width: 100%; }}
+table.results {{ border-collapse: collapse; font-size: 0.85rem; }}
+table.results th, table.results td {{ padding: 0.2rem 0.6rem; border-bottom: 1px solid #ddd; text-align: right; }}
+table.results th:first-child, table.results td:first-child {{ text-align: left; }}
+</style>
+</head>
+<body>
+<h1>Python Performance Comparison</h1>
+<p>Generated {datetime.now().isoformat(timespec='seconds')}. Interpreters: {html.escape(', '.join(interpreters))};
+baseline: <strong>{html.escape(baseline)}</strong>. Intervals are 95% confidence intervals of the mean.</p>
+<h2>Speedup</h2>
+{heatmap_figures}
+<h2>Scaling</h2>
+{charts}
+<h2>Speedup table</h2>
+{speedup_html}
+<h2>Median times (seconds)</h2>
+{timing_html}
+<h2>Sources</h2>
+<ul>
+{source_items}
+</ul>
+</body>
+</html>
+"""
+
+
+def build_report(paths: List[Path], output: Path, levels: List[str], baseline: Optional[str] = None) -> Path:
+    """
+    Build the HTML comparison report.
+
+    Args:
+        paths: Results CSVs to compare, oldest first
+        output: HTML file to write
+        levels: Size level names in ascending order
+        baseline: Interpreter label to compare against (default: lowest version)
+
+    Returns:
+        Path of the written report
+
+    Raises:
+        RuntimeError: If the plotting dependencies are missing
+        ValueError: If the files hold no completed runs or the baseline is unknown
+    """
+    pandas, pyplot, seaborn = load_report_dependencies()
+    results = load_results(paths, pandas)
+    if results.empty:
+        raise ValueError("no completed runs in the given results files")
+
+    interpreters = sorted(results['interpreter'].unique(), key=_version_key)
+    if baseline is None:
+        baseline = interpreters[0]
+    elif baseline not in interpreters:
+        raise ValueError(f"baseline {baseline!r} not found; interpreters in these files: {', '.join(interpreters)}")
+
+    speedups, speedup_errors = speedup_table(results, baseline, interpreters, levels, pandas)
+    heatmaps = [
+        (title, plot_speedup_heatmap(page, pyplot, seaborn, f"{title}: speedup vs baseline (higher is faster)"))
+        for title, page in heatmap_pages(speedups)
+    ]
+    scaling_charts = [
+        (test_type, chart) for test_type in SCALING_TEST_TYPES
+        if (chart := plot_scaling(results, test_type, interpreters, pyplot)) is not None
+    ]
+
+    medians = results.pivot(index=['test_type', 'size_level'], columns='interpreter', values='median')
+    intervals = results.pivot(index=['test_type', 'size_level'], columns='interpreter', values='ci')
+    medians = medians.reindex(index=speedups.index, columns=interpreters)
+    intervals = intervals.reindex(index=speedups.index, columns=interpreters)
+
+    page = render_html(paths, baseline, interpreters, heatmaps, scaling_charts,
+                       _interval_table(speedups, speedup_errors, '.2f'),
+                       _interval_table(medians, intervals, '.6f'))
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(page, encoding='utf-8')
+    return output
@@ -0,0 +1,293 @@
+"""
+Time-budgeted scheduling of a benchmark plan.
+
+Given a plan from benchmark.build_plan and a wall-clock budget, the scheduler
+estimates what every (benchmark, size) run costs and picks the size levels and
+repeat counts that give the most statistical value within the budget:
+
+1. Cost per repeat comes from earlier results CSVs for the same interpreter
+   build when available, otherwise from a one-repeat calibration run of the
+   smallest planned size. Calibration stops once it has used its share of the
+   budget; benchmarks left uncalibrated, or whose calibration failed or timed
+   out, get no cost estimate. Other sizes are
+   extrapolated with the benchmark's work model (e.g. n**2 for bubble sort,
+   phi**n for recursive Fibonacci).
+2. Coverage first: runs are admitted at the minimum repeat count level by
+   level (every benchmark's Small before any Medium, and so on), skipping any
+   run that no longer fits.
+3. Leftover budget raises repeat counts one at a time, cheapest runs first,
+   up to the maximum repeat count. Runs without a cost estimate keep the
+   minimum; the run-time deadline still stops them if they overrun.
+
+Every run that does not fit is kept in the plan's 'skipped' list together with
+the reason, so the results CSV records what was left out and why.
+"""
+
+import csv
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from tests.base_test import BenchmarkUnavailable
+
+# Fewest repeats that still give a standard deviation
+BUDGET_MIN_REPEATS = 3
+# Upper bound on repeats when the budget has room to spare
+BUDGET_MAX_REPEATS = 20
+# Fraction of the budget handed to estimated run costs; the rest absorbs estimate error
+BUDGET_SAFETY_FACTOR = 0.9
+# Most of the budget calibration runs may use before the remaining benchmarks go uncalibrated
+BUDGET_CALIBRATION_FRACTION = 0.2
+# Estimate source for runs whose cost is unknown (their estimated cost is 0)
+UNCALIBRATED = 'not calibrated'
+# Estimate source for runs whose calibration raised BenchmarkUnavailable (their estimated cost is 0)
+UNAVAILABLE = 'unavailable'
+
+
+def default_work(size: Any) -> float:
+    """
+    Relative amount of work for a size value, assuming linear cost.
+
+    Args:
+        size: Scalar size or list of size parameters
+
+    Returns:
+        Work units (product of the parameters for list sizes)
+    """
+    if isinstance(size, (list, tuple)):
+        return float(math.prod(size))
+    return float(size)
+
+
+def load_history(results_dir: Path, interpreter: str) -> Dict[Tuple[str, str], float]:
+    """
+    Load per-repeat costs of completed runs from earlier results CSVs.
+
+    Args:
+        results_dir: Directory holding benchmark_results_*.csv files
+        interpreter: Only rows for this interpreter label are used (e.g. "3.14.0t");
+            rows from before the interpreter column are matched on python_version
+
+    Returns:
+        Mapping of (test_type, size_value) to the median recorded mean_time
+    """
+    samples: Dict[Tuple[str, str], List[float]] = {}
+    for csv_path in sorted(Path(results_dir).glob("benchmark_results_*.csv")):
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as csvfile:
+                for row in csv.DictReader(csvfile):
+                    if (row.get('interpreter') or row.get('python_version')) != interpreter:
+                        continue
+                    if (row.get('status') or 'ok') != 'ok' or not row.get('mean_time'):
+                        continue
+                    key = (row['test_type'], row['size_value'])
+                    samples.setdefault(key, []).append(float(row['mean_time']))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable history file {csv_path}: {e}", file=sys.stderr)
+
+    return {key: statistics.median(values) for key, values in samples.items()}
+
+
+def _size_value(spec: Dict[str, Any], size: Any) -> str:
+    """CSV size_value of a size, as stored in results files."""
+    describe = spec.get('describe')
+    return str(describe(size) if describe else size)
+
+
+def _calibrate(spec: Dict[str, Any], size: Any) -> float:
+    """Wall time of a single repeat of one run, including its setup."""
+    start_time = time.perf_counter()
+    spec['run'](size, 1)
+    return time.perf_counter() - start_time
+
+
+def estimate_costs(
+    plan: List[Dict[str, Any]],
+    history: Dict[Tuple[str, str], float],
+    calibrate: Optional[Callable[[Dict[str, Any], Any], float]] = _calibrate,
+    calibration_budget: Optional[float] = None
+) -> Dict[Tuple[str, str], Tuple[float, str]]:
+    """
+    Estimate the per-repeat cost of every run in a plan.
+
+    Args:
+        plan: Plan entries from build_plan
+        history: Known costs from load_history
+        calibrate: Callable(spec, size) returning the measured cost of one
+            repeat, or None to run nothing (e.g. for --list); any exception
+            other than BenchmarkUnavailable (a failure or a timeout) leaves
+            that benchmark uncalibrated
+        calibration_budget: Seconds calibration may take in total, or None for
+            no limit; checked before each calibration run
+
+    Returns:
+        Mapping of (benchmark key, size_level) to (seconds per repeat, source);
+        runs of benchmarks without history that were not calibrated, or whose
+        calibration failed, get (0.0, UNCALIBRATED), and runs of benchmarks whose calibration raised
+        BenchmarkUnavailable get (0.0, UNAVAILABLE)
+    """
+    estimates = {}
+    calibration_time = 0.0
+    for spec in plan:
+        work = spec.get('work', default_work)
+        known = [
+            (size, history[(spec['test_type'], _size_value(spec, size))], 'history')
+            for _, size, _ in spec['runs']
+            if (spec['test_type'], _size_value(spec, size)) in history
+        ]
+        if not known:
+            if calibrate is None or (calibration_budget is not None and calibration_time >= calibration_budget):
+                for size_level, _, _ in spec['runs']:
+                    estimates[(spec['key'], size_level)] = (0.0, UNCALIBRATED)
+                continue
+            smallest = min((size for _, size, _ in spec['runs']), key=work)
+            print(f"Calibrating {spec['test_type']} ({_size_value(spec, smallest)})...")
+            start_time = time.perf_counter()
+            try:
+                cost = calibrate(spec, smallest)
+            except BenchmarkUnavailable as e:
+                # Costs nothing to run; run_benchmarks records it as skipped
+                print(f"   unavailable: {e}")
+                for size_level, _, _ in spec['runs']:
+                    estimates[(spec['key'], size_level)] = (0.0, UNAVAILABLE)
+                continue
+            except Exception as e:
+                # Scheduled at the minimum repeats; the main run records the failure or timeout
+                print(f"   calibration failed: {type(e).__name__}: {e}")
+                for size_level, _, _ in spec['runs']:
+                    estimates[(spec['key'], size_level)] = (0.0, UNCALIBRATED)
+                continue
+            finally:
+                calibration_time += time.perf_counter() - start_time
+            known = [(smallest, cost, 'calibration')]
+
+        for size_level, size, _ in spec['runs']:
+            # Extrapolate from the known point closest in work
+            anchor_size, anchor_cost, source = min(
+                known, key=lambda point: abs(math.log(work(point[0]) or 1.0) - math.log(work(size) or 1.0))
+            )
+            ratio = work(size) / work(anchor_size) if work(anchor_size) else 1.0
+            if ratio != 1.0:
+                source = f"{source}, extrapolated"
+            estimates[(spec['key'], size_level)] = (anchor_cost * ratio, source)
+
+    return estimates
+
+
+def schedule_plan(
+    plan: List[Dict[str, Any]],
+    budget: float,
+    estimates: Dict[Tuple[str, str], Tuple[float, str]],
+    levels: List[str],
+    min_repeats: int = BUDGET_MIN_REPEATS,
+    max_repeats: int = BUDGET_MAX_REPEATS
+) -> List[Dict[str, Any]]:
+    """
+    Choose size levels and repeat counts that fit a plan into a time budget.
+
+    Args:
+        plan: Plan entries from build_plan
+        budget: Seconds available for the runs themselves
+        estimates: Per-repeat costs from estimate_costs
+        levels: Size level names in ascending order
+        min_repeats: Repeats every admitted run gets
+        max_repeats: Most repeats any run gets
+
+    Returns:
+        New plan whose runs carry their chosen repeat counts and whose
+        'skipped' lists hold (size_level, size, reason) for dropped runs
+    """
+    min_repeats = min(min_repeats, max_repeats)
+    available = budget * BUDGET_SAFETY_FACTOR
+    chosen: Dict[Tuple[str, str], int] = {}
+    skipped: Dict[Tuple[str, str], str] = {}
+
+    # Coverage pass: smaller levels first so every benchmark gets its cheap sizes
+    candidates = sorted(
+        ((levels.index(size_level), spec_index, spec['key'], size_level)
+         for spec_index, spec in enumerate(plan)
+         for size_level, _, _ in spec['runs']),
+    )
+    for _, _, key, size_level in candidates:
+        cost = estimates[(key, size_level)][0] * min_repeats
+        if cost <= available:
+            chosen[(key, size_level)] = min_repeats
+            available -= cost
+        else:
+            skipped[(key, size_level)] = (
+                f"estimated {cost:.1f}s for {min_repeats} repeats exceeds remaining budget {available:.1f}s"
+            )
+
+    # Refinement pass: add repeats round-robin, cheapest runs first (runs of unknown cost keep the minimum)
+    by_cost = sorted((run for run in chosen if estimates[run][0] > 0), key=lambda run: estimates[run][0])
+    added = True
+    while added:
+        added = False
+        for run in by_cost:
+            cost = estimates[run][0]
+            if chosen[run] < max_repeats and cost <= available:
+                chosen[run] += 1
+                available -= cost
+                added = True
+
+    scheduled = []
+    for spec in plan:
+        runs = []
+        skipped_runs = list(spec.get('skipped', []))
+        for size_level, size, _ in spec['runs']:
+            run = (spec['key'], size_level)
+            if run in chosen:
+                runs.append((size_level, size, chosen[run]))
+            else:
+                skipped_runs.append((size_level, size, skipped[run]))
+        scheduled.append({**spec, 'runs': runs, 'skipped': skipped_runs})
+
+    return scheduled
+
+
+def print_schedule(
+    plan: List[Dict[str, Any]],
+    estimates: Dict[Tuple[str, str], Tuple[float, str]],
+    budget: float
+) -> None:
+    """
+    Print the chosen schedule and the runs it skipped.
+
+    Args:
+        plan: Scheduled plan from schedule_plan
+        estimates: Per-repeat costs from estimate_costs
+        budget: Total budget in seconds
+    """
+    total = 0.0
+    print(f"Budget schedule ({budget:.0f}s):")
+    for spec in plan:
+        for size_level, _, repeats in spec['runs']:
+            cost, source = estimates[(spec['key'], size_level)]
+            total += cost * repeats
+            estimate = f"{'?':>8} " if source == UNCALIBRATED else f"{cost * repeats:8.2f}s"
+            print(f"  {spec['test_type']:<32} {size_level:<8} x{repeats:<3} ~{estimate}  ({source})")
+        for size_level, _, reason in spec.get('skipped', []):
+            print(f"  {spec['test_type']:<32} {size_level:<8} skipped: {reason}")
+    uncalibrated = sum(
+        estimates[(spec['key'], size_level)][1] == UNCALIBRATED
+        for spec in plan for size_level, _, _ in spec['runs']
+    )
+    print(f"Estimated run time: {total:.1f}s of {budget:.0f}s"
+          + (f" plus {uncalibrated} runs of unknown cost" if uncalibrated else ""))
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """
+    Seconds left before a time.monotonic() deadline.
+
+    Args:
+        deadline: Deadline, or None for no budget
+
+    Returns:
+        Remaining seconds (never negative), or None if there is no deadline
+    """
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
@@ -4,30 +4,80 @@ This package contains individual benchmark tests that can be run across
 different Python versions (3.13, 3.14, 3.14-threadfree).
 """
 
-from .base_test import run_benchmark, print_benchmark_results, time_function
+from .base_test import (
+    run_benchmark,
+    print_benchmark_results,
+    time_function,
+    calibrate_timer,
+    is_trusted_duration,
+    BenchmarkUnavailable
+)
 from .fibonacci_test import run_fibonacci_benchmark
 from .sorting_test import run_bubble_sort_benchmark, print_bubble_sort_results
 from .list_comprehension_test import run_list_comprehension_benchmark, print_list_comprehension_results
-from .function_call_test import run_function_call_benchmark
+from .function_call_test import (
+    run_function_call_benchmark,
+    run_function_call_variant_benchmark,
+    FUNCTION_CALL_VARIANTS
+)
 from .exception_test import run_exception_handling_benchmark
 from .object_test import run_object_instantiation_benchmark, run_attribute_access_benchmark, print_object_instantiation_results
 from .multithread_test import (
     run_multithread_cpu_benchmark,
     run_multithread_io_benchmark,
     run_concurrent_futures_cpu_benchmark,
-    run_concurrent_futures_io_benchmark
+    run_concurrent_futures_io_benchmark,
+    run_process_pool_cpu_benchmark,
+    run_process_pool_io_benchmark
+)
+from .subinterpreter_test import (
+    run_interpreter_pool_cpu_benchmark,
+    run_interpreter_pool_io_benchmark,
+    run_interpreter_startup_benchmark,
+    run_data_passing_benchmark,
+    DATA_PASSING_BACKENDS
+)
+from .pipeline_test import run_pipeline_benchmark, PIPELINE_QUEUE_KINDS
+from .allocation_test import run_allocation_benchmark, ALLOCATION_KERNELS, PYTHONMALLOC_VARIANTS
+from .text_test import run_text_benchmark, TEXT_WORKLOADS, TEXT_DRIVERS
+from .hashtable_test import run_hashtable_benchmark, HASH_OPERATIONS, HASH_KEY_TYPES
+from .buffer_test import run_buffer_benchmark, BUFFER_OPERATIONS, BUFFER_ALL_OPERATIONS
+from .dispatch_test import run_dispatch_benchmark, run_pool_lifecycle_benchmark, DISPATCH_METHODS
+from .thread_stress_test import run_thread_stress_benchmark, THREAD_STRESS_MODES, THREAD_STACK_SIZES
+from .mapreduce_test import run_mapreduce_benchmark, MAPREDUCE_REDUCTIONS, MAPREDUCE_CONTAINERS, MAPREDUCE_BACKENDS
+from .startup_test import (
+    run_startup_benchmark,
+    run_import_time_benchmark,
+    summarize_startup,
+    print_startup_summary,
+    STARTUP_FLAG_VARIANTS,
+    PYC_CACHE_VARIANTS,
+    IMPORT_TIME_MODULES
+)
+from .warmup_test import (
+    run_warmup_benchmark,
+    print_warmup_results,
+    find_steady_state,
+    jit_status,
+    WARMUP_KERNELS,
+    JIT_MODES
 )
 
 __all__ = [
     'run_benchmark',
     'print_benchmark_results', 
     'time_function',
+    'calibrate_timer',
+    'is_trusted_duration',
+    'BenchmarkUnavailable',
     'run_fibonacci_benchmark',
     'run_bubble_sort_benchmark',
     'print_bubble_sort_results',
     'run_list_comprehension_benchmark',
     'print_list_comprehension_results',
     'run_function_call_benchmark',
+    'run_function_call_variant_benchmark',
+    'FUNCTION_CALL_VARIANTS',
     'run_exception_handling_benchmark',
     'run_object_instantiation_benchmark',
     'run_attribute_access_benchmark',
@@ -35,5 +85,49 @@ __all__ = [
     'run_multithread_cpu_benchmark',
     'run_multithread_io_benchmark',
     'run_concurrent_futures_cpu_benchmark',
-    'run_concurrent_futures_io_benchmark'
+    'run_concurrent_futures_io_benchmark',
+    'run_process_pool_cpu_benchmark',
+    'run_process_pool_io_benchmark',
+    'run_interpreter_pool_cpu_benchmark',
+    'run_interpreter_pool_io_benchmark',
+    'run_interpreter_startup_benchmark',
+    'run_data_passing_benchmark',
+    'DATA_PASSING_BACKENDS',
+    'run_pipeline_benchmark',
+    'PIPELINE_QUEUE_KINDS',
+    'run_allocation_benchmark',
+    'ALLOCATION_KERNELS',
+    'PYTHONMALLOC_VARIANTS',
+    'run_text_benchmark',
+    'TEXT_WORKLOADS',
+    'TEXT_DRIVERS',
+    'run_hashtable_benchmark',
+    'HASH_OPERATIONS',
+    'HASH_KEY_TYPES',
+    'run_buffer_benchmark',
+    'BUFFER_OPERATIONS',
+    'BUFFER_ALL_OPERATIONS',
+    'run_dispatch_benchmark',
+    'run_pool_lifecycle_benchmark',
+    'DISPATCH_METHODS',
+    'run_thread_stress_benchmark',
+    'THREAD_STRESS_MODES',
+    'THREAD_STACK_SIZES',
+    'run_mapreduce_benchmark',
+    'MAPREDUCE_REDUCTIONS',
+    'MAPREDUCE_CONTAINERS',
+    'MAPREDUCE_BACKENDS',
+    'run_startup_benchmark',
+    'run_import_time_benchmark',
+    'summarize_startup',
+    'print_startup_summary',
+    'STARTUP_FLAG_VARIANTS',
+    'PYC_CACHE_VARIANTS',
+    'IMPORT_TIME_MODULES',
+    'run_warmup_benchmark',
+    'print_warmup_results',
+    'find_steady_state',
+    'jit_status',
+    'WARMUP_KERNELS',
+    'JIT_MODES'
 ]
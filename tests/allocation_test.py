@@ -0,0 +1,265 @@
+"""
+Allocation-churn and memory-allocator benchmark tests.
+
+object_instantiation_test keeps every object it builds; these tests measure
+the allocate-and-free patterns of long-running programs instead: replacing
+objects in a steady-state working set, growing containers, and how much
+memory goes back to the OS after half of a large heap is freed. Each sample
+runs in its own fresh interpreter so the heap starts clean and the allocator
+can be switched with PYTHONMALLOC (free-threaded builds default to mimalloc).
+"""
+
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+from .base_test import BenchmarkUnavailable, _calculate_statistics, is_trusted_duration, time_function
+from .startup_test import PROJECT_ROOT
+
+try:
+    import psutil
+except ImportError:  # fall back to /proc on Linux
+    psutil = None
+
+# Live objects kept by churn_test while it replaces them
+ALLOCATION_WORKING_SET = 10_000
+
+# Allocator name -> PYTHONMALLOC value (None leaves the interpreter's default)
+PYTHONMALLOC_VARIANTS: Dict[str, Optional[str]] = {
+    'default': None,
+    'pymalloc': 'pymalloc',
+    'malloc': 'malloc',
+    'mimalloc': 'mimalloc',
+}
+
+# Runs _child_main in a fresh interpreter (kernel and size follow as argv)
+_CHILD_CODE = "import sys; from tests.allocation_test import _child_main; _child_main(sys.argv[1:])"
+
+
+class _ChurnNode:
+    """Small object with a dict and a list, like a typical short-lived record."""
+
+    def __init__(self, key: int):
+        self.key = key
+        self.tags = [key, key + 1]
+
+
+def current_rss() -> Optional[int]:
+    """
+    Resident set size of this process in bytes.
+
+    Returns:
+        RSS from psutil, else from /proc/self/statm, else None
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def churn_test(operations: int, working_set: int = ALLOCATION_WORKING_SET) -> int:
+    """
+    Test small-object churn: replace objects in a fixed-size live working set.
+
+    Args:
+        operations: Number of objects allocated (and old ones freed)
+        working_set: Number of objects alive at any time
+
+    Returns:
+        Sum of the surviving objects' keys
+    """
+    live = [_ChurnNode(i) for i in range(working_set)]
+    for i in range(operations):
+        live[i % working_set] = _ChurnNode(i)
+    return sum(node.key for node in live)
+
+
+def list_growth_test(elements: int) -> int:
+    """
+    Test list growth by repeated append.
+
+    Args:
+        elements: Number of elements appended
+
+    Returns:
+        Final length
+    """
+    items = []
+    for i in range(elements):
+        items.append(i)
+    return len(items)
+
+
+def bytearray_growth_test(elements: int) -> int:
+    """
+    Test bytearray growth by repeated append.
+
+    Args:
+        elements: Number of bytes appended
+
+    Returns:
+        Final length
+    """
+    buffer = bytearray()
+    for i in range(elements):
+        buffer.append(i & 0xFF)
+    return len(buffer)
+
+
+def dict_growth_test(elements: int) -> int:
+    """
+    Test dict growth by inserting new keys.
+
+    Args:
+        elements: Number of keys inserted
+
+    Returns:
+        Final length
+    """
+    table = {}
+    for i in range(elements):
+        table[i] = i
+    return len(table)
+
+
+def fragmentation_test(objects: int) -> Dict[str, Any]:
+    """
+    Test fragmentation: build a heap of small objects, free every other one.
+
+    Freeing interleaved objects leaves most allocator pages partly used, so
+    the memory usually cannot be returned to the OS.
+
+    Args:
+        objects: Number of small lists allocated
+
+    Returns:
+        Dictionary with RSS before, at peak and after freeing half (bytes),
+        and the fraction of the freed half still held by the process
+    """
+    gc.collect()
+    baseline = current_rss()
+    heap = [[i] * 4 for i in range(objects)]
+    peak = current_rss()
+    del heap[::2]
+    gc.collect()
+    after = current_rss()
+    del heap
+
+    if baseline is None:
+        return {'rss_baseline': None, 'rss_peak': None, 'rss_after_free': None, 'freed_not_returned': None}
+    freed = (peak - baseline) / 2
+    return {
+        'rss_baseline': baseline,
+        'rss_peak': peak,
+        'rss_after_free': after,
+        'freed_not_returned': (after - baseline - freed) / freed if freed > 0 else None,
+    }
+
+
+# Kernel name -> function(size) run by allocation_benchmark_test
+ALLOCATION_KERNELS: Dict[str, Callable[[int], Any]] = {
+    'churn': churn_test,
+    'list_growth': list_growth_test,
+    'bytearray_growth': bytearray_growth_test,
+    'dict_growth': dict_growth_test,
+    'fragmentation': fragmentation_test,
+}
+
+
+def allocation_benchmark_test(kernel: str, size: int, allocator: str = 'default',
+                              interpreter: str = sys.executable) -> Dict[str, Any]:
+    """
+    Time one run of an allocation kernel in a fresh interpreter with the given allocator.
+
+    Args:
+        kernel: Key into ALLOCATION_KERNELS
+        size: Size passed to the kernel
+        allocator: Key into PYTHONMALLOC_VARIANTS
+        interpreter: Interpreter executable to launch
+
+    Returns:
+        Dictionary with the child's 'execution_time', the kernel's 'result'
+        and 'rss' after the run
+
+    Raises:
+        BenchmarkUnavailable: If the interpreter rejects the PYTHONMALLOC value
+    """
+    env = os.environ.copy()
+    env.pop('PYTHONMALLOC', None)
+    if PYTHONMALLOC_VARIANTS[allocator] is not None:
+        env['PYTHONMALLOC'] = PYTHONMALLOC_VARIANTS[allocator]
+
+    command = [interpreter, '-c', _CHILD_CODE, kernel, str(size)]
+    completed = subprocess.run(command, env=env, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        if 'PYTHONMALLOC' in completed.stderr:
+            raise BenchmarkUnavailable(f"{interpreter} does not support PYTHONMALLOC={env['PYTHONMALLOC']}")
+        raise RuntimeError(f"allocation child failed: {completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _median_or_none(values: List[Optional[float]]) -> Optional[float]:
+    """Median of the values that are not None, or None if there are none."""
+    present = [value for value in values if value is not None]
+    return statistics.median(present) if present else None
+
+
+def run_allocation_benchmark(kernel: str = 'churn', size: int = 100_000, allocator: str = 'default',
+                             repeats: int = 1, interpreter: str = sys.executable) -> dict:
+    """
+    Run allocation benchmark, launching one fresh interpreter per sample.
+
+    Args:
+        kernel: Key into ALLOCATION_KERNELS (default: 'churn')
+        size: Operations, elements or objects, depending on the kernel (default: 100000)
+        allocator: Key into PYTHONMALLOC_VARIANTS (default: 'default')
+        repeats: Number of times to repeat the test (default: 1)
+        interpreter: Interpreter executable to launch (default: current interpreter)
+
+    Returns:
+        Dictionary in the same shape as run_benchmark's, plus 'metrics' with
+        the median RSS of the children after their run; fragmentation also
+        reports the median of each RSS figure and the figures of every sample
+    """
+    if kernel not in ALLOCATION_KERNELS:
+        raise ValueError(f"Unknown allocation kernel: {kernel!r}")
+    if allocator not in PYTHONMALLOC_VARIANTS:
+        raise ValueError(f"Unknown allocator: {allocator!r}")
+
+    reports = [allocation_benchmark_test(kernel, size, allocator, interpreter) for _ in range(repeats)]
+    execution_times = [report['execution_time'] for report in reports]
+    results = [report['result'] for report in reports]
+    metrics = {'allocator': allocator, 'rss_bytes': _median_or_none([report['rss'] for report in reports])}
+    if kernel == 'fragmentation':
+        for field in ('rss_baseline', 'rss_peak', 'rss_after_free', 'freed_not_returned'):
+            metrics[field] = _median_or_none([result[field] for result in results])
+        metrics['samples'] = results
+    return {
+        'name': f"Allocation [{kernel}, {allocator}] ({size:,})",
+        'repeats': repeats,
+        'result': results[0] if results else None,
+        'all_results': results,
+        'execution_times': execution_times,
+        'statistics': _calculate_statistics(execution_times),
+        'unreliable_samples': sum(not is_trusted_duration(t) for t in execution_times),
+        'metrics': metrics,
+        'timestamp': time.time()
+    }
+
+
+def _child_main(argv: List[str]) -> None:
+    """Child-process entry point: run the kernel once and print its timing and RSS as JSON."""
+    kernel, size = argv[0], int(argv[1])
+    result, execution_time = time_function(ALLOCATION_KERNELS[kernel], size)
+    print(json.dumps({
+        'execution_time': execution_time,
+        'result': result,
+        'rss': current_rss(),
+    }))
@@ -4,25 +4,122 @@ Simple timing utilities for performance testing.
 
 import time
 import statistics
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A sample must span at least this many timer ticks to be trusted (0.1% quantization error)
+MIN_TRUSTED_TICKS = 1000
+
+# Number of readings taken when calibrating the timer
+CALIBRATION_SAMPLES = 2000
+
+# Columns written for every (benchmark, size) row. 'status' is 'ok', 'timeout', 'skipped'
+# or 'error'; 'notes' says why for rows that did not complete; 'metrics' holds a JSON
+# object of family-specific measurements (e.g. warmup steady-state point) when present;
+# 'unreliable_samples' counts samples too close to the timer resolution to be trusted;
+# 'samples' is a JSON list of the per-repeat times and 'interpreter' tells apart builds
+# that share a version number (e.g. 3.14.0 and free-threaded 3.14.0t).
+CSV_FIELDNAMES = [
+    'test_name', 'test_type', 'size_level', 'size_value', 'python_version',
+    'platform', 'architecture', 'repeats', 'mean_time', 'min_time', 'max_time',
+    'std_dev', 'median_time', 'timestamp', 'status', 'notes', 'metrics',
+    'unreliable_samples', 'samples', 'interpreter'
+]
+
+_timer_calibration: Optional[Dict[str, int]] = None
+
+
+class BenchmarkUnavailable(Exception):
+    """Raised when a benchmark cannot run on this interpreter or platform (e.g. a missing feature)."""
+
+
+def _empty_function() -> None:
+    """No-op target used to measure the cost of timing a call."""
+
+
+def calibrate_timer(samples: int = CALIBRATION_SAMPLES) -> Dict[str, int]:
+    """
+    Measure perf_counter_ns resolution and the overhead of timing an empty call.
+
+    The result is cached, so the measurement happens once per process; call
+    this at startup to keep it out of the first benchmark's setup.
+
+    Args:
+        samples: Number of readings for each measurement
+
+    Returns:
+        Dictionary with 'resolution_ns' (smallest observable step, never below
+        the clock's advertised resolution), 'overhead_ns' (median cost of
+        timing an empty call) and 'min_trusted_ns' (shortest trusted sample)
+    """
+    global _timer_calibration
+    if _timer_calibration is not None:
+        return _timer_calibration
+
+    clock = time.perf_counter_ns
+    advertised_ns = max(1, round(time.get_clock_info('perf_counter').resolution * 1e9))
+
+    steps = []
+    for _ in range(samples):
+        first = clock()
+        second = clock()
+        while second == first:
+            second = clock()
+        steps.append(second - first)
+    resolution_ns = max(advertised_ns, min(steps))
+
+    overheads = []
+    for _ in range(samples):
+        _, elapsed_ns = _time_call_ns(clock, _empty_function, (), {})
+        overheads.append(elapsed_ns)
+
+    _timer_calibration = {
+        'resolution_ns': resolution_ns,
+        'overhead_ns': int(statistics.median(overheads)),
+        'min_trusted_ns': resolution_ns * MIN_TRUSTED_TICKS,
+    }
+    return _timer_calibration
+
+
+def _time_call_ns(clock: Callable[[], int], func: Callable, args: tuple, kwargs: dict) -> Tuple[Any, int]:
+    """Time one call with the given clock; shared by time_function and calibration."""
+    start_time = clock()
+    result = func(*args, **kwargs)
+    end_time = clock()
+    return result, end_time - start_time
 
 
 def time_function(func: Callable, *args, **kwargs) -> Tuple[Any, float]:
     """
     Time the execution of a function.
-    
+
+    Uses perf_counter_ns and subtracts the calibrated cost of timing an empty
+    call (see calibrate_timer), so very short calls are not inflated by the
+    measurement itself.
+
     Args:
         func: Function to time
         *args: Positional arguments for the function
         **kwargs: Keyword arguments for the function
-        
+
     Returns:
-        Tuple containing (function_result, execution_time)
+        Tuple containing (function_result, execution_time) with the time in seconds
     """
-    start_time = time.perf_counter()
-    result = func(*args, **kwargs)
-    end_time = time.perf_counter()
-    return result, end_time - start_time
+    calibration = calibrate_timer()
+    result, elapsed_ns = _time_call_ns(time.perf_counter_ns, func, args, kwargs)
+    return result, max(0, elapsed_ns - calibration['overhead_ns']) / 1e9
+
+
+def is_trusted_duration(execution_time: float) -> bool:
+    """
+    Check whether a sample is long enough relative to the timer resolution.
+
+    Args:
+        execution_time: Overhead-corrected sample duration in seconds
+
+    Returns:
+        True if the sample spans at least MIN_TRUSTED_TICKS timer ticks
+    """
+    return execution_time * 1e9 >= calibrate_timer()['min_trusted_ns']
 
 
 def run_benchmark(name: str, func: Callable, *args, repeats: int = 1, **kwargs) -> Dict[str, Any]:
@@ -58,6 +155,8 @@ def run_benchmark(name: str, func: Callable, *args, repeats: int = 1, **kwargs)
         'all_results': test_results,
         'execution_times': execution_times,
         'statistics': stats,
+        'unreliable_samples': sum(not is_trusted_duration(t) for t in execution_times),
+        'timer': calibrate_timer(),
         'timestamp': time.time()
     }
 
@@ -93,6 +192,23 @@ def _calculate_statistics(execution_times: List[float]) -> Dict[str, float]:
     }
 
 
+def _percentiles(values: List[float], points: Tuple[int, ...]) -> List[Optional[float]]:
+    """
+    Percentiles of values, interpolated by statistics.quantiles.
+
+    Args:
+        values: Samples, in any order
+        points: Percentiles from 1 to 100; 100 is the maximum
+
+    Returns:
+        One value per point, or all None if there are no samples
+    """
+    if len(values) < 2:
+        return [values[0] if values else None for _ in points]
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return [max(values) if point == 100 else cuts[point - 1] for point in points]
+
+
 def print_benchmark_results(results: Dict[str, Any]) -> None:
     """
     Print formatted benchmark results with statistics.
@@ -113,4 +229,9 @@ def print_benchmark_results(results: Dict[str, Any]) -> None:
         print(f"   Max Time:  {stats['max']:.6f} seconds")
         print(f"   Std Dev:   {stats['std_dev']:.6f} seconds")
         print(f"   Median:    {stats['median']:.6f} seconds")
+    
+    if results.get('unreliable_samples'):
+        min_trusted = results['timer']['min_trusted_ns'] / 1e9
+        print(f"   Warning: {results['unreliable_samples']} sample(s) shorter than {min_trusted:.6f} seconds "
+              f"are too close to the timer resolution to be trusted")
 
@@ -0,0 +1,17 @@
+"""
+Unit tests for the shared helpers in base_test.
+"""
+
+from tests.base_test import _percentiles
+
+
+def test_percentiles_interpolate_and_100_is_the_maximum() -> None:
+    """Points are interpolated between samples, in any input order; 100 is the largest sample."""
+    values = list(range(101, 0, -1))
+    assert _percentiles(values, (50, 90, 99, 100)) == [51, 91, 100, 101]
+
+
+def test_percentiles_of_short_samples() -> None:
+    """One sample is every percentile; no samples give None."""
+    assert _percentiles([7], (50, 100)) == [7, 7]
+    assert _percentiles([], (50, 99)) == [None, None]
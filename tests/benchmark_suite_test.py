@@ -0,0 +1,76 @@
+"""
+pytest-benchmark entry points for every benchmark in the suite.
+
+One test is collected per (benchmark, size level) in the registry of
+benchmark.py, using the size ladders of the profile given by
+--bench-profile. Large, XLarge and XXLarge sizes are marked `slow` and are
+deselected by default:
+
+    pytest                                   # Small and Medium sizes
+    pytest -m "slow or not slow"             # every size
+    pytest -k "fib or mt_cpu"                # only some benchmarks
+    pytest --benchmark-autosave              # save a baseline under .benchmarks/
+    pytest --benchmark-compare               # compare against the latest baseline
+    pytest --benchmark-json=results.json     # per-function JSON for CI
+"""
+
+import sys
+from typing import Any
+import pytest
+
+from benchmark import build_plan
+from benchmark_config import load_profile
+from .base_test import BenchmarkUnavailable
+
+# Size levels too slow for a default pytest run
+SLOW_LEVELS = {"Large", "XLarge", "XXLarge"}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize suite_run over the (benchmark, size level) pairs of the selected profile."""
+    if 'suite_run' not in metafunc.fixturenames:
+        return
+
+    profile = load_profile(metafunc.config.getoption('bench_profile'))
+    params = []
+    for spec in build_plan(profile):
+        for size_level, size, _ in spec['runs']:
+            marks = [pytest.mark.slow] if size_level in SLOW_LEVELS else []
+            params.append(pytest.param((spec, size_level, size), id=f"{spec['key']}-{size_level}", marks=marks))
+    metafunc.parametrize('suite_run', params)
+
+
+def _suite_benchmark(request: pytest.FixtureRequest, spec: dict, size_level: str, size) -> Any:
+    """The pytest-benchmark fixture, grouped by test type and labelled like a results CSV row."""
+    benchmark = request.getfixturevalue('benchmark')
+    describe = spec.get('describe')
+    benchmark.group = spec['test_type']
+    benchmark.extra_info.update({
+        'test_type': spec['test_type'],
+        'size_level': size_level,
+        'size_value': describe(size) if describe else size,
+        'python_version': sys.version.split()[0],
+    })
+    return benchmark
+
+
+def test_benchmark(request: pytest.FixtureRequest, suite_run) -> None:
+    """
+    Time one benchmark at one size with pytest-benchmark.
+
+    The fixture is only requested once setup has succeeded, so benchmarks
+    that are unavailable here are skipped without an unused-fixture warning.
+    """
+    spec, size_level, size = suite_run
+    try:
+        if 'kernel' in spec:
+            func, args = spec['kernel'](size)
+            _suite_benchmark(request, spec, size_level, size)(func, *args)
+        elif 'fixture' in spec:
+            with spec['fixture'](size) as (func, args):
+                _suite_benchmark(request, spec, size_level, size)(func, *args)
+        else:
+            # Timed inside child interpreters: pytest's clock would measure the launches, so only check it runs
+            spec['run'](size, 1)
+    except BenchmarkUnavailable as e:
+        pytest.skip(str(e))
@@ -0,0 +1,247 @@
+"""
+Zero-copy binary buffer benchmark tests.
+
+Network framing code walks a message buffer frame by frame: slicing out
+payloads, decoding headers and assembling output. These tests time the
+common ways of doing that. The timed functions only do the work; the bytes
+each operation copies are counted afterwards in a separate pass
+(count_copies). bytes slices are checked on the running interpreter (a slice
+that is not the source object owns a copy), output assembly counts the
+frames written plus the contents copied again whenever the bytearray is
+reallocated (seen as sys.getsizeof growth), and memoryview slices and
+struct.unpack_from read the message in place.
+"""
+
+import array
+import contextlib
+import os
+import random
+import struct
+import sys
+import tempfile
+from typing import Callable, Dict, Iterator, Tuple
+from .base_test import run_benchmark
+
+# Bytes per frame when walking a message
+FRAME_BYTES = 64
+
+# Buffer size used by readinto_test
+READ_CHUNK_BYTES = 65536
+
+_HEADER = struct.Struct('<I')
+
+
+def bytes_slice_test(data: bytes) -> int:
+    """Slice every frame out of a bytes message; returns the number of frames."""
+    frames = range(0, len(data), FRAME_BYTES)
+    for offset in frames:
+        frame = data[offset:offset + FRAME_BYTES]
+    return len(frames)
+
+
+def memoryview_slice_test(data: bytes) -> int:
+    """Slice every frame out of a memoryview of the message; returns the number of frames."""
+    view = memoryview(data)
+    frames = range(0, len(data), FRAME_BYTES)
+    for offset in frames:
+        frame = view[offset:offset + FRAME_BYTES]
+    return len(frames)
+
+
+def struct_unpack_from_test(data: bytes) -> int:
+    """Decode a 4-byte header at every frame with struct.unpack_from; returns the number of headers."""
+    headers = range(0, len(data) - _HEADER.size + 1, FRAME_BYTES)
+    for offset in headers:
+        _HEADER.unpack_from(data, offset)
+    return len(headers)
+
+
+def int_from_bytes_test(data: bytes) -> int:
+    """Decode a 4-byte header at every frame with int.from_bytes on a slice; returns the number of headers."""
+    headers = range(0, len(data) - 3, FRAME_BYTES)
+    for offset in headers:
+        int.from_bytes(data[offset:offset + 4], 'little')
+    return len(headers)
+
+
+def bytearray_concat_test(data: bytes) -> int:
+    """Assemble a message by appending every frame to a growing bytearray; returns its length."""
+    view = memoryview(data)
+    output = bytearray()
+    for offset in range(0, len(data), FRAME_BYTES):
+        output += view[offset:offset + FRAME_BYTES]
+    return len(output)
+
+
+def preallocated_write_test(data: bytes) -> int:
+    """Assemble a message by writing every frame into a preallocated bytearray; returns its length."""
+    view = memoryview(data)
+    output = bytearray(len(data))
+    for offset in range(0, len(data), FRAME_BYTES):
+        output[offset:offset + FRAME_BYTES] = view[offset:offset + FRAME_BYTES]
+    return len(output)
+
+
+def readinto_test(path: str, buffer: bytearray) -> int:
+    """Read a file through one reused buffer with unbuffered readinto; returns the bytes read."""
+    read = 0
+    with open(path, 'rb', buffering=0) as file:
+        while True:
+            count = file.readinto(buffer)
+            if not count:
+                return read
+            read += count
+
+
+def array_frombytes_test(data: bytes) -> int:
+    """Load a message into an array of 32-bit unsigned ints; returns the number of values."""
+    values = array.array('I')
+    values.frombytes(data[:len(data) - len(data) % values.itemsize])
+    return len(values)
+
+
+# Operation -> function(data) for the operations that work on an in-memory message
+BUFFER_OPERATIONS: Dict[str, Callable[[bytes], int]] = {
+    'bytes_slice': bytes_slice_test,
+    'memoryview_slice': memoryview_slice_test,
+    'struct_unpack_from': struct_unpack_from_test,
+    'int_from_bytes': int_from_bytes_test,
+    'bytearray_concat': bytearray_concat_test,
+    'preallocated_write': preallocated_write_test,
+    'array_frombytes': array_frombytes_test,
+}
+
+# Every operation, including readinto, which reads the message from a temporary file
+BUFFER_ALL_OPERATIONS = [*BUFFER_OPERATIONS, 'readinto']
+
+
+def _slice_copies(data: bytes, starts: range, length: int) -> int:
+    """Bytes copied by slicing `length` bytes of data at each start; a slice that is data itself copies nothing."""
+    copied = 0
+    for offset in starts:
+        piece = data[offset:offset + length]
+        if piece is not data:
+            copied += len(piece)
+    return copied
+
+
+def _concat_copies(data: bytes) -> int:
+    """
+    Bytes copied by bytearray_concat_test: every frame, plus the bytes
+    written so far whenever the bytearray's allocation (sys.getsizeof) grows.
+    realloc can sometimes grow a block in place, so this is an upper bound.
+    """
+    view = memoryview(data)
+    output = bytearray()
+    allocated = sys.getsizeof(output)
+    copied = 0
+    for offset in range(0, len(data), FRAME_BYTES):
+        written = len(output)
+        output += view[offset:offset + FRAME_BYTES]
+        copied += len(output) - written
+        if sys.getsizeof(output) != allocated:
+            allocated = sys.getsizeof(output)
+            copied += written
+    return copied
+
+
+# Operation -> function(data) returning the bytes that operation copies out of the message.
+# memoryview slices and struct.unpack_from read the message in place; the
+# preallocated write, readinto and frombytes copy each byte once.
+_BUFFER_COPIES: Dict[str, Callable[[bytes], int]] = {
+    'bytes_slice': lambda data: _slice_copies(data, range(0, len(data), FRAME_BYTES), FRAME_BYTES),
+    'memoryview_slice': lambda data: 0,
+    'struct_unpack_from': lambda data: 0,
+    'int_from_bytes': lambda data: _slice_copies(data, range(0, len(data) - 3, FRAME_BYTES), 4),
+    'bytearray_concat': _concat_copies,
+    'preallocated_write': len,
+    'array_frombytes': lambda data: len(data) - len(data) % array.array('I').itemsize,
+    'readinto': len,
+}
+
+
+def count_copies(operation: str, size: int) -> int:
+    """
+    Count the bytes an operation copies for a `size`-byte message, in a separate untimed pass.
+
+    Args:
+        operation: One of BUFFER_ALL_OPERATIONS
+        size: Message size in bytes
+
+    Returns:
+        Bytes copied out of the message
+    """
+    return _BUFFER_COPIES[operation](bytes(size))
+
+
+def make_message(size: int, seed: int = 0) -> bytes:
+    """Generate a reproducible random message of `size` bytes."""
+    return random.Random(seed).randbytes(size)
+
+
+def prepare_buffer(operation: str, size: int) -> Tuple[Callable, tuple]:
+    """
+    Build the message for an in-memory buffer operation, outside the timed region.
+
+    Args:
+        operation: Key into BUFFER_OPERATIONS
+        size: Message size in bytes
+
+    Returns:
+        Tuple of (function, args) to time
+    """
+    return BUFFER_OPERATIONS[operation], (make_message(size),)
+
+
+@contextlib.contextmanager
+def readinto_fixture(size: int) -> Iterator[Tuple[Callable, tuple]]:
+    """
+    Write the message to a temporary file and allocate the read buffer, outside the timed region.
+
+    Args:
+        size: Message size in bytes
+
+    Yields:
+        Tuple of (readinto_test, args) to time; the file is removed on exit
+    """
+    fd, path = tempfile.mkstemp(prefix='buffer_test_')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(make_message(size))
+        yield readinto_test, (path, bytearray(READ_CHUNK_BYTES))
+    finally:
+        os.remove(path)
+
+
+def run_buffer_benchmark(operation: str = 'memoryview_slice', size: int = 65536, repeats: int = 1) -> dict:
+    """
+    Run binary buffer benchmark.
+
+    Args:
+        operation: One of BUFFER_ALL_OPERATIONS (default: 'memoryview_slice')
+        size: Message size in bytes (default: 65536)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results, with 'metrics' giving the
+        bytes copied per sample (see count_copies), copies per message byte
+        and throughput
+    """
+    name = f"Buffer [{operation}] ({size:,} bytes)"
+    if operation == 'readinto':
+        with readinto_fixture(size) as (func, args):
+            results = run_benchmark(name, func, *args, repeats=repeats)
+    elif operation in BUFFER_OPERATIONS:
+        func, args = prepare_buffer(operation, size)
+        results = run_benchmark(name, func, *args, repeats=repeats)
+    else:
+        raise ValueError(f"Unknown buffer operation: {operation!r}")
+
+    median = results['statistics']['median']
+    copied = count_copies(operation, size)
+    results['metrics'] = {
+        'bytes_copied': copied,
+        'copies_per_byte': copied / size if size else None,
+        'bytes_per_s': size / median if median else None,
+    }
+    return results
@@ -0,0 +1,65 @@
+"""
+Unit tests for the zero-copy binary buffer benchmarks (buffer_test).
+"""
+
+import pytest
+
+from tests.buffer_test import (
+    BUFFER_ALL_OPERATIONS,
+    BUFFER_OPERATIONS,
+    FRAME_BYTES,
+    count_copies,
+    make_message,
+    readinto_fixture,
+    run_buffer_benchmark,
+)
+
+
+def test_every_operation_walks_the_whole_message() -> None:
+    """Each operation processes every frame, header or byte of a message that is not whole frames."""
+    data = make_message(10 * FRAME_BYTES + 5)
+    expected = {'bytes_slice': 11, 'memoryview_slice': 11, 'struct_unpack_from': 11, 'int_from_bytes': 11,
+                'bytearray_concat': len(data), 'preallocated_write': len(data), 'array_frombytes': len(data) // 4}
+    assert {operation: func(data) for operation, func in BUFFER_OPERATIONS.items()} == expected
+    with readinto_fixture(len(data)) as (func, args):
+        assert func(*args) == len(data)
+
+
+def test_copy_counts() -> None:
+    """memoryview slicing copies nothing, bytes slicing copies every byte, and growing output copies more."""
+    size = 1000 * FRAME_BYTES
+    assert count_copies('memoryview_slice', size) == 0
+    assert count_copies('struct_unpack_from', size) == 0
+    assert count_copies('bytes_slice', size) == size
+    assert count_copies('int_from_bytes', size) == 1000 * 4
+    assert count_copies('preallocated_write', size) == size
+    assert count_copies('bytearray_concat', size) > count_copies('preallocated_write', size)
+
+
+def test_run_buffer_benchmark_reports_the_copy_count() -> None:
+    """The bytes_copied metric is count_copies for the operation and size."""
+    for operation in ['memoryview_slice', 'bytes_slice', 'readinto']:
+        results = run_buffer_benchmark(operation, 10 * FRAME_BYTES)
+        assert results['metrics']['bytes_copied'] == count_copies(operation, 10 * FRAME_BYTES)
+        assert results['metrics']['copies_per_byte'] == (0 if operation == 'memoryview_slice' else 1)
+
+
+def test_make_message_is_reproducible() -> None:
+    """The same size and seed give the same message."""
+    assert make_message(100) == make_message(100)
+    assert make_message(100, seed=1) != make_message(100)
+    assert len(make_message(100)) == 100
+
+
+def test_run_buffer_benchmark_reports_metrics() -> None:
+    """Every operation reports bytes copied, copies per byte and throughput."""
+    for operation in BUFFER_ALL_OPERATIONS:
+        results = run_buffer_benchmark(operation, 4 * FRAME_BYTES, repeats=2)
+        assert results['repeats'] == 2
+        assert set(results['metrics']) == {'bytes_copied', 'copies_per_byte', 'bytes_per_s'}
+
+
+def test_unknown_operation_is_rejected() -> None:
+    """An operation outside BUFFER_ALL_OPERATIONS raises ValueError."""
+    with pytest.raises(ValueError):
+        run_buffer_benchmark('mmap', 1024)
@@ -0,0 +1,14 @@
+"""
+pytest configuration for the benchmark suite entry points.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --bench-profile option that selects the sizes to collect."""
+    parser.addoption(
+        "--bench-profile",
+        default="full",
+        help="Benchmark profile (smoke, ci, full or a TOML path) whose sizes are collected (default: full)",
+    )
@@ -0,0 +1,194 @@
+"""
+Thread-pool dispatch overhead benchmark tests.
+
+concurrent_futures_cpu_test starts a pool per sample and submits one task per
+thread, so start-up, dispatch and work are measured together. These tests
+separate them: pool creation and teardown are timed on their own, and a fixed
+amount of cpu_intensive_task work is split into anywhere from a few large
+tasks to millions of tiny ones and dispatched to a warm, reused pool with
+submit, map or chunked map.
+"""
+
+import concurrent.futures
+import contextlib
+import statistics
+import threading
+import time
+from typing import Callable, Iterator, List, Tuple
+from .base_test import run_benchmark, time_function
+from .multithread_test import cpu_intensive_task
+
+# Dispatch methods compared by dispatch_test
+DISPATCH_METHODS = ['submit', 'map', 'chunked_map']
+
+# Workers in the warm pool
+DISPATCH_POOL_WORKERS = 4
+
+# cpu_intensive_task iterations per sample, split evenly across the tasks
+DISPATCH_TOTAL_ITERATIONS = 1_000_000
+
+# Chunks per worker for chunked_map
+DISPATCH_CHUNKS_PER_WORKER = 4
+
+
+def _run_chunk(task_ids: range, iterations: int) -> int:
+    """Run a batch of tasks on one worker; returns the sum of their results."""
+    return sum(cpu_intensive_task(task_id, iterations) for task_id in task_ids)
+
+
+def _start_workers(executor: concurrent.futures.ThreadPoolExecutor, workers: int) -> None:
+    """
+    Make the pool spawn all its threads.
+
+    Threads start lazily and idle ones are reused, so each of the `workers`
+    tasks waits on a shared barrier until all of them are running.
+    """
+    barrier = threading.Barrier(workers)
+    futures = [executor.submit(barrier.wait, 10) for _ in range(workers)]
+    for future in futures:
+        future.result()
+
+
+def serial_dispatch_test(tasks: int, iterations: int) -> int:
+    """Run every task inline on the calling thread, as the no-dispatch baseline."""
+    return _run_chunk(range(tasks), iterations)
+
+
+def dispatch_test(executor: concurrent.futures.ThreadPoolExecutor, method: str, tasks: int,
+                  iterations: int, workers: int = DISPATCH_POOL_WORKERS) -> int:
+    """
+    Dispatch tasks to a warm pool and wait for all of them.
+
+    ThreadPoolExecutor.map ignores its chunksize argument, so chunked_map
+    maps a batch function over workers * DISPATCH_CHUNKS_PER_WORKER ranges of
+    task IDs instead.
+
+    Args:
+        executor: Running thread pool
+        method: One of DISPATCH_METHODS
+        tasks: Number of tasks
+        iterations: cpu_intensive_task iterations per task
+        workers: Pool size, used to size the chunks
+
+    Returns:
+        Sum of the task results
+    """
+    if method == 'submit':
+        futures = [executor.submit(cpu_intensive_task, task_id, iterations) for task_id in range(tasks)]
+        return sum(future.result() for future in futures)
+    if method == 'map':
+        return sum(executor.map(cpu_intensive_task, range(tasks), [iterations] * tasks))
+    if method == 'chunked_map':
+        chunk = -(-tasks // (workers * DISPATCH_CHUNKS_PER_WORKER))
+        chunks = [range(start, min(start + chunk, tasks)) for start in range(0, tasks, chunk)]
+        return sum(executor.map(_run_chunk, chunks, [iterations] * len(chunks)))
+    raise ValueError(f"Unknown dispatch method: {method!r}")
+
+
+def pool_lifecycle_test(workers: int) -> Tuple[float, float]:
+    """
+    Test creating a pool, starting all its threads, and shutting it down.
+
+    Creation includes spawning every worker thread (see _start_workers).
+
+    Args:
+        workers: Pool size
+
+    Returns:
+        Tuple of (creation seconds, teardown seconds)
+    """
+    start_time = time.perf_counter_ns()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    _start_workers(executor, workers)
+    created = time.perf_counter_ns()
+    executor.shutdown(wait=True)
+    return (created - start_time) / 1e9, (time.perf_counter_ns() - created) / 1e9
+
+
+@contextlib.contextmanager
+def dispatch_fixture(method: str, tasks: int, workers: int = DISPATCH_POOL_WORKERS,
+                     total_iterations: int = DISPATCH_TOTAL_ITERATIONS) -> Iterator[Tuple[Callable, tuple]]:
+    """
+    Start a pool and all its threads, outside the timed region.
+
+    Args:
+        method: One of DISPATCH_METHODS
+        tasks: Number of tasks the work is split into
+        workers: Pool size
+        total_iterations: Work per sample
+
+    Yields:
+        Tuple of (dispatch_test, args) to time; the pool shuts down on exit
+    """
+    if method not in DISPATCH_METHODS:
+        raise ValueError(f"Unknown dispatch method: {method!r}")
+    iterations = max(1, total_iterations // tasks)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        _start_workers(executor, workers)
+        yield dispatch_test, (executor, method, tasks, iterations, workers)
+
+
+def run_dispatch_benchmark(method: str = 'submit', tasks: int = 1000, repeats: int = 1,
+                           workers: int = DISPATCH_POOL_WORKERS,
+                           total_iterations: int = DISPATCH_TOTAL_ITERATIONS) -> dict:
+    """
+    Run thread-pool dispatch benchmark on a warm pool.
+
+    Args:
+        method: One of DISPATCH_METHODS (default: 'submit')
+        tasks: Number of tasks the work is split into (default: 1000)
+        repeats: Number of times to repeat the test (default: 1)
+        workers: Pool size (default: DISPATCH_POOL_WORKERS)
+        total_iterations: Work per sample (default: DISPATCH_TOTAL_ITERATIONS)
+
+    Returns:
+        Dictionary containing benchmark results, with 'metrics' giving the
+        time per task, the serial (no pool) baseline, the speedup over it,
+        and the dispatch overhead per task: the median time to dispatch and
+        collect the same number of tasks that do no work
+    """
+    iterations = max(1, total_iterations // tasks)
+    with dispatch_fixture(method, tasks, workers, total_iterations) as (func, args):
+        results = run_benchmark(
+            f"Thread Pool Dispatch [{method}] ({tasks:,} tasks x {iterations:,} iter, {workers} workers)",
+            func, *args, repeats=repeats)
+        executor = args[0]
+        noop = run_benchmark(f"Thread Pool Dispatch [{method}] ({tasks:,} no-op tasks)",
+                             dispatch_test, executor, method, tasks, 0, workers, repeats=repeats)
+
+    # Warm the serial baseline up once, as the pool was, and take the median of as many runs
+    time_function(serial_dispatch_test, tasks, iterations)
+    serial = run_benchmark("Serial Dispatch Baseline", serial_dispatch_test, tasks, iterations, repeats=repeats)
+
+    median = results['statistics']['median']
+    serial_time = serial['statistics']['median']
+    results['metrics'] = {
+        'iterations_per_task': iterations,
+        'ns_per_task': median / tasks * 1e9,
+        'serial_s': serial_time,
+        'speedup': serial_time / median if median else None,
+        'overhead_ns_per_task': noop['statistics']['median'] / tasks * 1e9,
+    }
+    return results
+
+
+def run_pool_lifecycle_benchmark(workers: int = DISPATCH_POOL_WORKERS, repeats: int = 1) -> dict:
+    """
+    Run thread-pool creation and teardown benchmark.
+
+    Args:
+        workers: Pool size (default: DISPATCH_POOL_WORKERS)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results for creation plus teardown,
+        with 'metrics' giving the median of each part
+    """
+    results = run_benchmark(f"Thread Pool Lifecycle ({workers} workers)",
+                            pool_lifecycle_test, workers, repeats=repeats)
+    phases: List[Tuple[float, float]] = results['all_results']
+    results['metrics'] = {
+        'create_s': statistics.median(create for create, _ in phases),
+        'teardown_s': statistics.median(teardown for _, teardown in phases),
+    }
+    return results
@@ -0,0 +1,47 @@
+"""
+Unit tests for the thread-pool dispatch benchmarks (dispatch_test).
+"""
+
+import pytest
+
+from tests.dispatch_test import (
+    DISPATCH_METHODS,
+    dispatch_fixture,
+    pool_lifecycle_test,
+    run_dispatch_benchmark,
+    run_pool_lifecycle_benchmark,
+    serial_dispatch_test,
+)
+
+
+def test_every_method_matches_the_serial_result() -> None:
+    """submit, map and chunked map run every task once, so they sum to the serial result."""
+    expected = serial_dispatch_test(37, 10)
+    for method in DISPATCH_METHODS:
+        with dispatch_fixture(method, 37, workers=2, total_iterations=370) as (func, args):
+            assert func(*args) == expected
+
+
+def test_run_dispatch_benchmark_reports_metrics() -> None:
+    """The metrics give the work split, the serial baseline and the dispatch overhead."""
+    results = run_dispatch_benchmark('chunked_map', 100, repeats=2, workers=2, total_iterations=1000)
+
+    assert results['result'] == serial_dispatch_test(100, 10)
+    assert set(results['metrics']) == {'iterations_per_task', 'ns_per_task', 'serial_s', 'speedup',
+                                       'overhead_ns_per_task'}
+    assert results['metrics']['iterations_per_task'] == 10
+
+
+def test_pool_lifecycle_reports_both_phases() -> None:
+    """Creation and teardown are each timed and reported as medians."""
+    create_s, teardown_s = pool_lifecycle_test(2)
+    assert create_s > 0 and teardown_s > 0
+
+    results = run_pool_lifecycle_benchmark(2, repeats=2)
+    assert set(results['metrics']) == {'create_s', 'teardown_s'}
+
+
+def test_unknown_method_is_rejected() -> None:
+    """A method outside DISPATCH_METHODS raises ValueError."""
+    with pytest.raises(ValueError):
+        run_dispatch_benchmark('apply_async', 10)
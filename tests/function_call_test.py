@@ -2,6 +2,9 @@
 Function call overhead benchmark test.
 """
 
+import functools
+import operator
+from typing import Any, Callable, Dict
 from .base_test import run_benchmark
 
 
@@ -25,6 +28,295 @@ def function_call_overhead_test(iterations: int) -> int:
     return result
 
 
+def _add_one(x: int) -> int:
+    """Module-level call target shared by the call-convention variants."""
+    return x + 1
+
+
+def _add_step(x: int, step: int = 1) -> int:
+    """Call target with a default argument."""
+    return x + step
+
+
+def _forward_args(*args: Any) -> int:
+    """Forward positional arguments to the call target."""
+    return _add_one(*args)
+
+
+def _forward_kwargs(**kwargs: Any) -> int:
+    """Forward keyword arguments to the call target."""
+    return _add_one(**kwargs)
+
+
+def _passthrough(func: Callable) -> Callable:
+    """Typical framework decorator: a functools.wraps wrapper around func."""
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@_passthrough
+def _decorated_add_one(x: int) -> int:
+    """Call target wrapped by a functools.wraps decorator."""
+    return x + 1
+
+
+class Incrementer:
+    """Class providing the method-based call targets."""
+
+    step = 1
+
+    def add_one(self, x: int) -> int:
+        """Bound method call target."""
+        return x + self.step
+
+    @staticmethod
+    def static_add_one(x: int) -> int:
+        """Staticmethod call target."""
+        return x + 1
+
+    @classmethod
+    def class_add_one(cls, x: int) -> int:
+        """Classmethod call target."""
+        return x + cls.step
+
+
+def positional_argument_test(iterations: int) -> int:
+    """
+    Test calls passing the argument positionally to a module-level function.
+
+    The baseline for the call-convention variants, which all call module-level
+    or class-level targets, unlike the nested closure called by
+    function_call_overhead_test.
+
+    Args:
+        iterations: Number of function calls to make
+
+    Returns:
+        Sum of all function call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += _add_one(i)
+    return result
+
+
+def keyword_argument_test(iterations: int) -> int:
+    """
+    Test calls passing the argument by keyword.
+
+    Args:
+        iterations: Number of function calls to make
+
+    Returns:
+        Sum of all function call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += _add_one(x=i)
+    return result
+
+
+def default_argument_test(iterations: int) -> int:
+    """
+    Test calls that rely on a default argument value.
+
+    Args:
+        iterations: Number of function calls to make
+
+    Returns:
+        Sum of all function call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += _add_step(i)
+    return result
+
+
+def args_forwarding_test(iterations: int) -> int:
+    """
+    Test calls forwarded through a *args wrapper.
+
+    Args:
+        iterations: Number of function calls to make
+
+    Returns:
+        Sum of all function call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += _forward_args(i)
+    return result
+
+
+def kwargs_forwarding_test(iterations: int) -> int:
+    """
+    Test calls forwarded through a **kwargs wrapper.
+
+    Args:
+        iterations: Number of function calls to make
+
+    Returns:
+        Sum of all function call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += _forward_kwargs(x=i)
+    return result
+
+
+def bound_method_test(iterations: int) -> int:
+    """
+    Test bound method calls on an instance.
+
+    Args:
+        iterations: Number of method calls to make
+
+    Returns:
+        Sum of all method call results
+    """
+    incrementer = Incrementer()
+    result = 0
+    for i in range(iterations):
+        result += incrementer.add_one(i)
+    return result
+
+
+def staticmethod_test(iterations: int) -> int:
+    """
+    Test staticmethod calls through the class.
+
+    Args:
+        iterations: Number of method calls to make
+
+    Returns:
+        Sum of all method call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += Incrementer.static_add_one(i)
+    return result
+
+
+def classmethod_test(iterations: int) -> int:
+    """
+    Test classmethod calls through the class.
+
+    Args:
+        iterations: Number of method calls to make
+
+    Returns:
+        Sum of all method call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += Incrementer.class_add_one(i)
+    return result
+
+
+def lambda_test(iterations: int) -> int:
+    """
+    Test lambda calls.
+
+    Args:
+        iterations: Number of lambda calls to make
+
+    Returns:
+        Sum of all lambda call results
+    """
+    add_one = lambda x: x + 1  # noqa: E731
+    result = 0
+    for i in range(iterations):
+        result += add_one(i)
+    return result
+
+
+def partial_test(iterations: int) -> int:
+    """
+    Test calls through functools.partial.
+
+    Args:
+        iterations: Number of partial calls to make
+
+    Returns:
+        Sum of all partial call results
+    """
+    add_one = functools.partial(_add_step, step=1)
+    result = 0
+    for i in range(iterations):
+        result += add_one(i)
+    return result
+
+
+def builtin_function_test(iterations: int) -> int:
+    """
+    Test calls to a builtin C function (operator.add).
+
+    Args:
+        iterations: Number of builtin calls to make
+
+    Returns:
+        Sum of all builtin call results
+    """
+    add = operator.add
+    result = 0
+    for i in range(iterations):
+        result += add(i, 1)
+    return result
+
+
+def decorated_function_test(iterations: int) -> int:
+    """
+    Test calls through a functools.wraps decorator.
+
+    Args:
+        iterations: Number of decorated calls to make
+
+    Returns:
+        Sum of all decorated call results
+    """
+    result = 0
+    for i in range(iterations):
+        result += _decorated_add_one(i)
+    return result
+
+
+def methodcaller_test(iterations: int) -> int:
+    """
+    Test calls made via operator.methodcaller.
+
+    Args:
+        iterations: Number of methodcaller calls to make
+
+    Returns:
+        Sum of all methodcaller call results
+    """
+    increment = operator.methodcaller('__add__', 1)
+    result = 0
+    for i in range(iterations):
+        result += increment(i)
+    return result
+
+
+# Call-convention matrix: every variant computes sum(i + 1) so results can be cross-checked
+FUNCTION_CALL_VARIANTS: Dict[str, Callable[[int], int]] = {
+    'positional': positional_argument_test,
+    'keyword': keyword_argument_test,
+    'default': default_argument_test,
+    'args_forwarding': args_forwarding_test,
+    'kwargs_forwarding': kwargs_forwarding_test,
+    'bound_method': bound_method_test,
+    'staticmethod': staticmethod_test,
+    'classmethod': classmethod_test,
+    'lambda': lambda_test,
+    'partial': partial_test,
+    'builtin': builtin_function_test,
+    'decorated': decorated_function_test,
+    'methodcaller': methodcaller_test,
+}
+
+
 def run_function_call_benchmark(iterations: int = 100000, repeats: int = 1) -> dict:
     """
     Run function call overhead benchmark.
@@ -39,3 +331,22 @@ def run_function_call_benchmark(iterations: int = 100000, repeats: int = 1) -> d
     results = run_benchmark(f"Function Call Overhead ({iterations:,} calls)", 
                           function_call_overhead_test, iterations, repeats=repeats)
     return results
+
+
+def run_function_call_variant_benchmark(variant: str, iterations: int = 100000, repeats: int = 1) -> dict:
+    """
+    Run one call-convention variant of the function call benchmark.
+
+    Args:
+        variant: Key into FUNCTION_CALL_VARIANTS (e.g. 'keyword', 'partial')
+        iterations: Number of calls (default: 100000)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results
+    """
+    if variant not in FUNCTION_CALL_VARIANTS:
+        raise ValueError(f"Unknown function call variant: {variant!r}")
+    results = run_benchmark(f"Function Call [{variant}] ({iterations:,} calls)",
+                          FUNCTION_CALL_VARIANTS[variant], iterations, repeats=repeats)
+    return results
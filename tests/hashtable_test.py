@@ -0,0 +1,208 @@
+"""
+Hash-table workload benchmark tests.
+
+Large dict and set workloads: building tables of up to millions of entries,
+lookups at a given hit rate, delete/reinsert churn and concurrent reads from
+several threads, each with int, str, tuple and custom-__hash__ keys. Probe
+keys are freshly built objects equal to the stored ones, so lookups pay for
+hashing and comparison as a real index would, not an identity shortcut.
+"""
+
+import random
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+from .base_test import run_benchmark
+
+
+class HashKey:
+    """Key with a Python-level __hash__ and __eq__, like a user-defined record ID."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, HashKey) and self.value == other.value
+
+
+# Key type -> factory building the i-th key (equal inputs give equal, distinct objects)
+HASH_KEY_TYPES: Dict[str, Callable[[int], Any]] = {
+    'int': lambda i: i,
+    'str': lambda i: f"key:{i:010d}",
+    'tuple': lambda i: (i, i & 0xFF, 'k'),
+    'custom': HashKey,
+}
+
+# Operation -> lookup hit rate for the lookup operations
+HASH_LOOKUP_HIT_RATES = {'lookup_100': 1.0, 'lookup_50': 0.5, 'lookup_0': 0.0}
+
+HASH_OPERATIONS = ['build_dict', 'build_set', *HASH_LOOKUP_HIT_RATES, 'churn', 'threaded_read']
+
+# Reader threads for threaded_read
+HASH_READ_THREADS = 4
+
+
+def key_size(key: Any) -> int:
+    """
+    Deep size of a key in bytes: sys.getsizeof of the key plus, recursively,
+    of each tuple element or HashKey value. Objects shared between keys (small
+    ints, interned strings) are counted in every key that holds them.
+    """
+    size = sys.getsizeof(key)
+    if isinstance(key, tuple):
+        size += sum(key_size(item) for item in key)
+    elif isinstance(key, HashKey):
+        size += key_size(key.value)
+    return size
+
+
+def make_keys(key_type: str, count: int, start: int = 0) -> List[Any]:
+    """Build `count` keys of a key type, numbered from `start`."""
+    factory = HASH_KEY_TYPES[key_type]
+    return [factory(i) for i in range(start, start + count)]
+
+
+def make_probes(key_type: str, count: int, hit_rate: float, seed: int = 0) -> List[Any]:
+    """
+    Build lookup keys for a table holding keys 0..count-1.
+
+    Args:
+        key_type: Key into HASH_KEY_TYPES
+        count: Number of probes (and of keys in the table)
+        hit_rate: Fraction of probes present in the table
+        seed: Random seed for the probe order
+
+    Returns:
+        Probe keys in random order; misses are numbered from `count` up
+    """
+    rng = random.Random(seed)
+    factory = HASH_KEY_TYPES[key_type]
+    return [
+        factory(rng.randrange(count) if rng.random() < hit_rate else count + rng.randrange(count))
+        for _ in range(count)
+    ]
+
+
+def dict_build_test(keys: List[Any]) -> int:
+    """Build a dict by inserting keys one at a time; returns its size."""
+    table = {}
+    for index, key in enumerate(keys):
+        table[key] = index
+    return len(table)
+
+
+def set_build_test(keys: List[Any]) -> int:
+    """Build a set by adding keys one at a time; returns its size."""
+    table = set()
+    for key in keys:
+        table.add(key)
+    return len(table)
+
+
+def lookup_test(table: Dict[Any, int], probes: List[Any]) -> int:
+    """Look every probe up in the table; returns the number of hits."""
+    hits = 0
+    for key in probes:
+        if key in table:
+            hits += 1
+    return hits
+
+
+def churn_test(table: Dict[Any, int], keys: List[Any]) -> int:
+    """Delete and reinsert every key, leaving the table's contents unchanged; returns its size."""
+    for key in keys:
+        value = table.pop(key)
+        table[key] = value
+    return len(table)
+
+
+def threaded_read_test(table: Dict[Any, int], probes: List[Any], num_threads: int) -> int:
+    """
+    Look probes up from several threads at once, each taking a slice of the probes.
+
+    Args:
+        table: Shared table, only read
+        probes: Probe keys
+        num_threads: Number of reader threads
+
+    Returns:
+        Total number of hits
+    """
+    hits = []
+    chunk = -(-len(probes) // num_threads)
+
+    def reader(start: int):
+        hits.append(lookup_test(table, probes[start:start + chunk]))
+
+    threads = [threading.Thread(target=reader, args=(start,)) for start in range(0, len(probes), chunk)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(hits)
+
+
+def prepare_hashtable(operation: str, key_type: str, size: int) -> Tuple[Callable, tuple, Any]:
+    """
+    Build the keys, table and probes an operation needs, outside the timed region.
+
+    Args:
+        operation: One of HASH_OPERATIONS
+        key_type: Key into HASH_KEY_TYPES
+        size: Number of entries (and of operations per sample)
+
+    Returns:
+        Tuple of (function, args) to time and the populated table, for size metrics
+    """
+    if operation not in HASH_OPERATIONS:
+        raise ValueError(f"Unknown hash-table operation: {operation!r}")
+    if key_type not in HASH_KEY_TYPES:
+        raise ValueError(f"Unknown key type: {key_type!r}")
+
+    keys = make_keys(key_type, size)
+    if operation == 'build_set':
+        return set_build_test, (keys,), set(keys)
+
+    table = {key: index for index, key in enumerate(keys)}
+    if operation == 'build_dict':
+        return dict_build_test, (keys,), table
+    if operation == 'churn':
+        return churn_test, (table, keys), table
+    if operation == 'threaded_read':
+        return threaded_read_test, (table, make_probes(key_type, size, 1.0), HASH_READ_THREADS), table
+    return lookup_test, (table, make_probes(key_type, size, HASH_LOOKUP_HIT_RATES[operation])), table
+
+
+def run_hashtable_benchmark(operation: str = 'build_dict', key_type: str = 'int', size: int = 100000,
+                            repeats: int = 1) -> dict:
+    """
+    Run hash-table benchmark.
+
+    Args:
+        operation: One of HASH_OPERATIONS (default: 'build_dict')
+        key_type: Key into HASH_KEY_TYPES (default: 'int')
+        size: Entries in the table; each sample does this many operations (default: 100000)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results, with 'metrics' giving the
+        median latency per operation and the memory per entry of the table
+        itself (shallow) and of the keys (deep, see key_size)
+    """
+    func, args, table = prepare_hashtable(operation, key_type, size)
+    results = run_benchmark(f"Hash Table [{operation}, {key_type} keys] ({size:,})",
+                            func, *args, repeats=repeats)
+
+    sample_keys = list(table)[:1000]
+    key_bytes = sum(key_size(key) for key in sample_keys) / len(sample_keys) if sample_keys else 0.0
+    results['metrics'] = {
+        'ns_per_op': results['statistics']['median'] / size * 1e9 if size else None,
+        'table_bytes_per_entry': sys.getsizeof(table) / size if size else None,
+        'key_bytes_per_entry': key_bytes,
+    }
+    return results
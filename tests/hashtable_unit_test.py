@@ -0,0 +1,35 @@
+"""
+Unit tests for the hash-table benchmarks (hashtable_test).
+"""
+
+import sys
+
+from tests.hashtable_test import HashKey, key_size, make_keys, run_hashtable_benchmark
+
+
+def test_key_size_of_flat_keys_is_getsizeof() -> None:
+    """int and str keys have no referenced objects to add."""
+    for key_type in ['int', 'str']:
+        key = make_keys(key_type, 1, start=12345)[0]
+        assert key_size(key) == sys.getsizeof(key)
+
+
+def test_key_size_counts_tuple_elements() -> None:
+    """A tuple key's size includes each of its elements."""
+    key = (70000, 0x70, 'k')
+    assert key_size(key) == sys.getsizeof(key) + sum(sys.getsizeof(item) for item in key)
+
+
+def test_key_size_counts_custom_key_values() -> None:
+    """A HashKey's size includes its value, recursively."""
+    assert key_size(HashKey(70000)) == sys.getsizeof(HashKey(70000)) + sys.getsizeof(70000)
+    nested = HashKey((1, 'k'))
+    assert key_size(nested) == sys.getsizeof(nested) + key_size((1, 'k'))
+
+
+def test_key_bytes_metric_is_deep() -> None:
+    """The benchmark's key_bytes_per_entry for tuple keys is their mean deep size."""
+    results = run_hashtable_benchmark('build_dict', 'tuple', 100)
+    keys = make_keys('tuple', 100)
+    assert results['metrics']['key_bytes_per_entry'] == sum(key_size(key) for key in keys) / len(keys)
+    assert results['metrics']['key_bytes_per_entry'] > sys.getsizeof(keys[0])
@@ -0,0 +1,260 @@
+"""
+Data-parallel map-reduce benchmark tests.
+
+The multithread benchmarks give every worker its own independent task. Data-parallel
+code instead splits one large dataset into chunks, reduces each chunk on a
+worker and merges the partial results. These tests do that over a list, an
+array.array or a NumPy array of small integer keys. The reductions are a sum,
+a fixed-bin histogram and a group-by count into dicts. Chunks go to a warm
+pool of threads, processes or sub-interpreters. The map phase (slicing,
+shipping and reducing the chunks) and the merge phase are timed separately,
+so a chunk-size sweep shows where per-chunk overhead and merge cost take over.
+"""
+
+import array
+import concurrent.futures
+import contextlib
+import functools
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from .base_test import BenchmarkUnavailable, _calculate_statistics, time_function
+from .dispatch_test import _start_workers
+from .subinterpreter_test import _interpreter_pool, _require_interpreters
+
+try:
+    import numpy
+except ImportError:  # the numpy container is skipped
+    numpy = None
+
+# Input containers the dataset can be held in
+MAPREDUCE_CONTAINERS = ['list', 'array', 'numpy']
+
+# Pools the chunks are reduced on
+MAPREDUCE_BACKENDS = ['thread', 'process', 'interpreter']
+
+# Workers in the pool
+MAPREDUCE_WORKERS = 4
+
+# Dataset values are keys in range(MAPREDUCE_KEYS); group-by makes one group per key
+MAPREDUCE_KEYS = 1000
+
+# Equal-width bins the histogram reduction counts keys into
+MAPREDUCE_BINS = 64
+
+
+def sum_chunk(chunk) -> int:
+    """Sum a chunk of keys."""
+    return sum(chunk)
+
+
+def histogram_chunk(chunk) -> List[int]:
+    """Count a chunk of keys into MAPREDUCE_BINS equal-width bins."""
+    counts = [0] * MAPREDUCE_BINS
+    for key in chunk:
+        counts[key * MAPREDUCE_BINS // MAPREDUCE_KEYS] += 1
+    return counts
+
+
+def groupby_chunk(chunk) -> Dict[int, int]:
+    """Count how often each key occurs in a chunk."""
+    counts: Dict[int, int] = {}
+    for key in chunk:
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def numpy_sum_chunk(chunk) -> int:
+    """sum_chunk for a NumPy chunk."""
+    return int(chunk.sum())
+
+
+def numpy_histogram_chunk(chunk) -> List[int]:
+    """histogram_chunk for a NumPy chunk."""
+    return numpy.bincount(chunk * MAPREDUCE_BINS // MAPREDUCE_KEYS, minlength=MAPREDUCE_BINS).tolist()
+
+
+def numpy_groupby_chunk(chunk) -> Dict[int, int]:
+    """groupby_chunk for a NumPy chunk."""
+    keys, counts = numpy.unique(chunk, return_counts=True)
+    return dict(zip(keys.tolist(), counts.tolist()))
+
+
+def merge_sums(partials: List[int]) -> int:
+    """Merge per-chunk sums."""
+    return sum(partials)
+
+
+def merge_histograms(partials: List[List[int]]) -> List[int]:
+    """Merge per-chunk histograms bin by bin."""
+    return [sum(column) for column in zip(*partials)]
+
+
+def merge_groups(partials: List[Dict[int, int]]) -> Dict[int, int]:
+    """Merge per-chunk group counts into one dict."""
+    merged: Dict[int, int] = {}
+    for counts in partials:
+        for key, count in counts.items():
+            merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+# Reduction -> (chunk function for list/array, chunk function for NumPy, merge function)
+MAPREDUCE_REDUCTIONS: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    'sum': (sum_chunk, numpy_sum_chunk, merge_sums),
+    'histogram': (histogram_chunk, numpy_histogram_chunk, merge_histograms),
+    'groupby': (groupby_chunk, numpy_groupby_chunk, merge_groups),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def make_dataset(container: str, elements: int, seed: int = 0):
+    """
+    Generate a reproducible dataset of random keys, cached for the next variant.
+
+    Args:
+        container: One of MAPREDUCE_CONTAINERS
+        elements: Number of keys
+        seed: Random seed
+
+    Returns:
+        List of ints, array.array('q') or int64 NumPy array of keys in range(MAPREDUCE_KEYS)
+
+    Raises:
+        BenchmarkUnavailable: If the container is 'numpy' and NumPy is not installed
+    """
+    if container == 'numpy':
+        if numpy is None:
+            raise BenchmarkUnavailable("numpy is not installed")
+        return numpy.random.default_rng(seed).integers(0, MAPREDUCE_KEYS, elements, dtype=numpy.int64)
+    if container not in MAPREDUCE_CONTAINERS:
+        raise ValueError(f"Unknown map-reduce container: {container!r}")
+    # Draw from one list of key objects, so the list holds shared ints, as real keyed data does
+    keys = random.Random(seed).choices(list(range(MAPREDUCE_KEYS)), k=elements)
+    return keys if container == 'list' else array.array('q', keys)
+
+
+def _make_executor(backend: str, workers: int, container: str) -> concurrent.futures.Executor:
+    """Create a map-reduce pool for a backend and start its workers."""
+    if backend == 'thread':
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        _start_workers(executor, workers)
+        return executor
+    if backend == 'process':
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    elif backend == 'interpreter':
+        _require_interpreters()
+        if container == 'numpy':
+            raise BenchmarkUnavailable("numpy cannot be imported in sub-interpreters")
+        executor = _interpreter_pool(workers)
+    else:
+        raise ValueError(f"Unknown map-reduce backend: {backend!r}")
+    list(executor.map(bool, range(workers)))
+    return executor
+
+
+def mapreduce_test(executor: concurrent.futures.Executor, mapper: Callable, merger: Callable,
+                   data, chunk_size: int) -> Tuple[Any, float, float]:
+    """
+    Reduce a dataset chunk by chunk on a pool, then merge the partial results.
+
+    Args:
+        executor: Warm pool for the backend under test
+        mapper: Chunk function from MAPREDUCE_REDUCTIONS
+        merger: Merge function from MAPREDUCE_REDUCTIONS
+        data: Dataset from make_dataset
+        chunk_size: Keys per chunk
+
+    Returns:
+        Tuple of (merged result, map seconds, merge seconds). The map phase
+        covers slicing, sending and reducing every chunk and receiving the
+        partial results
+    """
+    start_time = time.perf_counter_ns()
+    futures = [executor.submit(mapper, data[start:start + chunk_size]) for start in range(0, len(data), chunk_size)]
+    partials = [future.result() for future in futures]
+    mapped = time.perf_counter_ns()
+    merged = merger(partials)
+    return merged, (mapped - start_time) / 1e9, (time.perf_counter_ns() - mapped) / 1e9
+
+
+@contextlib.contextmanager
+def mapreduce_fixture(reduction: str, container: str, backend: str, elements: int, chunk_size: int,
+                      workers: int = MAPREDUCE_WORKERS) -> Iterator[Tuple[Callable, tuple]]:
+    """
+    Generate the dataset and start the pool, outside the timed region.
+
+    Args:
+        reduction: Key into MAPREDUCE_REDUCTIONS
+        container: One of MAPREDUCE_CONTAINERS
+        backend: One of MAPREDUCE_BACKENDS
+        elements: Keys in the dataset
+        chunk_size: Keys per chunk
+        workers: Pool size
+
+    Yields:
+        Tuple of (mapreduce_test, args) to time; the pool shuts down on exit
+    """
+    if reduction not in MAPREDUCE_REDUCTIONS:
+        raise ValueError(f"Unknown map-reduce reduction: {reduction!r}")
+    if backend not in MAPREDUCE_BACKENDS:
+        raise ValueError(f"Unknown map-reduce backend: {backend!r}")
+    python_mapper, numpy_mapper, merger = MAPREDUCE_REDUCTIONS[reduction]
+    mapper = numpy_mapper if container == 'numpy' else python_mapper
+
+    data = make_dataset(container, elements)
+    with _make_executor(backend, workers, container) as executor:
+        yield mapreduce_test, (executor, mapper, merger, data, chunk_size)
+
+
+def run_mapreduce_benchmark(reduction: str = 'sum', container: str = 'list', backend: str = 'thread',
+                            elements: int = 1_000_000, chunk_size: int = 100_000, repeats: int = 1,
+                            workers: int = MAPREDUCE_WORKERS) -> dict:
+    """
+    Run data-parallel map-reduce benchmark on a warm pool.
+
+    Args:
+        reduction: Key into MAPREDUCE_REDUCTIONS (default: 'sum')
+        container: One of MAPREDUCE_CONTAINERS (default: 'list')
+        backend: One of MAPREDUCE_BACKENDS (default: 'thread')
+        elements: Keys in the dataset (default: 1,000,000)
+        chunk_size: Keys per chunk (default: 100,000)
+        repeats: Number of times to repeat the test (default: 1)
+        workers: Pool size (default: MAPREDUCE_WORKERS)
+
+    Returns:
+        Dictionary in the same shape as run_benchmark's (timing map plus
+        merge), plus 'metrics' with the median map and merge times, the
+        merge's share of the total, the serial (single call, no pool)
+        baseline (median of as many warm runs) and the speedup over it
+    """
+    with mapreduce_fixture(reduction, container, backend, elements, chunk_size, workers) as (func, args):
+        # Warm the serial baseline up once, as the pool was, and take the median of as many runs
+        _, mapper, _, data, _ = args
+        time_function(mapper, data)
+        serial_time = statistics.median(time_function(mapper, data)[1] for _ in range(repeats))
+        samples = [func(*args) for _ in range(repeats)]
+
+    execution_times = [map_s + merge_s for _, map_s, merge_s in samples]
+    stats = _calculate_statistics(execution_times)
+    map_s = statistics.median(map_s for _, map_s, _ in samples)
+    merge_s = statistics.median(merge_s for _, _, merge_s in samples)
+    return {
+        'name': (f"Map-Reduce [{reduction}, {container}, {backend}] "
+                 f"({elements:,} keys in {chunk_size:,}-key chunks, {workers} workers)"),
+        'repeats': repeats,
+        'result': elements,
+        'all_results': [elements] * repeats,
+        'execution_times': execution_times,
+        'statistics': stats,
+        'metrics': {
+            'chunks': -(-elements // chunk_size),
+            'map_s': map_s,
+            'merge_s': merge_s,
+            'merge_fraction': merge_s / (map_s + merge_s) if map_s + merge_s else None,
+            'serial_s': serial_time,
+            'speedup': serial_time / stats['median'] if stats.get('median') else None,
+        },
+        'timestamp': time.time()
+    }
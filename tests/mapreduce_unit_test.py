@@ -0,0 +1,56 @@
+"""
+Unit tests for the data-parallel map-reduce benchmarks (mapreduce_test).
+
+Only the thread backend is used, so these run without sub-interpreters and
+without spawning processes.
+"""
+
+import pytest
+
+from tests.mapreduce_test import (
+    MAPREDUCE_CONTAINERS,
+    MAPREDUCE_KEYS,
+    MAPREDUCE_REDUCTIONS,
+    make_dataset,
+    mapreduce_fixture,
+    numpy,
+    run_mapreduce_benchmark,
+)
+
+CONTAINERS = [container for container in MAPREDUCE_CONTAINERS if container != 'numpy' or numpy is not None]
+
+
+def test_chunked_reductions_match_one_serial_call() -> None:
+    """Merging per-chunk results gives what the chunk function returns for the whole dataset."""
+    for reduction in MAPREDUCE_REDUCTIONS:
+        for container in CONTAINERS:
+            with mapreduce_fixture(reduction, container, 'thread', 1000, 300, workers=2) as (func, args):
+                _, mapper, merger, data, _ = args
+                merged, map_s, merge_s = func(*args)
+                assert merged == merger([mapper(data)])
+                assert map_s > 0 and merge_s >= 0
+
+
+def test_containers_hold_the_same_keys() -> None:
+    """Every container holds the same reproducible keys in range(MAPREDUCE_KEYS)."""
+    keys = list(make_dataset('list', 500))
+    assert list(make_dataset('array', 500)) == keys
+    assert all(0 <= key < MAPREDUCE_KEYS for key in keys)
+
+
+def test_run_mapreduce_benchmark_reports_metrics() -> None:
+    """The metrics split the time into map and merge and compare it with the serial baseline."""
+    results = run_mapreduce_benchmark('groupby', 'list', 'thread', 1000, 300, repeats=2, workers=2)
+
+    metrics = results['metrics']
+    assert set(metrics) == {'chunks', 'map_s', 'merge_s', 'merge_fraction', 'serial_s', 'speedup'}
+    assert metrics['chunks'] == 4
+    assert 0 <= metrics['merge_fraction'] <= 1
+
+
+def test_unknown_variants_are_rejected() -> None:
+    """An unknown reduction, container or backend raises ValueError."""
+    for reduction, container, backend in [('median', 'list', 'thread'), ('sum', 'tuple', 'thread'),
+                                          ('sum', 'list', 'gpu')]:
+        with pytest.raises(ValueError):
+            run_mapreduce_benchmark(reduction, container, backend, 100, 10)
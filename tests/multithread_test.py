@@ -145,6 +145,48 @@ def concurrent_futures_io_test(num_threads: int, duration_per_task: float) -> Li
     return results
 
 
+def process_pool_cpu_test(num_processes: int, iterations_per_process: int) -> List[int]:
+    """
+    Test ProcessPoolExecutor performance with CPU-intensive tasks.
+    
+    Args:
+        num_processes: Number of worker processes to spawn
+        iterations_per_process: Number of iterations per process
+        
+    Returns:
+        List of results from all processes
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_processes) as executor:
+        futures = [
+            executor.submit(cpu_intensive_task, i, iterations_per_process)
+            for i in range(num_processes)
+        ]
+        results = [future.result() for future in futures]
+    
+    return results
+
+
+def process_pool_io_test(num_processes: int, duration_per_task: float) -> List[int]:
+    """
+    Test ProcessPoolExecutor performance with I/O-intensive tasks.
+    
+    Args:
+        num_processes: Number of worker processes to spawn
+        duration_per_task: Duration of each I/O task
+        
+    Returns:
+        List of results from all processes
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_processes) as executor:
+        futures = [
+            executor.submit(io_intensive_task, i, duration_per_task)
+            for i in range(num_processes)
+        ]
+        results = [future.result() for future in futures]
+    
+    return results
+
+
 def run_multithread_cpu_benchmark(num_threads: int = 4, iterations_per_thread: int = 100000, repeats: int = 1) -> dict:
     """
     Run multi-threading CPU benchmark.
@@ -211,3 +253,37 @@ def run_concurrent_futures_io_benchmark(num_threads: int = 4, duration_per_task:
     results = run_benchmark(f"Concurrent Futures I/O ({num_threads} threads, {duration_per_task}s/task)", 
                           concurrent_futures_io_test, num_threads, duration_per_task, repeats=repeats)
     return results
+
+
+def run_process_pool_cpu_benchmark(num_processes: int = 4, iterations_per_process: int = 100000, repeats: int = 1) -> dict:
+    """
+    Run ProcessPoolExecutor CPU benchmark.
+    
+    Args:
+        num_processes: Number of worker processes to spawn (default: 4)
+        iterations_per_process: Number of iterations per process (default: 100000)
+        repeats: Number of times to repeat the test (default: 1)
+        
+    Returns:
+        Dictionary containing benchmark results
+    """
+    results = run_benchmark(f"Process Pool CPU ({num_processes} processes, {iterations_per_process:,} iter/process)", 
+                          process_pool_cpu_test, num_processes, iterations_per_process, repeats=repeats)
+    return results
+
+
+def run_process_pool_io_benchmark(num_processes: int = 4, duration_per_task: float = 0.01, repeats: int = 1) -> dict:
+    """
+    Run ProcessPoolExecutor I/O benchmark.
+    
+    Args:
+        num_processes: Number of worker processes to spawn (default: 4)
+        duration_per_task: Duration of each I/O task in seconds (default: 0.01)
+        repeats: Number of times to repeat the test (default: 1)
+        
+    Returns:
+        Dictionary containing benchmark results
+    """
+    results = run_benchmark(f"Process Pool I/O ({num_processes} processes, {duration_per_task}s/task)", 
+                          process_pool_io_test, num_processes, duration_per_task, repeats=repeats)
+    return results
@@ -0,0 +1,299 @@
+"""
+Producer/consumer pipeline benchmark tests.
+
+A producer feeds messages through a chain of stages connected by queues; each
+stage has `fan_out` workers that run cpu_intensive_task on every message and
+pass it on, and a sink collects the results. The same pipeline runs over
+several queue implementations, so the numbers show what the queue and worker
+model cost on top of the multithread CPU work.
+
+The producer is closed-loop: it keeps at most one message in flight per
+worker (stages x fan_out) and sends the next one only when the sink has
+received an earlier one. Queues therefore never build a backlog, and the
+latency percentiles measure a message's transit through the pipeline rather
+than how long it waited behind the rest of the flow.
+"""
+
+import asyncio
+import collections
+import contextlib
+import functools
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from .base_test import _calculate_statistics, _percentiles
+from .multithread_test import cpu_intensive_task
+
+# Queue implementations the pipeline can run over
+PIPELINE_QUEUE_KINDS = ['queue', 'simple_queue', 'deque', 'asyncio', 'multiprocessing']
+
+# cpu_intensive_task iterations each stage spends on every message
+PIPELINE_STAGE_ITERATIONS = 1000
+
+# Worker processes are spawned so the pipeline behaves the same on every platform
+_MP_CONTEXT = multiprocessing.get_context('spawn')
+
+
+class ConditionDeque:
+    """Unbounded FIFO built from collections.deque and a threading.Condition."""
+
+    def __init__(self):
+        self._items = collections.deque()
+        self._ready = threading.Condition()
+
+    def put(self, item: Any) -> None:
+        with self._ready:
+            self._items.append(item)
+            self._ready.notify()
+
+    def get(self) -> Any:
+        with self._ready:
+            while not self._items:
+                self._ready.wait()
+            return self._items.popleft()
+
+
+def _make_queue(kind: str) -> Any:
+    """Create one inter-stage queue of the given kind."""
+    if kind == 'queue':
+        return queue.Queue()
+    if kind == 'simple_queue':
+        return queue.SimpleQueue()
+    if kind == 'deque':
+        return ConditionDeque()
+    if kind == 'multiprocessing':
+        return _MP_CONTEXT.Queue()
+    raise ValueError(f"Unknown pipeline queue kind: {kind!r}")
+
+
+def _stage_worker(inbox: Any, outbox: Any, stage_iterations: int, ready: Any) -> None:
+    """Pipeline stage worker: process messages from inbox until a None sentinel."""
+    ready.wait()
+    while True:
+        message = inbox.get()
+        if message is None:
+            return
+        cpu_intensive_task(message[0], stage_iterations)
+        outbox.put(message)
+
+
+def _blocking_flow(queues: List[Any], in_flight: int, messages: int, payload: bytes) -> Dict[str, Any]:
+    """Send messages into the first queue from a producer thread, in_flight at a time, and collect them from the last."""
+    slots = threading.Semaphore(in_flight)
+
+    def produce():
+        inbox = queues[0]
+        for seq in range(messages):
+            slots.acquire()
+            inbox.put((seq, time.perf_counter_ns(), payload))
+
+    producer = threading.Thread(target=produce)
+    start_time = time.perf_counter_ns()
+    producer.start()
+    sink = queues[-1]
+    latencies = []
+    for _ in range(messages):
+        _, sent, _ = sink.get()
+        latencies.append(time.perf_counter_ns() - sent)
+        slots.release()
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
+    producer.join()
+    return {'elapsed': elapsed, 'latencies_ns': latencies}
+
+
+@contextlib.contextmanager
+def _blocking_pipeline(kind: str, stages: int, fan_out: int, stage_iterations: int) -> Iterator[Callable]:
+    """Start thread workers, or process workers for multiprocessing.Queue, and yield a flow(messages, payload)."""
+    queues = [_make_queue(kind) for _ in range(stages + 1)]
+    if kind == 'multiprocessing':
+        ready = _MP_CONTEXT.Barrier(stages * fan_out + 1)
+        worker_type = _MP_CONTEXT.Process
+    else:
+        ready = threading.Barrier(stages * fan_out + 1)
+        worker_type = threading.Thread
+
+    workers = [
+        worker_type(target=_stage_worker, args=(queues[stage], queues[stage + 1], stage_iterations, ready))
+        for stage in range(stages)
+        for _ in range(fan_out)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        ready.wait()
+        yield functools.partial(_blocking_flow, queues, stages * fan_out)
+    finally:
+        for stage in range(stages):
+            for _ in range(fan_out):
+                queues[stage].put(None)
+        for worker in workers:
+            worker.join()
+        if kind == 'multiprocessing':
+            for stage_queue in queues:
+                stage_queue.close()
+
+
+async def _async_stage_worker(inbox: asyncio.Queue, outbox: asyncio.Queue, stage_iterations: int) -> None:
+    """Asyncio pipeline stage worker: process messages from inbox until cancelled."""
+    while True:
+        message = await inbox.get()
+        cpu_intensive_task(message[0], stage_iterations)
+        await outbox.put(message)
+
+
+async def _asyncio_flow(queues: List[asyncio.Queue], in_flight: int, messages: int, payload: bytes) -> Dict[str, Any]:
+    """Send messages into the first queue from a producer task, in_flight at a time, and collect them from the last."""
+    slots = asyncio.Semaphore(in_flight)
+
+    async def produce():
+        for seq in range(messages):
+            await slots.acquire()
+            await queues[0].put((seq, time.perf_counter_ns(), payload))
+
+    start_time = time.perf_counter_ns()
+    producer = asyncio.create_task(produce())
+    latencies = []
+    for _ in range(messages):
+        _, sent, _ = await queues[-1].get()
+        latencies.append(time.perf_counter_ns() - sent)
+        slots.release()
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
+    await producer
+    return {'elapsed': elapsed, 'latencies_ns': latencies}
+
+
+@contextlib.contextmanager
+def _asyncio_pipeline(stages: int, fan_out: int, stage_iterations: int) -> Iterator[Callable]:
+    """Start asyncio worker tasks connected by asyncio.Queue on one event loop, and yield a flow(messages, payload)."""
+    with asyncio.Runner() as runner:
+        queues = [asyncio.Queue() for _ in range(stages + 1)]
+
+        async def start_workers():
+            return [
+                asyncio.create_task(_async_stage_worker(queues[stage], queues[stage + 1], stage_iterations))
+                for stage in range(stages)
+                for _ in range(fan_out)
+            ]
+
+        # The loop only holds weak references to tasks, so keep the workers alive here;
+        # closing the runner cancels them
+        workers = runner.run(start_workers())
+        yield lambda messages, payload: runner.run(_asyncio_flow(queues, stages * fan_out, messages, payload))
+        del workers
+
+
+@contextlib.contextmanager
+def pipeline_fixture(kind: str, messages: int, stages: int, fan_out: int, message_size: int,
+                     stage_iterations: int = PIPELINE_STAGE_ITERATIONS) -> Iterator[Tuple[Callable, tuple]]:
+    """
+    Start the stage workers of a pipeline, outside the timed region.
+
+    The workers keep running between flows, so one pipeline can be timed
+    several times.
+
+    Args:
+        kind: One of PIPELINE_QUEUE_KINDS
+        messages: Number of messages the producer sends per flow
+        stages: Number of stages between producer and sink
+        fan_out: Workers per stage
+        message_size: Payload bytes carried by each message
+        stage_iterations: cpu_intensive_task iterations per message per stage
+
+    Yields:
+        Tuple of (flow, args) to time, where flow returns the same dictionary
+        as pipeline_test; the workers are stopped on exit
+    """
+    if kind not in PIPELINE_QUEUE_KINDS:
+        raise ValueError(f"Unknown pipeline queue kind: {kind!r}")
+    if kind == 'asyncio':
+        running = _asyncio_pipeline(stages, fan_out, stage_iterations)
+    else:
+        running = _blocking_pipeline(kind, stages, fan_out, stage_iterations)
+    with running as flow:
+        yield flow, (messages, b'x' * message_size)
+
+
+def pipeline_test(kind: str, messages: int, stages: int, fan_out: int, message_size: int,
+                  stage_iterations: int = PIPELINE_STAGE_ITERATIONS) -> Dict[str, Any]:
+    """
+    Push messages through a multi-stage producer/consumer pipeline.
+
+    Workers are running before the clock starts, so startup is not part of
+    the sample.
+
+    Args:
+        kind: One of PIPELINE_QUEUE_KINDS
+        messages: Number of messages the producer sends, at most
+            stages * fan_out of them in flight at once
+        stages: Number of stages between producer and sink
+        fan_out: Workers per stage
+        message_size: Payload bytes carried by each message
+        stage_iterations: cpu_intensive_task iterations per message per stage
+
+    Returns:
+        Dictionary with 'elapsed' (seconds from the first send to the last
+        receive) and 'latencies_ns' (end-to-end latency of every message)
+    """
+    with pipeline_fixture(kind, messages, stages, fan_out, message_size, stage_iterations) as (flow, args):
+        return flow(*args)
+
+
+def _latency_percentiles(latencies_ns: List[int]) -> Dict[str, float]:
+    """p50/p90/p99/max of end-to-end latencies, in seconds."""
+    points = (50, 90, 99, 100)
+    names = ('latency_p50_s', 'latency_p90_s', 'latency_p99_s', 'latency_max_s')
+    return {name: value / 1e9 if value is not None else None
+            for name, value in zip(names, _percentiles(latencies_ns, points))}
+
+
+def run_pipeline_benchmark(kind: str = 'queue', messages: int = 1000, stages: int = 3, fan_out: int = 2,
+                           message_size: int = 256, repeats: int = 1,
+                           stage_iterations: int = PIPELINE_STAGE_ITERATIONS) -> dict:
+    """
+    Run producer/consumer pipeline benchmark.
+
+    Worker startup and shutdown are excluded: each sample runs from the first
+    send to the last message reaching the sink. The producer keeps one
+    message in flight per worker, so latency is transit time, not backlog.
+
+    Args:
+        kind: One of PIPELINE_QUEUE_KINDS (default: 'queue')
+        messages: Messages per sample (default: 1000)
+        stages: Pipeline stages (default: 3)
+        fan_out: Workers per stage (default: 2)
+        message_size: Payload bytes per message (default: 256)
+        repeats: Number of times to repeat the test (default: 1)
+        stage_iterations: cpu_intensive_task iterations per message per stage
+            (default: PIPELINE_STAGE_ITERATIONS)
+
+    Returns:
+        Dictionary in the same shape as run_benchmark's, plus 'metrics' with
+        messages per second and end-to-end latency percentiles pooled over
+        all repeats
+    """
+    if kind not in PIPELINE_QUEUE_KINDS:
+        raise ValueError(f"Unknown pipeline queue kind: {kind!r}")
+
+    execution_times = []
+    latencies = []
+    for _ in range(repeats):
+        sample = pipeline_test(kind, messages, stages, fan_out, message_size, stage_iterations)
+        execution_times.append(sample['elapsed'])
+        latencies.extend(sample['latencies_ns'])
+
+    stats = _calculate_statistics(execution_times)
+    return {
+        'name': f"Pipeline [{kind}] ({messages:,} msgs, {stages} stages x {fan_out} workers, {message_size:,} B)",
+        'repeats': repeats,
+        'result': messages,
+        'all_results': [messages] * repeats,
+        'execution_times': execution_times,
+        'statistics': stats,
+        'metrics': {
+            'messages_per_s': messages / stats['median'] if stats.get('median') else None,
+            **_latency_percentiles(latencies),
+        },
+        'timestamp': time.time()
+    }
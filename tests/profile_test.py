@@ -0,0 +1,98 @@
+"""
+Unit tests for profile loading and benchmark/size selection (benchmark_config
+and benchmark.build_plan).
+"""
+
+import pytest
+
+from benchmark import BENCHMARKS, SIZE_LEVELS, build_plan
+from benchmark_config import (
+    load_profile,
+    match_benchmarks,
+    match_levels,
+    match_override,
+    parse_duration,
+    unmatched_overrides,
+)
+
+SPECS = [
+    {'key': 'fib', 'test_type': 'Fibonacci'},
+    {'key': 'call_keyword', 'test_type': 'Function Call [keyword]'},
+    {'key': 'call_partial', 'test_type': 'Function Call [partial]'},
+]
+
+
+def test_match_benchmarks_globs_keys_and_test_types() -> None:
+    """Patterns match keys or test types case-insensitively and keep registry order."""
+    assert match_benchmarks(SPECS, None) == SPECS
+    assert match_benchmarks(SPECS, ['CALL_*']) == SPECS[1:]
+    assert match_benchmarks(SPECS, ['call_partial', 'fibonacci']) == [SPECS[0], SPECS[2]]
+    with pytest.raises(ValueError, match="No benchmark matches"):
+        match_benchmarks(SPECS, ['nope'])
+
+
+def test_match_levels_canonicalizes_and_orders() -> None:
+    """Requested levels come back in ladder order with canonical names."""
+    assert match_levels(SIZE_LEVELS, ['medium', 'small']) == ['Small', 'Medium']
+    assert match_levels(SIZE_LEVELS, None) == SIZE_LEVELS
+    with pytest.raises(ValueError, match="Unknown size level"):
+        match_levels(SIZE_LEVELS, ['Huge'])
+
+
+def test_match_override_prefers_exact_key_then_first_pattern() -> None:
+    """An exact key beats patterns; among patterns the first match wins."""
+    overrides = {'call_*': [1], 'call_k*': [2], 'call_keyword': [3]}
+    assert match_override('call_keyword', overrides) == [3]
+    assert match_override('call_kwargs_forwarding', overrides) == [1]
+    assert match_override('fib', overrides) is None
+    assert unmatched_overrides(['fib', 'call_keyword'], {'call_*': 1, 'mt_*': 2, 'fib': 3}) == ['mt_*']
+
+
+@pytest.mark.parametrize('value, seconds', [('90', 90.0), ('90s', 90.0), ('10m', 600.0), ('1.5h', 5400.0)])
+def test_parse_duration(value: str, seconds: float) -> None:
+    """Durations accept bare seconds and s/m/h suffixes."""
+    assert parse_duration(value) == seconds
+
+
+@pytest.mark.parametrize('value', ['', '0', '-5s', '10d', 'soon'])
+def test_parse_duration_rejects_invalid(value: str) -> None:
+    """Zero, negative and unknown-unit durations are rejected."""
+    with pytest.raises(ValueError):
+        parse_duration(value)
+
+
+def test_load_profile_rejects_unknown_keys(tmp_path) -> None:
+    """Typos in profile keys are reported instead of silently ignored."""
+    path = tmp_path / 'typo.toml'
+    path.write_text('repeat = 3\n')
+    with pytest.raises(ValueError, match="Unknown keys"):
+        load_profile(str(path))
+
+
+def test_build_plan_applies_pattern_overrides() -> None:
+    """Pattern size and timeout overrides apply to every benchmark they match."""
+    profile = {
+        'levels': ['Small', 'Medium'],
+        'sizes': {'call_*': [7, 8, 9], 'call_keyword': [5]},
+        'timeouts': {'call_*': 30},
+        'timeout': 60,
+    }
+    plan = {spec['key']: spec for spec in build_plan(profile, only=['call*', 'fib'])}
+    assert plan['call_keyword']['runs'] == [('Small', 5, None)]
+    assert plan['call_partial']['runs'] == [('Small', 7, None), ('Medium', 8, None)]
+    assert plan['call_partial']['timeout'] == 30
+    assert plan['fib']['timeout'] == 60
+    assert [size for _, size, _ in plan['fib']['runs']] == BENCHMARKS[0]['sizes'][:2]
+
+
+def test_build_plan_rejects_overrides_for_unknown_benchmarks() -> None:
+    """A [sizes] pattern that matches no benchmark is an error."""
+    with pytest.raises(ValueError, match=r"\[sizes\] entries for unknown benchmarks: nope_\*"):
+        build_plan({'sizes': {'nope_*': [1]}})
+
+
+def test_smoke_profile_overrides_every_benchmark() -> None:
+    """The smoke profile gives every registry entry an explicit tiny size."""
+    overrides = load_profile('smoke')['sizes']
+    missing = [spec['key'] for spec in BENCHMARKS if match_override(spec['key'], overrides) is None]
+    assert missing == []
@@ -0,0 +1,129 @@
+"""
+Unit tests for the cross-interpreter comparison report (benchmark_report).
+"""
+
+import csv
+import json
+import math
+
+import pytest
+
+pandas = pytest.importorskip('pandas')
+pytest.importorskip('matplotlib')
+
+from tests.base_test import CSV_FIELDNAMES
+from benchmark_report import (
+    build_report,
+    confidence_interval,
+    heatmap_pages,
+    load_report_dependencies,
+    load_results,
+    plot_speedup_heatmap,
+    speedup_table,
+)
+
+LEVELS = ['Small', 'Medium', 'Large']
+
+
+def _write_results(path, rows) -> None:
+    """Write a results CSV; every row is a completed run unless it says otherwise."""
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES, restval='')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({'size_value': '1', 'python_version': row['interpreter'].rstrip('t'),
+                             'repeats': '3', 'status': 'ok', **row})
+
+
+def _run(interpreter: str, test_type: str, size_level: str, median: float, **extra) -> dict:
+    """A results row with the given median and three identical samples."""
+    return {'interpreter': interpreter, 'test_type': test_type, 'size_level': size_level,
+            'median_time': str(median), 'samples': json.dumps([median] * 3), **extra}
+
+
+def test_confidence_interval_prefers_samples() -> None:
+    """Samples give the interval; std_dev and repeats are the fallback for older files."""
+    assert confidence_interval([1.0, 1.0, 1.0], 5.0, 3) == 0.0
+    assert confidence_interval([], 1.0, 4) == pytest.approx(1.96 / 2)
+    assert confidence_interval([], None, 1) == 0.0
+
+
+def test_load_results_keeps_completed_runs_of_the_last_file(tmp_path) -> None:
+    """Non-ok rows are dropped, and a run repeated in a later file replaces the earlier one."""
+    old, new = tmp_path / 'old.csv', tmp_path / 'new.csv'
+    _write_results(old, [_run('3.13.5', 'Fibonacci', 'Small', 2.0),
+                         _run('3.13.5', 'Fibonacci', 'Medium', 0.0, status='timeout')])
+    _write_results(new, [_run('3.13.5', 'Fibonacci', 'Small', 1.0)])
+
+    results = load_results([old, new], pandas)
+
+    assert results[['interpreter', 'test_type', 'size_level', 'median']].values.tolist() == [
+        ['3.13.5', 'Fibonacci', 'Small', 1.0]]
+
+
+def test_speedup_table_is_relative_to_the_baseline(tmp_path) -> None:
+    """Speedup is baseline median over interpreter median; missing runs are NaN."""
+    path = tmp_path / 'results.csv'
+    _write_results(path, [_run('3.13.5', 'Fibonacci', 'Small', 2.0), _run('3.13.5', 'Fibonacci', 'Medium', 4.0),
+                          _run('3.14.0', 'Fibonacci', 'Small', 1.0)])
+    results = load_results([path], pandas)
+
+    speedups, errors = speedup_table(results, '3.13.5', ['3.13.5', '3.14.0'], LEVELS, pandas)
+
+    assert list(speedups.index) == [('Fibonacci', 'Small'), ('Fibonacci', 'Medium')]
+    assert speedups.loc[('Fibonacci', 'Small')].tolist() == [1.0, 2.0]
+    assert speedups.loc[('Fibonacci', 'Medium'), '3.13.5'] == 1.0
+    assert math.isnan(speedups.loc[('Fibonacci', 'Medium'), '3.14.0'])
+    assert errors.loc[('Fibonacci', 'Small'), '3.14.0'] == 0.0
+
+
+def test_zero_medians_give_no_speedup(tmp_path) -> None:
+    """A zero median on either side (e.g. a module imported during startup) is NaN, not an error."""
+    path = tmp_path / 'results.csv'
+    _write_results(path, [_run('3.13.5', 'Import Time [csv]', 'Small', 0.0),
+                          _run('3.14.0', 'Import Time [csv]', 'Small', 0.002),
+                          _run('3.13.5', 'Import Time [json]', 'Small', 0.002),
+                          _run('3.14.0', 'Import Time [json]', 'Small', 0.0)])
+    results = load_results([path], pandas)
+
+    speedups, errors = speedup_table(results, '3.13.5', ['3.13.5', '3.14.0'], LEVELS, pandas)
+
+    assert speedups.loc[('Import Time [csv]', 'Small')].isna().all()
+    assert speedups.loc[('Import Time [json]', 'Small'), '3.13.5'] == 1.0
+    assert math.isnan(speedups.loc[('Import Time [json]', 'Small'), '3.14.0'])
+    assert errors.loc[('Import Time [csv]', 'Small')].isna().all()
+
+    _, pyplot, seaborn = load_report_dependencies()
+    assert plot_speedup_heatmap(speedups, pyplot, seaborn).startswith('data:image/png;base64,')
+    assert plot_speedup_heatmap(speedups, pyplot, None).startswith('data:image/png;base64,')
+
+
+def test_heatmaps_are_split_by_family_and_row_cap(tmp_path) -> None:
+    """Each family gets its own heatmap, and a family over the row cap is split into pages."""
+    path = tmp_path / 'results.csv'
+    rows = [_run('3.14.0', 'Fibonacci', level, 1.0) for level in LEVELS]
+    rows += [_run('3.14.0', f'Buffer [{operation}]', level, 1.0) for operation in ['a', 'b'] for level in LEVELS]
+    _write_results(path, rows)
+    speedups, _ = speedup_table(load_results([path], pandas), '3.14.0', ['3.14.0'], LEVELS, pandas)
+
+    pages = heatmap_pages(speedups, max_rows=4)
+
+    assert [title for title, _ in pages] == ['Buffer (1/2)', 'Buffer (2/2)', 'Fibonacci']
+    assert [len(page) for _, page in pages] == [4, 2, 3]
+    assert list(pages[1][1].index) == [('Buffer [b]', 'Medium'), ('Buffer [b]', 'Large')]
+
+
+def test_build_report_writes_html(tmp_path) -> None:
+    """A report over two interpreters, one run with a zero baseline median, is written."""
+    default, free_threaded = tmp_path / 'default.csv', tmp_path / 'free_threaded.csv'
+    _write_results(default, [_run('3.14.0', 'Fibonacci', 'Small', 2.0),
+                             _run('3.14.0', 'Import Time [csv]', 'Small', 0.0)])
+    _write_results(free_threaded, [_run('3.14.0t', 'Fibonacci', 'Small', 2.5),
+                                   _run('3.14.0t', 'Import Time [csv]', 'Small', 0.001)])
+
+    output = build_report([default, free_threaded], tmp_path / 'report.html', LEVELS)
+
+    page = output.read_text(encoding='utf-8')
+    assert '3.14.0t' in page
+    assert 'Fibonacci' in page
+    assert page.count('speedup heatmap') == 2
@@ -0,0 +1,85 @@
+"""
+Unit tests for results files: naming, resume keys and streamed rows (benchmark.py).
+"""
+
+import csv
+
+import benchmark
+from benchmark import (
+    CSV_FIELDNAMES,
+    build_plan,
+    find_latest_results,
+    load_completed_runs,
+    results_filename_prefix,
+    run_benchmarks,
+)
+from tests.text_test import make_records
+
+
+def _write_rows(path, rows, fieldnames=CSV_FIELDNAMES) -> None:
+    """Write a results CSV with the given rows."""
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, restval='')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _row(interpreter: str, status: str = 'ok', **extra) -> dict:
+    """A minimal Fibonacci Small result row."""
+    return {'test_type': 'Fibonacci', 'size_level': 'Small', 'size_value': '5', 'python_version': '3.14.0',
+            'status': status, 'interpreter': interpreter, **extra}
+
+
+def test_results_filename_prefix_separates_builds() -> None:
+    """Default and free-threaded builds of one version get different file prefixes."""
+    assert results_filename_prefix('3.14.0') == 'benchmark_results_3_14_0'
+    assert results_filename_prefix('3.14.0t') == 'benchmark_results_3_14_0t'
+    assert results_filename_prefix('PyPy 3.10.14') == 'benchmark_results_PyPy_3_10_14'
+
+
+def test_find_latest_results_matches_interpreter_label(tmp_path, monkeypatch) -> None:
+    """Resume picks the newest file of the same build, never the other build's."""
+    monkeypatch.setattr(benchmark, 'RESULTS_DIR', tmp_path)
+    for name in ('3_14_0_20250101_000000', '3_14_0_20250102_000000', '3_14_0t_20250101_000000'):
+        (tmp_path / f"benchmark_results_{name}.csv").touch()
+
+    assert find_latest_results('3.14.0').name == 'benchmark_results_3_14_0_20250102_000000.csv'
+    assert find_latest_results('3.14.0t').name == 'benchmark_results_3_14_0t_20250101_000000.csv'
+    assert find_latest_results('3.13.5') is None
+
+
+def test_load_completed_runs_keys_on_interpreter(tmp_path) -> None:
+    """Completed runs are keyed by interpreter label, falling back to python_version for old files."""
+    path = tmp_path / 'results.csv'
+    _write_rows(path, [_row('3.14.0t'), _row('3.14.0', status='error'), _row('3.14.0', status='timeout')])
+    assert load_completed_runs(path) == {
+        ('3.14.0t', 'Fibonacci', 'Small', '5'),
+        ('3.14.0', 'Fibonacci', 'Small', '5'),
+    }
+
+    old = tmp_path / 'old.csv'
+    _write_rows(old, [{'test_type': 'Fibonacci', 'size_level': 'Small', 'size_value': '5',
+                       'python_version': '3.13.5'}],
+                fieldnames=['test_type', 'size_level', 'size_value', 'python_version'])
+    assert load_completed_runs(old) == {('3.13.5', 'Fibonacci', 'Small', '5')}
+    assert load_completed_runs(tmp_path / 'missing.csv') == set()
+
+
+def test_resume_reruns_runs_completed_by_another_build(tmp_path, monkeypatch) -> None:
+    """A run the default build completed is still run when resuming under the free-threaded build."""
+    monkeypatch.setattr(benchmark, 'interpreter_label', lambda: '3.14.0t')
+    path = tmp_path / 'results.csv'
+    _write_rows(path, [_row('3.14.0')])
+    plan = build_plan({'levels': ['Small'], 'sizes': {'fib': [5]}}, only=['fib'])
+
+    run_benchmarks(1, plan, path, resume=True)
+    run_benchmarks(1, plan, path, resume=True)
+
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    assert [(row['interpreter'], row['status']) for row in rows] == [('3.14.0', 'ok'), ('3.14.0t', 'ok')]
+
+
+def test_text_records_have_the_results_columns() -> None:
+    """The text benchmark's generated records are shaped like results CSV rows."""
+    assert [list(record) for record in make_records(2)] == [CSV_FIELDNAMES, CSV_FIELDNAMES]
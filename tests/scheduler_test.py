@@ -0,0 +1,200 @@
+"""
+Unit tests for time-budgeted scheduling (benchmark_scheduler).
+
+Costs come from a fake calibrate callable, so no benchmark is run.
+"""
+
+import csv
+
+import pytest
+
+from tests.base_test import BenchmarkUnavailable
+from benchmark import BENCHMARKS_BY_KEY, calibrate_run
+from benchmark_scheduler import (
+    UNAVAILABLE,
+    UNCALIBRATED,
+    estimate_costs,
+    load_history,
+    schedule_plan,
+)
+
+LEVELS = ['Small', 'Medium', 'Large']
+
+
+def _spec(key: str, sizes, **extra) -> dict:
+    """A plan entry running `sizes` at the first len(sizes) levels."""
+    return {'key': key, 'test_type': key.title(), 'runs': [(level, size, None) for level, size in zip(LEVELS, sizes)],
+            'skipped': [], **extra}
+
+
+class FakeCalibrate:
+    """Calibrate stand-in returning a fixed cost per work unit and recording its calls."""
+
+    def __init__(self, seconds_per_unit: float = 0.001):
+        self.seconds_per_unit = seconds_per_unit
+        self.calls = []
+
+    def __call__(self, spec: dict, size) -> float:
+        self.calls.append((spec['key'], size))
+        return size * self.seconds_per_unit
+
+
+def test_estimate_costs_calibrates_smallest_size_and_extrapolates() -> None:
+    """Without history the smallest size is calibrated once and the others scaled by work."""
+    calibrate = FakeCalibrate()
+    plan = [_spec('sort', [100, 200, 400], work=lambda n: n * n)]
+    estimates = estimate_costs(plan, {}, calibrate)
+
+    assert calibrate.calls == [('sort', 100)]
+    assert estimates[('sort', 'Small')] == (0.1, 'calibration')
+    cost, source = estimates[('sort', 'Large')]
+    assert cost == pytest.approx(1.6)
+    assert source == 'calibration, extrapolated'
+
+
+def test_estimate_costs_prefers_history() -> None:
+    """History for the same test type and size value replaces calibration."""
+    calibrate = FakeCalibrate()
+    plan = [_spec('fib', [10, 20])]
+    estimates = estimate_costs(plan, {('Fib', '20'): 2.0}, calibrate)
+
+    assert calibrate.calls == []
+    assert estimates[('fib', 'Medium')] == (2.0, 'history')
+    assert estimates[('fib', 'Small')] == (1.0, 'history, extrapolated')
+
+
+def test_estimate_costs_without_calibrate_runs_nothing() -> None:
+    """calibrate=None (as for --list) leaves benchmarks without history uncalibrated."""
+    estimates = estimate_costs([_spec('fib', [10, 20])], {}, calibrate=None)
+    assert estimates == {('fib', 'Small'): (0.0, UNCALIBRATED), ('fib', 'Medium'): (0.0, UNCALIBRATED)}
+
+
+def test_estimate_costs_stops_calibrating_at_budget(monkeypatch) -> None:
+    """Once calibration has used its budget, the remaining benchmarks are not calibrated."""
+    clock = iter(range(100))
+    monkeypatch.setattr('benchmark_scheduler.time.perf_counter', lambda: float(next(clock)))
+    calibrate = FakeCalibrate()
+    plan = [_spec('a', [1]), _spec('b', [1]), _spec('c', [1])]
+
+    # Each fake calibration takes one clock tick
+    estimates = estimate_costs(plan, {}, calibrate, calibration_budget=2.0)
+
+    assert [key for key, _ in calibrate.calls] == ['a', 'b']
+    assert estimates[('c', 'Small')] == (0.0, UNCALIBRATED)
+
+
+def test_estimate_costs_gives_unavailable_benchmarks_zero_cost() -> None:
+    """A calibration raising BenchmarkUnavailable costs nothing and does not stop the others."""
+    calibrate = FakeCalibrate()
+
+    def calibrate_or_unavailable(spec: dict, size) -> float:
+        if spec['key'] == 'jit':
+            raise BenchmarkUnavailable("was not built with the JIT")
+        return calibrate(spec, size)
+
+    plan = [_spec('jit', [10, 20]), _spec('fib', [10])]
+    estimates = estimate_costs(plan, {}, calibrate_or_unavailable)
+
+    assert estimates[('jit', 'Small')] == (0.0, UNAVAILABLE)
+    assert estimates[('jit', 'Medium')] == (0.0, UNAVAILABLE)
+    assert estimates[('fib', 'Small')] == (0.01, 'calibration')
+    scheduled = schedule_plan(plan, 1.0, estimates, LEVELS)
+    assert scheduled[0]['runs'] == [('Small', 10, 3), ('Medium', 20, 3)]
+
+
+def test_estimate_costs_survives_failed_calibration() -> None:
+    """A calibration that fails or times out leaves that benchmark uncalibrated and the others go on."""
+    calibrate = FakeCalibrate()
+
+    def calibrate_or_fail(spec: dict, size) -> float:
+        if spec['key'] == 'broken':
+            raise RuntimeError("timeout: exceeded 1s")
+        return calibrate(spec, size)
+
+    plan = [_spec('broken', [10, 20]), _spec('fib', [10])]
+    estimates = estimate_costs(plan, {}, calibrate_or_fail)
+
+    assert estimates[('broken', 'Small')] == (0.0, UNCALIBRATED)
+    assert estimates[('broken', 'Medium')] == (0.0, UNCALIBRATED)
+    assert estimates[('fib', 'Small')] == (0.01, 'calibration')
+
+
+def test_calibrate_run_applies_the_timeout() -> None:
+    """Calibration runs under the entry's timeout and reports a timeout as a failure."""
+    spec = {**BENCHMARKS_BY_KEY['fib'], 'timeout': 0.01}
+    with pytest.raises(RuntimeError, match="timeout"):
+        calibrate_run(spec, 35)
+    assert estimate_costs([{**_spec('fib', [35]), **spec, 'runs': [('Small', 35, None)]}], {},
+                          calibrate_run) == {('fib', 'Small'): (0.0, UNCALIBRATED)}
+
+
+def test_calibrate_run_reports_errors_and_unavailable_benchmarks() -> None:
+    """Without a timeout, errors and BenchmarkUnavailable from the run become calibration exceptions."""
+    def fail(size, repeats):
+        raise ValueError("bad size")
+
+    def unavailable(size, repeats):
+        raise BenchmarkUnavailable("needs Python 3.14+")
+
+    with pytest.raises(RuntimeError, match="error: ValueError: bad size"):
+        calibrate_run({'key': 'x', 'run': fail, 'timeout': None}, 1)
+    with pytest.raises(BenchmarkUnavailable, match="3.14"):
+        calibrate_run({'key': 'x', 'run': unavailable, 'timeout': None}, 1)
+
+
+def test_schedule_plan_covers_small_levels_first() -> None:
+    """Every benchmark's Small is admitted before any Medium; what does not fit is skipped with a reason."""
+    plan = [_spec('a', [1, 2]), _spec('b', [1, 2])]
+    estimates = {('a', 'Small'): (1.0, 'calibration'), ('a', 'Medium'): (10.0, 'calibration'),
+                 ('b', 'Small'): (1.0, 'calibration'), ('b', 'Medium'): (10.0, 'calibration')}
+
+    # 40s * 0.9 safety = 36s: both Smalls (3s each at 3 repeats) and one Medium (30s) fit
+    scheduled = {spec['key']: spec for spec in schedule_plan(plan, 40.0, estimates, LEVELS, max_repeats=3)}
+
+    assert scheduled['a']['runs'] == [('Small', 1, 3), ('Medium', 2, 3)]
+    assert scheduled['b']['runs'] == [('Small', 1, 3)]
+    [(level, size, reason)] = scheduled['b']['skipped']
+    assert (level, size) == ('Medium', 2)
+    assert 'exceeds remaining budget' in reason
+
+
+def test_schedule_plan_adds_repeats_to_cheapest_runs_first() -> None:
+    """Spare budget raises repeats round-robin from the cheapest run, up to max_repeats."""
+    plan = [_spec('cheap', [1]), _spec('dear', [1])]
+    estimates = {('cheap', 'Small'): (1.0, 'history'), ('dear', 'Small'): (4.0, 'history')}
+
+    # 20s * 0.9 = 18s; coverage uses 3 + 12 = 15s, leaving 3s for three more cheap repeats
+    scheduled = {spec['key']: spec for spec in schedule_plan(plan, 20.0, estimates, LEVELS, max_repeats=10)}
+
+    assert scheduled['cheap']['runs'] == [('Small', 1, 6)]
+    assert scheduled['dear']['runs'] == [('Small', 1, 3)]
+
+
+def test_schedule_plan_keeps_uncalibrated_runs_at_minimum_repeats() -> None:
+    """Runs without a cost estimate are admitted but get no extra repeats."""
+    plan = [_spec('known', [1]), _spec('unknown', [1])]
+    estimates = {('known', 'Small'): (1.0, 'history'), ('unknown', 'Small'): (0.0, UNCALIBRATED)}
+
+    scheduled = {spec['key']: spec for spec in schedule_plan(plan, 100.0, estimates, LEVELS, max_repeats=5)}
+
+    assert scheduled['known']['runs'] == [('Small', 1, 5)]
+    assert scheduled['unknown']['runs'] == [('Small', 1, 3)]
+
+
+def test_load_history_filters_by_interpreter_label(tmp_path) -> None:
+    """Rows of other builds of the same version are ignored; old rows match on python_version."""
+    fieldnames = ['test_type', 'size_value', 'python_version', 'interpreter', 'status', 'mean_time']
+    with open(tmp_path / 'benchmark_results_3_14_0_20250101_000000.csv', 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerow({'test_type': 'Fib', 'size_value': '20', 'python_version': '3.14.0',
+                         'interpreter': '3.14.0', 'status': 'ok', 'mean_time': '1.0'})
+        writer.writerow({'test_type': 'Fib', 'size_value': '20', 'python_version': '3.14.0',
+                         'interpreter': '3.14.0t', 'status': 'ok', 'mean_time': '5.0'})
+        writer.writerow({'test_type': 'Fib', 'size_value': '25', 'python_version': '3.14.0',
+                         'interpreter': '', 'status': 'ok', 'mean_time': '3.0'})
+        writer.writerow({'test_type': 'Sort', 'size_value': '100', 'python_version': '3.14.0',
+                         'interpreter': '3.14.0t', 'status': 'timeout', 'mean_time': ''})
+
+    assert load_history(tmp_path, '3.14.0') == {('Fib', '20'): 1.0, ('Fib', '25'): 3.0}
+    assert load_history(tmp_path, '3.14.0t') == {('Fib', '20'): 5.0}
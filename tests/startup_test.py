@@ -0,0 +1,326 @@
+"""
+Interpreter startup and import-time benchmark tests.
+
+Each sample launches the interpreter as a subprocess, so these numbers are
+what a CLI tool or serverless handler pays on every invocation.
+"""
+
+import contextlib
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from .base_test import BenchmarkUnavailable, _calculate_statistics, run_benchmark
+
+# Project root, so child interpreters can `import tests`
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Command-line flag variants for `python -c pass`
+STARTUP_FLAG_VARIANTS: Dict[str, List[str]] = {
+    'default': [],
+    'no_site': ['-S'],
+    'isolated': ['-I'],
+    'frozen_modules_on': ['-X', 'frozen_modules=on'],
+    'frozen_modules_off': ['-X', 'frozen_modules=off'],
+}
+
+# Bytecode cache variants: importing the project's modules with an empty or primed .pyc cache
+PYC_CACHE_VARIANTS = ['cold_pyc', 'warm_pyc']
+
+# Modules this project imports, measured with -X importtime
+IMPORT_TIME_MODULES = ['tests', 'concurrent.futures', 'csv', 'numpy', 'pandas']
+
+# Modules with the largest cumulative import times kept in the import-time metrics
+IMPORT_TIME_TOP_MODULES = 10
+
+# Matches "import time:   self |  cumulative | <indent>package"
+_IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def _child_env(pycache_prefix: Optional[Path] = None) -> Dict[str, str]:
+    """Environment for child interpreters, optionally redirecting the .pyc cache."""
+    env = os.environ.copy()
+    env.pop('PYTHONPYCACHEPREFIX', None)
+    if pycache_prefix is not None:
+        # A warm cache only exists if the children are allowed to write it
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        env['PYTHONPYCACHEPREFIX'] = str(pycache_prefix)
+    return env
+
+
+def _launch(command: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    """
+    Launch one child interpreter and fail loudly if it does not exit cleanly.
+
+    Raises:
+        BenchmarkUnavailable: If the interpreter cannot be started or rejects
+            the command (unsupported flag, module not installed)
+    """
+    try:
+        completed = subprocess.run(command, env=env, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    except OSError as e:
+        raise BenchmarkUnavailable(f"cannot launch {command[0]}: {e}") from e
+    if completed.returncode != 0:
+        last_line = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else ''
+        raise BenchmarkUnavailable(f"{' '.join(command[1:])} failed: {last_line}")
+    return completed
+
+
+def python_startup_test(interpreter: str, flags: List[str], launches: int,
+                        pycache_prefix: Optional[Path] = None) -> int:
+    """
+    Test interpreter startup by launching `python <flags> -c pass` repeatedly.
+
+    Args:
+        interpreter: Interpreter executable to launch
+        flags: Extra command-line flags (e.g. ['-S'])
+        launches: Number of sequential launches
+        pycache_prefix: Optional PYTHONPYCACHEPREFIX for the children
+
+    Returns:
+        Number of successful launches
+    """
+    command = [interpreter, *flags, '-c', 'pass']
+    env = _child_env(pycache_prefix)
+    for _ in range(launches):
+        _launch(command, env)
+    return launches
+
+
+def pyc_cache_startup_test(interpreter: str, modules: List[str], launches: int,
+                           cache_root: Path, cold: bool) -> int:
+    """
+    Test startup plus imports with a cold (empty) or warm (primed) .pyc cache.
+
+    Cold launches each get a fresh, empty PYTHONPYCACHEPREFIX so every module
+    is compiled from source; warm launches share one primed prefix.
+
+    Args:
+        interpreter: Interpreter executable to launch
+        modules: Modules to import in each launch
+        launches: Number of sequential launches
+        cache_root: Directory holding the pycache prefixes
+        cold: Use a fresh cache for every launch
+
+    Returns:
+        Number of successful launches
+    """
+    command = [interpreter, '-c', f"import {', '.join(modules)}"]
+    for launch in range(launches):
+        prefix = cache_root / (f"cold_{time.perf_counter_ns()}_{launch}" if cold else 'warm')
+        _launch(command, _child_env(prefix))
+    return launches
+
+
+def parse_import_time(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse `-X importtime` output.
+
+    Args:
+        stderr: Standard error of a `python -X importtime` run
+
+    Returns:
+        Mapping of module name to (self_us, cumulative_us); for modules that
+        appear more than once the last (outermost) entry wins
+    """
+    breakdown = {}
+    for line in stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            breakdown[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return breakdown
+
+
+def import_time_test(interpreter: str, module: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """
+    Measure the cumulative import time of one module in a fresh interpreter.
+
+    Args:
+        interpreter: Interpreter executable to launch
+        module: Module to import
+
+    Returns:
+        Tuple of (cumulative import time in seconds, full per-module breakdown)
+    """
+    completed = _launch([interpreter, '-X', 'importtime', '-c', f'import {module}'], _child_env())
+    breakdown = parse_import_time(completed.stderr)
+    if module not in breakdown:
+        # Already imported during startup (e.g. by site), so it cost nothing extra
+        return 0.0, breakdown
+    return breakdown[module][1] / 1_000_000, breakdown
+
+
+@contextlib.contextmanager
+def pyc_cache_fixture(variant: str, launches: int,
+                      interpreter: str = sys.executable) -> Iterator[Tuple[Callable, tuple]]:
+    """
+    Create the temporary .pyc cache root and prime it for warm_pyc, outside the timed region.
+
+    Args:
+        variant: One of PYC_CACHE_VARIANTS
+        launches: Sequential launches per sample
+        interpreter: Interpreter executable to launch
+
+    Yields:
+        Tuple of (pyc_cache_startup_test, args) to time; the cache is removed on exit
+    """
+    if variant not in PYC_CACHE_VARIANTS:
+        raise ValueError(f"Unknown startup variant: {variant!r}")
+
+    modules = ['tests', 'concurrent.futures', 'csv']
+    cache_root = Path(tempfile.mkdtemp(prefix='pyc_cache_'))
+    try:
+        cold = variant == 'cold_pyc'
+        if not cold:
+            pyc_cache_startup_test(interpreter, modules, 1, cache_root, cold=False)
+        yield pyc_cache_startup_test, (interpreter, modules, launches, cache_root, cold)
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+
+
+def run_startup_benchmark(variant: str = 'default', launches: int = 1,
+                          interpreter: str = sys.executable, repeats: int = 1) -> dict:
+    """
+    Run interpreter startup benchmark.
+
+    Args:
+        variant: Key into STARTUP_FLAG_VARIANTS or PYC_CACHE_VARIANTS (default: 'default')
+        launches: Sequential launches per sample (default: 1)
+        interpreter: Interpreter executable to launch (default: current interpreter)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results
+    """
+    if variant in STARTUP_FLAG_VARIANTS:
+        flags = STARTUP_FLAG_VARIANTS[variant]
+        return run_benchmark(f"Interpreter Startup [{' '.join(flags) or 'no flags'}] ({launches:,} launches)",
+                             python_startup_test, interpreter, flags, launches, repeats=repeats)
+
+    with pyc_cache_fixture(variant, launches, interpreter) as (func, args):
+        return run_benchmark(f"Interpreter Startup [{variant}] ({launches:,} launches)",
+                             func, *args, repeats=repeats)
+
+
+def top_import_times(breakdowns: List[Dict[str, Tuple[int, int]]],
+                     count: int = IMPORT_TIME_TOP_MODULES) -> Dict[str, float]:
+    """
+    Pick the modules with the largest cumulative import times across launches.
+
+    Modules imported during interpreter startup (site, encodings) are
+    included, as `-X importtime` reports them too.
+
+    Args:
+        breakdowns: Per-launch results of parse_import_time
+        count: Number of modules to keep
+
+    Returns:
+        Mapping of module name to its median cumulative import time in
+        microseconds (over the launches that imported it), largest first
+    """
+    cumulative: Dict[str, List[int]] = {}
+    for breakdown in breakdowns:
+        for name, (_, cumulative_us) in breakdown.items():
+            cumulative.setdefault(name, []).append(cumulative_us)
+    medians = {name: statistics.median(values) for name, values in cumulative.items()}
+    return dict(sorted(medians.items(), key=lambda item: item[1], reverse=True)[:count])
+
+
+def run_import_time_benchmark(module: str, launches: int = 1,
+                              interpreter: str = sys.executable, repeats: int = 1) -> dict:
+    """
+    Run import-time benchmark for one module using `-X importtime`.
+
+    The timings are the interpreter's own cumulative import times (summed
+    over `launches` fresh interpreters per sample), not subprocess wall time.
+
+    Args:
+        module: Module to import (e.g. 'csv')
+        launches: Fresh interpreters per sample (default: 1)
+        interpreter: Interpreter executable to launch (default: current interpreter)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary in the same shape as run_benchmark's, whose 'result' is the
+        per-module breakdown of the first launch, plus 'metrics' with the
+        median cumulative import time of the IMPORT_TIME_TOP_MODULES slowest
+        modules (see top_import_times)
+    """
+    execution_times = []
+    breakdowns = []
+    for _ in range(repeats):
+        sample = 0.0
+        for _ in range(launches):
+            cumulative, breakdown = import_time_test(interpreter, module)
+            sample += cumulative
+            breakdowns.append(breakdown)
+        execution_times.append(sample)
+
+    return {
+        'name': f"Import Time [{module}] ({launches:,} launches)",
+        'repeats': repeats,
+        'result': breakdowns[0] if breakdowns else None,
+        'all_results': breakdowns,
+        'execution_times': execution_times,
+        'statistics': _calculate_statistics(execution_times),
+        'metrics': {'top_cumulative_us': top_import_times(breakdowns)},
+        'timestamp': time.time()
+    }
+
+
+def summarize_startup(interpreters: List[str], launches: int = 10, repeats: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Measure every startup variant and module import time for each interpreter.
+
+    Args:
+        interpreters: Interpreter executables to compare
+        launches: Launches per sample (default: 10)
+        repeats: Samples per measurement (default: 3)
+
+    Returns:
+        Mapping of interpreter to {measurement name: median seconds per launch};
+        measurements that could not run are omitted
+    """
+    summary = {}
+    for interpreter in interpreters:
+        row = {}
+        for variant in [*STARTUP_FLAG_VARIANTS, *PYC_CACHE_VARIANTS]:
+            try:
+                results = run_startup_benchmark(variant, launches, interpreter, repeats)
+            except BenchmarkUnavailable as e:
+                print(f"   {interpreter} [{variant}] unavailable: {e}")
+                continue
+            row[variant] = results['statistics']['median'] / launches
+        for module in IMPORT_TIME_MODULES:
+            try:
+                results = run_import_time_benchmark(module, launches, interpreter, repeats)
+            except BenchmarkUnavailable as e:
+                print(f"   {interpreter} [import {module}] unavailable: {e}")
+                continue
+            row[f"import {module}"] = results['statistics']['median'] / launches
+        summary[interpreter] = row
+    return summary
+
+
+def print_startup_summary(summary: Dict[str, Dict[str, float]]) -> None:
+    """Print a startup summary table, one column per interpreter, in milliseconds."""
+    interpreters = list(summary)
+    measurements = []
+    for row in summary.values():
+        measurements.extend(name for name in row if name not in measurements)
+
+    width = max([len(interpreter) for interpreter in interpreters] + [12])
+    print(f"\n{'Startup (ms/launch)':<28}" + "".join(f"{interpreter:>{width + 2}}" for interpreter in interpreters))
+    for name in measurements:
+        cells = "".join(
+            f"{summary[interpreter][name] * 1000:>{width + 2}.2f}" if name in summary[interpreter]
+            else f"{'n/a':>{width + 2}}"
+            for interpreter in interpreters
+        )
+        print(f"{name:<28}{cells}")
@@ -0,0 +1,243 @@
+"""
+Sub-interpreter parallelism benchmark tests.
+
+Python 3.14 adds concurrent.interpreters and
+concurrent.futures.InterpreterPoolExecutor: each worker is an isolated
+interpreter with its own GIL, running in a thread of the same process. These
+tests run the multithread_test tasks through that executor, and measure the
+two costs the model adds: creating interpreters and copying data between them.
+Interpreters without the feature raise BenchmarkUnavailable.
+"""
+
+import concurrent.futures
+import contextlib
+from typing import Callable, Iterator, List, Tuple
+from .base_test import BenchmarkUnavailable, run_benchmark
+from .multithread_test import cpu_intensive_task, io_intensive_task
+from .startup_test import PROJECT_ROOT
+
+try:
+    from concurrent import interpreters
+except ImportError:  # Python < 3.14
+    interpreters = None
+
+# Data-passing backends: where the echoed payload goes and comes back from
+DATA_PASSING_BACKENDS = ['thread', 'process', 'interpreter']
+
+# Round trips per data-passing sample
+DATA_PASSING_ROUND_TRIPS = 100
+
+# Worker interpreters do not inherit the main script's sys.path entry, so the
+# initializer (the builtin exec, which pickles by reference) adds the project root
+_WORKER_SETUP = f"import sys; sys.path.insert(0, {str(PROJECT_ROOT)!r})"
+
+
+def _require_interpreters() -> None:
+    """Raise BenchmarkUnavailable if this interpreter lacks sub-interpreter support."""
+    if interpreters is None or not hasattr(concurrent.futures, 'InterpreterPoolExecutor'):
+        raise BenchmarkUnavailable("concurrent.interpreters / InterpreterPoolExecutor need Python 3.14+")
+
+
+def _interpreter_pool(max_workers: int) -> concurrent.futures.Executor:
+    """Create an InterpreterPoolExecutor whose workers can import this package."""
+    _require_interpreters()
+    return concurrent.futures.InterpreterPoolExecutor(
+        max_workers=max_workers, initializer=exec, initargs=(_WORKER_SETUP,)
+    )
+
+
+def interpreter_pool_cpu_test(num_interpreters: int, iterations_per_interpreter: int) -> List[int]:
+    """
+    Test InterpreterPoolExecutor performance with CPU-intensive tasks.
+
+    Args:
+        num_interpreters: Number of worker interpreters
+        iterations_per_interpreter: Number of iterations per interpreter
+
+    Returns:
+        List of results from all interpreters
+    """
+    with _interpreter_pool(num_interpreters) as executor:
+        futures = [
+            executor.submit(cpu_intensive_task, i, iterations_per_interpreter)
+            for i in range(num_interpreters)
+        ]
+        results = [future.result() for future in futures]
+
+    return results
+
+
+def interpreter_pool_io_test(num_interpreters: int, duration_per_task: float) -> List[int]:
+    """
+    Test InterpreterPoolExecutor performance with I/O-intensive tasks.
+
+    Args:
+        num_interpreters: Number of worker interpreters
+        duration_per_task: Duration of each I/O task
+
+    Returns:
+        List of results from all interpreters
+    """
+    with _interpreter_pool(num_interpreters) as executor:
+        futures = [
+            executor.submit(io_intensive_task, i, duration_per_task)
+            for i in range(num_interpreters)
+        ]
+        results = [future.result() for future in futures]
+
+    return results
+
+
+def interpreter_startup_test(count: int) -> int:
+    """
+    Test the cost of creating and destroying sub-interpreters.
+
+    Args:
+        count: Number of interpreters to create, then close
+
+    Returns:
+        Number of interpreters created
+    """
+    _require_interpreters()
+    created = [interpreters.create() for _ in range(count)]
+    for interp in created:
+        interp.close()
+    return len(created)
+
+
+def data_passing_test(executor: concurrent.futures.Executor, payload: bytes, round_trips: int) -> int:
+    """
+    Test the cost of sending a payload to a worker and getting it back.
+
+    The worker runs the builtin `bytes` on the payload, so the measured time is
+    the transfer in both directions plus dispatch, with no Python-level work.
+
+    Args:
+        executor: Warm executor for the backend under test
+        payload: Bytes to send
+        round_trips: Number of sequential round trips
+
+    Returns:
+        Total number of bytes received back
+    """
+    received = 0
+    for _ in range(round_trips):
+        received += len(executor.submit(bytes, payload).result())
+    return received
+
+
+def _make_executor(backend: str) -> concurrent.futures.Executor:
+    """Create a single-worker executor for a data-passing backend."""
+    if backend == 'thread':
+        return concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    if backend == 'process':
+        return concurrent.futures.ProcessPoolExecutor(max_workers=1)
+    if backend == 'interpreter':
+        return _interpreter_pool(1)
+    raise ValueError(f"Unknown data-passing backend: {backend!r}")
+
+
+@contextlib.contextmanager
+def data_passing_fixture(backend: str, payload_bytes: int,
+                         round_trips: int = DATA_PASSING_ROUND_TRIPS) -> Iterator[Tuple[Callable, tuple]]:
+    """
+    Start and warm up a data-passing executor, outside the timed region.
+
+    Args:
+        backend: One of DATA_PASSING_BACKENDS
+        payload_bytes: Payload size in bytes
+        round_trips: Round trips per sample
+
+    Yields:
+        Tuple of (function, args) to time; the executor shuts down on exit
+    """
+    with _make_executor(backend) as executor:
+        executor.submit(bytes, b'warmup').result()
+        yield data_passing_test, (executor, b'x' * payload_bytes, round_trips)
+
+
+def run_interpreter_pool_cpu_benchmark(num_interpreters: int = 4, iterations_per_interpreter: int = 100000,
+                                       repeats: int = 1) -> dict:
+    """
+    Run InterpreterPoolExecutor CPU benchmark.
+
+    Args:
+        num_interpreters: Number of worker interpreters (default: 4)
+        iterations_per_interpreter: Number of iterations per interpreter (default: 100000)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results
+    """
+    _require_interpreters()
+    results = run_benchmark(
+        f"Interpreter Pool CPU ({num_interpreters} interpreters, {iterations_per_interpreter:,} iter/interpreter)",
+        interpreter_pool_cpu_test, num_interpreters, iterations_per_interpreter, repeats=repeats)
+    return results
+
+
+def run_interpreter_pool_io_benchmark(num_interpreters: int = 4, duration_per_task: float = 0.01,
+                                      repeats: int = 1) -> dict:
+    """
+    Run InterpreterPoolExecutor I/O benchmark.
+
+    Args:
+        num_interpreters: Number of worker interpreters (default: 4)
+        duration_per_task: Duration of each I/O task in seconds (default: 0.01)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results
+    """
+    _require_interpreters()
+    results = run_benchmark(f"Interpreter Pool I/O ({num_interpreters} interpreters, {duration_per_task}s/task)",
+                            interpreter_pool_io_test, num_interpreters, duration_per_task, repeats=repeats)
+    return results
+
+
+def run_interpreter_startup_benchmark(count: int = 4, repeats: int = 1) -> dict:
+    """
+    Run sub-interpreter creation benchmark.
+
+    Args:
+        count: Interpreters created and closed per sample (default: 4)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results
+    """
+    _require_interpreters()
+    results = run_benchmark(f"Interpreter Startup ({count} interpreters)",
+                            interpreter_startup_test, count, repeats=repeats)
+    return results
+
+
+def run_data_passing_benchmark(backend: str = 'interpreter', payload_bytes: int = 4096,
+                               round_trips: int = DATA_PASSING_ROUND_TRIPS, repeats: int = 1) -> dict:
+    """
+    Run cross-worker data-passing benchmark.
+
+    The executor is created and warmed up before timing, so samples contain
+    only the transfers.
+
+    Args:
+        backend: One of DATA_PASSING_BACKENDS (default: 'interpreter')
+        payload_bytes: Payload size in bytes (default: 4096)
+        round_trips: Round trips per sample (default: DATA_PASSING_ROUND_TRIPS)
+        repeats: Number of times to repeat the test (default: 1)
+
+    Returns:
+        Dictionary containing benchmark results, with 'metrics' giving the
+        effective throughput in bytes per second
+    """
+    with data_passing_fixture(backend, payload_bytes, round_trips) as (func, args):
+        results = run_benchmark(f"Data Passing [{backend}] ({payload_bytes:,} bytes x {round_trips} round trips)",
+                                func, *args, repeats=repeats)
+
+    median = results['statistics']['median']
+    results['metrics'] = {
+        'round_trip_s': median / round_trips,
+        'bytes_per_s': 2 * payload_bytes * round_trips / median if median else None,
+    }
+    return results
+
@@ -0,0 +1,263 @@
+"""
+Text and serialization workload benchmark tests.
+
+Parsing and formatting on locally generated corpora: json, re, string
+building, f-strings and csv round trips. Each workload runs under a
+single-threaded driver and a thread-pool driver that runs one copy per
+worker at the same time, so the gap between them shows how much of the text
+work is serialized by the GIL.
+"""
+
+import concurrent.futures
+import contextlib
+import csv
+import io
+import json
+import random
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .base_test import CSV_FIELDNAMES, run_benchmark
+from .dispatch_test import _start_workers
+
+# Drivers: one copy on the calling thread, or TEXT_POOL_WORKERS copies on a thread pool
+TEXT_DRIVERS = ['single', 'threads']
+TEXT_POOL_WORKERS = 4
+
+_LEVELS = ['Small', 'Medium', 'Large', 'XLarge', 'XXLarge']
+_WORDS = ['fibonacci', 'sort', 'listcomp', 'call', 'exception', 'object', 'attr', 'thread', 'pipeline']
+
+
+def make_records(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate result-row records with realistic text and numeric fields.
+
+    Args:
+        count: Number of records
+        seed: Random seed, so every corpus is reproducible
+
+    Returns:
+        List of dictionaries keyed by CSV_FIELDNAMES, like rows of the results CSV
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        word = rng.choice(_WORDS)
+        mean_time = rng.uniform(1e-5, 10.0)
+        python_version = f"3.{rng.randint(11, 14)}.{rng.randint(0, 9)}"
+        records.append({
+            'test_name': f"{word.title()} Test ({rng.randint(1, 10_000_000):,})",
+            'test_type': word.title(),
+            'size_level': rng.choice(_LEVELS),
+            'size_value': str(rng.randint(1, 10_000_000)),
+            'python_version': python_version,
+            'platform': 'Linux-6.8.0-x86_64-with-glibc2.39',
+            'architecture': 'x86_64',
+            'repeats': rng.randint(1, 20),
+            'mean_time': mean_time,
+            'min_time': mean_time * 0.9,
+            'max_time': mean_time * 1.2,
+            'std_dev': mean_time * 0.05,
+            'median_time': mean_time * 1.01,
+            'timestamp': 1_700_000_000 + i,
+            'status': 'ok',
+            'notes': '',
+            'metrics': json.dumps({'seed': seed, 'index': i}),
+            'unreliable_samples': 0,
+            'samples': json.dumps([mean_time * 0.9, mean_time * 1.01, mean_time * 1.2]),
+            'interpreter': python_version + rng.choice(['', 't']),
+        })
+    return records
+
+
+def json_loads_test(text: str) -> int:
+    """Parse one JSON document; returns the number of top-level items."""
+    return len(json.loads(text))
+
+
+def json_dumps_test(records: List[Dict[str, Any]]) -> int:
+    """Serialize records as one JSON document; returns its length."""
+    return len(json.dumps(records))
+
+
+def re_compile_test(patterns: List[str]) -> int:
+    """Compile every pattern with the re module's cache cleared first; returns the group count."""
+    re.purge()
+    return sum(re.compile(pattern).groups for pattern in patterns)
+
+
+def re_match_test(pattern: re.Pattern, lines: List[str]) -> int:
+    """Match a compiled pattern against every line; returns the number of matches."""
+    return sum(1 for line in lines if pattern.match(line))
+
+
+def str_join_test(pieces: List[str]) -> int:
+    """Build a string with str.join; returns its length."""
+    return len(''.join(pieces))
+
+
+def str_concat_test(pieces: List[str]) -> int:
+    """Build a string with repeated +=; returns its length."""
+    text = ''
+    for piece in pieces:
+        text += piece
+    return len(text)
+
+
+def stringio_test(pieces: List[str]) -> int:
+    """Build a string by writing to io.StringIO; returns its length."""
+    buffer = io.StringIO()
+    for piece in pieces:
+        buffer.write(piece)
+    return len(buffer.getvalue())
+
+
+def fstring_test(records: List[Dict[str, Any]]) -> int:
+    """Format one report line per record with f-strings; returns the total length."""
+    return sum(
+        len(f"{record['test_name']:<40} {record['size_level']:>8} {record['mean_time']:>12.6f}s "
+            f"±{record['std_dev']:.2e} x{record['repeats']:<3d} [{record['python_version']}]")
+        for record in records
+    )
+
+
+def csv_round_trip_test(records: List[Dict[str, Any]]) -> int:
+    """
+    Write records with csv.DictWriter (as save_results_to_csv does) and read them back.
+
+    Returns:
+        Number of rows read back
+    """
+    buffer = io.StringIO(newline='')
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDNAMES)
+    writer.writeheader()
+    writer.writerows(records)
+    buffer.seek(0)
+    return sum(1 for _ in csv.DictReader(buffer))
+
+
+def _log_lines(count: int, seed: int) -> List[str]:
+    """Generate benchmark log lines, about one in five of them not matching the log pattern."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        if rng.random() < 0.2:
+            lines.append(f"Running {rng.choice(_WORDS).title()} tests...")
+        else:
+            lines.append(f"   {rng.choice(_WORDS)}_{rng.randint(0, 99)} [{rng.choice(_LEVELS)}]: "
+                         f"{rng.uniform(1e-5, 10.0):.6f} seconds")
+    return lines
+
+
+# Pattern re_match_test applies to _log_lines output
+LOG_LINE_PATTERN = r'\s+(?P<name>\w+) \[(?P<level>\w+)\]: (?P<seconds>\d+\.\d+) seconds$'
+
+
+def _patterns(count: int, seed: int) -> List[str]:
+    """Generate distinct regular expressions, varied like hand-written parsing patterns."""
+    return [
+        rf'(?P<key>w{seed}_{i}_[a-z]+)\s*[:=]\s*(?P<value>-?\d+(?:\.\d+)?(?:e[+-]?\d+)?)(?:\s+#.*)?$'
+        for i in range(count)
+    ]
+
+
+def _pieces(count: int, seed: int) -> List[str]:
+    """Generate short string fragments for the string-building workloads."""
+    rng = random.Random(seed)
+    return [f"{rng.choice(_WORDS)}={rng.randint(0, 1000)};" for _ in range(count)]
+
+
+# Workload name -> (prepare(size, seed) returning the argument tuple, function(*args))
+TEXT_WORKLOADS: Dict[str, Tuple[Callable[[int, int], tuple], Callable[..., int]]] = {
+    'json_loads': (lambda size, seed: (json.dumps(make_records(size, seed)),), json_loads_test),
+    'json_dumps': (lambda size, seed: (make_records(size, seed),), json_dumps_test),
+    're_compile': (lambda size, seed: (_patterns(size, seed),), re_compile_test),
+    're_match': (lambda size, seed: (re.compile(LOG_LINE_PATTERN), _log_lines(size, seed)), re_match_test),
+    'str_join': (lambda size, seed: (_pieces(size, seed),), str_join_test),
+    'str_concat': (lambda size, seed: (_pieces(size, seed),), str_concat_test),
+    'stringio': (lambda size, seed: (_pieces(size, seed),), stringio_test),
+    'fstring': (lambda size, seed: (make_records(size, seed),), fstring_test),
+    'csv_round_trip': (lambda size, seed: (make_records(size, seed),), csv_round_trip_test),
+}
+
+
+def text_workload_test(func: Callable[..., int], copies: List[tuple],
+                       executor: Optional[concurrent.futures.Executor] = None) -> int:
+    """
+    Run a text workload once per prepared copy.
+
+    Args:
+        func: Workload function
+        copies: Argument tuples, one per copy
+        executor: Thread pool to run the copies concurrently on; None runs
+            them in turn on the calling thread
+
+    Returns:
+        Sum of the copies' results
+    """
+    if executor is None:
+        return sum(func(*args) for args in copies)
+    futures = [executor.submit(func, *args) for args in copies]
+    return sum(future.result() for future in futures)
+
+
+@contextlib.contextmanager
+def text_fixture(workload: str, size: int, driver: str,
+                 workers: int = TEXT_POOL_WORKERS) -> Iterator[Tuple[Callable, tuple]]:
+    """
+    Generate the corpora and, for the threads driver, start the pool, outside the timed region.
+
+    Args:
+        workload: Key into TEXT_WORKLOADS
+        size: Records, patterns, lines or pieces, depending on the workload
+        driver: One of TEXT_DRIVERS
+        workers: Pool size and number of copies for the threads driver
+
+    Yields:
+        Tuple of (text_workload_test, args) to time; the pool shuts down on exit
+    """
+    prepare, func = TEXT_WORKLOADS[workload]
+    if driver == 'single':
+        yield text_workload_test, (func, [prepare(size, 0)])
+        return
+    copies = [prepare(size, seed) for seed in range(workers)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        _start_workers(executor, workers)
+        yield text_workload_test, (func, copies, executor)
+
+
+def run_text_benchmark(workload: str = 'json_loads', size: int = 1000, driver: str = 'single',
+                       repeats: int = 1, workers: int = TEXT_POOL_WORKERS) -> dict:
+    """
+    Run text workload benchmark.
+
+    The corpus is generated before timing. The threads driver gives each
+    worker its own corpus (different seed) and times all copies together on a
+    pool started beforehand.
+
+    Args:
+        workload: Key into TEXT_WORKLOADS (default: 'json_loads')
+        size: Records, patterns, lines or pieces, depending on the workload (default: 1000)
+        driver: One of TEXT_DRIVERS (default: 'single')
+        repeats: Number of times to repeat the test (default: 1)
+        workers: Pool size and number of copies for the threads driver (default: TEXT_POOL_WORKERS)
+
+    Returns:
+        Dictionary containing benchmark results, with 'metrics' giving the
+        copies run and items processed per second
+    """
+    if workload not in TEXT_WORKLOADS:
+        raise ValueError(f"Unknown text workload: {workload!r}")
+    if driver not in TEXT_DRIVERS:
+        raise ValueError(f"Unknown text driver: {driver!r}")
+
+    label = 'single' if driver == 'single' else f"{workers} threads"
+    with text_fixture(workload, size, driver, workers) as (func, args):
+        results = run_benchmark(f"Text [{workload}, {label}] ({size:,})", func, *args, repeats=repeats)
+
+    copies = 1 if driver == 'single' else workers
+    median = results['statistics']['median']
+    results['metrics'] = {
+        'copies': copies,
+        'items_per_s': copies * size / median if median else None,
+    }
+    return results
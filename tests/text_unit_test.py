@@ -0,0 +1,48 @@
+"""
+Unit tests for the text and serialization workloads (text_test).
+"""
+
+import pytest
+
+from tests.text_test import TEXT_DRIVERS, TEXT_WORKLOADS, run_text_benchmark, text_fixture
+
+
+def test_workload_results() -> None:
+    """Each workload's result counts what it processed."""
+    expected = {'json_loads': 10, 'csv_round_trip': 10, 're_compile': 10 * 2}
+    for workload, result in expected.items():
+        with text_fixture(workload, 10, 'single') as (func, args):
+            assert func(*args) == result
+
+
+def test_string_builders_agree() -> None:
+    """join, += and StringIO build strings of the same length from the same pieces."""
+    lengths = set()
+    for workload in ['str_join', 'str_concat', 'stringio']:
+        with text_fixture(workload, 50, 'single') as (func, args):
+            lengths.add(func(*args))
+    assert len(lengths) == 1
+
+
+def test_threads_driver_runs_one_copy_per_worker() -> None:
+    """The threads driver runs `workers` copies, each on its own corpus."""
+    for workload in TEXT_WORKLOADS:
+        with text_fixture(workload, 20, 'threads', workers=3) as (func, args):
+            assert len(args[1]) == 3
+            assert func(*args) > 0
+
+
+def test_run_text_benchmark_reports_metrics() -> None:
+    """The metrics give the copies run and the items processed per second."""
+    for driver in TEXT_DRIVERS:
+        results = run_text_benchmark('re_match', 100, driver, repeats=2, workers=2)
+        assert results['metrics']['copies'] == (1 if driver == 'single' else 2)
+        assert results['metrics']['items_per_s'] > 0
+
+
+def test_unknown_workload_and_driver_are_rejected() -> None:
+    """A workload outside TEXT_WORKLOADS or a driver outside TEXT_DRIVERS raises ValueError."""
+    with pytest.raises(ValueError):
+        run_text_benchmark('yaml_loads')
+    with pytest.raises(ValueError):
+        run_text_benchmark('json_loads', driver='processes')
@@ -0,0 +1,164 @@
+"""
+Thread-count stress benchmark tests.
+
+The multithread I/O benchmarks stop at 32 threads; blocking services run
+thousands. These tests park thousands of threads (plain threading.Thread, as
+in multithread_io_test, or a ThreadPoolExecutor, as in
+concurrent_futures_io_test) on one event, release them together, and let each
+run io_intensive_task. Each sample reports creation latency, RSS growth per
+thread, how long the last thread takes to wake after the event is set, and
+join latency, optionally with a smaller or larger threading.stack_size.
+"""
+
+import concurrent.futures
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from .allocation_test import current_rss
+from .base_test import BenchmarkUnavailable, _calculate_statistics, _percentiles
+from .multithread_test import io_intensive_task
+
+# Ways of running the threads: one threading.Thread each, or one ThreadPoolExecutor worker each
+THREAD_STRESS_MODES = ['threads', 'futures']
+
+# Stack size variant -> threading.stack_size value in bytes (None keeps the platform default)
+THREAD_STACK_SIZES: Dict[str, Optional[int]] = {'default': None, '128k': 128 * 1024, '1m': 1024 * 1024}
+
+# io_intensive_task duration each thread runs after waking
+THREAD_STRESS_DURATION = 0.01
+
+# Seconds a parked thread waits for the release before giving up
+_PARK_TIMEOUT = 120.0
+
+
+def thread_stress_test(num_threads: int, mode: str = 'threads', stack_size: Optional[int] = None,
+                       duration: float = THREAD_STRESS_DURATION) -> Dict[str, Any]:
+    """
+    Start, park, release and join `num_threads` threads running io_intensive_task.
+
+    Args:
+        num_threads: Number of threads alive at once
+        mode: One of THREAD_STRESS_MODES
+        stack_size: threading.stack_size for the new threads (None for the default)
+        duration: io_intensive_task duration per thread
+
+    Returns:
+        Dictionary with 'create_s' (until every thread is running),
+        'rss_per_thread' (bytes, None if RSS is unavailable), 'wake_ns' (each
+        thread's delay after the release), 'join_s' (from the release until
+        all threads are joined) and 'total_s'
+
+    Raises:
+        BenchmarkUnavailable: If the OS refuses to start that many threads
+    """
+    if mode not in THREAD_STRESS_MODES:
+        raise ValueError(f"Unknown thread stress mode: {mode!r}")
+
+    started = threading.Barrier(num_threads + 1, timeout=_PARK_TIMEOUT)
+    release = threading.Event()
+    wake_times: List[int] = []
+    released_at = [0]
+
+    def worker(task_id: int) -> int:
+        started.wait()
+        release.wait(_PARK_TIMEOUT)
+        wake_times.append(time.perf_counter_ns() - released_at[0])
+        return io_intensive_task(task_id, duration)
+
+    previous_stack_size = threading.stack_size(stack_size or 0)
+    rss_before = current_rss()
+    threads: List[threading.Thread] = []
+    executor = None
+    start_time = time.perf_counter_ns()
+    try:
+        if mode == 'threads':
+            for i in range(num_threads):
+                thread = threading.Thread(target=worker, args=(i,))
+                thread.start()
+                threads.append(thread)
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
+            futures = [executor.submit(worker, i) for i in range(num_threads)]
+        started.wait()
+    except RuntimeError as e:
+        # "can't start new thread": release whatever did start, then report the limit
+        started.abort()
+        release.set()
+        for thread in threads:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        raise BenchmarkUnavailable(f"cannot run {num_threads:,} threads here: {e}") from e
+    finally:
+        threading.stack_size(previous_stack_size)
+
+    create_s = (time.perf_counter_ns() - start_time) / 1e9
+    rss_after = current_rss()
+
+    released_at[0] = time.perf_counter_ns()
+    release.set()
+    if mode == 'threads':
+        for thread in threads:
+            thread.join()
+    else:
+        for future in futures:
+            future.result()
+        executor.shutdown(wait=True)
+    join_s = (time.perf_counter_ns() - released_at[0]) / 1e9
+
+    return {
+        'create_s': create_s,
+        'rss_per_thread': (rss_after - rss_before) / num_threads if rss_before is not None else None,
+        'wake_ns': wake_times,
+        'join_s': join_s,
+        'total_s': create_s + join_s,
+    }
+
+
+def run_thread_stress_benchmark(num_threads: int = 1000, mode: str = 'threads', stack: str = 'default',
+                                repeats: int = 1, duration: float = THREAD_STRESS_DURATION) -> dict:
+    """
+    Run thread-count stress benchmark.
+
+    Args:
+        num_threads: Threads alive at once (default: 1000)
+        mode: One of THREAD_STRESS_MODES (default: 'threads')
+        stack: Key into THREAD_STACK_SIZES (default: 'default')
+        repeats: Number of times to repeat the test (default: 1)
+        duration: io_intensive_task duration per thread (default: THREAD_STRESS_DURATION)
+
+    Returns:
+        Dictionary in the same shape as run_benchmark's (timing creation plus
+        release and join), plus 'metrics' with the median creation latency per
+        thread, RSS per thread, join latency beyond the task duration, and
+        wake-up latency percentiles pooled over all repeats
+    """
+    if stack not in THREAD_STACK_SIZES:
+        raise ValueError(f"Unknown stack size variant: {stack!r}")
+
+    samples = [thread_stress_test(num_threads, mode, THREAD_STACK_SIZES[stack], duration) for _ in range(repeats)]
+    execution_times = [sample['total_s'] for sample in samples]
+    wake_ns = [wake for sample in samples for wake in sample['wake_ns']]
+    rss_per_thread = [sample['rss_per_thread'] for sample in samples if sample['rss_per_thread'] is not None]
+
+    wake_p50, wake_p99, wake_max = (value / 1e9 if value is not None else None
+                                    for value in _percentiles(wake_ns, (50, 99, 100)))
+
+    return {
+        'name': f"Thread Stress [{mode}, {stack} stack] ({num_threads:,} threads)",
+        'repeats': repeats,
+        'result': num_threads,
+        'all_results': [num_threads] * repeats,
+        'execution_times': execution_times,
+        'statistics': _calculate_statistics(execution_times),
+        'metrics': {
+            'create_s_per_thread': statistics.median(sample['create_s'] for sample in samples) / num_threads,
+            'rss_bytes_per_thread': statistics.median(rss_per_thread) if rss_per_thread else None,
+            'join_overhead_s': statistics.median(sample['join_s'] for sample in samples) - duration,
+            'wake_p50_s': wake_p50,
+            'wake_p99_s': wake_p99,
+            'wake_max_s': wake_max,
+        },
+        'timestamp': time.time()
+    }
@@ -0,0 +1,35 @@
+"""
+Unit tests for the thread-count stress benchmarks (thread_stress_test).
+"""
+
+import pytest
+
+from tests.thread_stress_test import THREAD_STRESS_MODES, run_thread_stress_benchmark, thread_stress_test
+
+
+def test_every_thread_wakes_once() -> None:
+    """Each mode records one wake-up per thread and times every phase."""
+    for mode in THREAD_STRESS_MODES:
+        sample = thread_stress_test(20, mode, duration=0.001)
+        assert len(sample['wake_ns']) == 20
+        assert sample['create_s'] > 0 and sample['join_s'] > 0
+        assert sample['total_s'] == sample['create_s'] + sample['join_s']
+
+
+def test_run_thread_stress_benchmark_reports_metrics() -> None:
+    """The metrics give per-thread creation and memory cost and wake-up percentiles in order."""
+    results = run_thread_stress_benchmark(20, 'futures', '1m', repeats=2, duration=0.001)
+
+    metrics = results['metrics']
+    assert results['result'] == 20
+    assert set(metrics) == {'create_s_per_thread', 'rss_bytes_per_thread', 'join_overhead_s',
+                            'wake_p50_s', 'wake_p99_s', 'wake_max_s'}
+    assert metrics['wake_p50_s'] <= metrics['wake_p99_s'] <= metrics['wake_max_s']
+
+
+def test_unknown_mode_and_stack_are_rejected() -> None:
+    """A mode outside THREAD_STRESS_MODES or a stack outside THREAD_STACK_SIZES raises ValueError."""
+    with pytest.raises(ValueError):
+        thread_stress_test(2, 'processes')
+    with pytest.raises(ValueError):
+        run_thread_stress_benchmark(2, stack='64k')
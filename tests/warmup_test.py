@@ -0,0 +1,231 @@
+"""
+Warmup-curve benchmark tests.
+
+The specializing interpreter (and the experimental JIT in 3.13+/3.14) only
+speeds code up after it has run a while. These tests time every one of the
+first N calls of a kernel in a fresh interpreter, find the call where timings
+settle, and report how much time was spent getting there. Each curve can be
+captured with the JIT forced off (PYTHON_JIT=0) or on (PYTHON_JIT=1) where the
+interpreter was built with it.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .base_test import BenchmarkUnavailable, _calculate_statistics
+from .fibonacci_test import fibonacci
+from .object_test import attribute_access_test, object_instantiation_test
+from .startup_test import PROJECT_ROOT
+
+# Kernel name -> callable(size) returning the (function, args) pair to call repeatedly
+WARMUP_KERNELS: Dict[str, Callable[[int], Tuple[Callable, tuple]]] = {
+    'fibonacci': lambda size: (fibonacci, (size,)),
+    'attribute_access': lambda size: (attribute_access_test, (object_instantiation_test(size),)),
+}
+
+# Problem size each kernel is called with; small so single calls are short
+WARMUP_KERNEL_SIZES = {'fibonacci': 15, 'attribute_access': 1000}
+
+# JIT mode -> PYTHON_JIT value (None leaves the interpreter's default)
+JIT_MODES: Dict[str, Optional[str]] = {'default': None, 'jit_off': '0', 'jit_on': '1'}
+
+# Rolling window (in calls) and relative tolerance used to decide a curve is steady
+STEADY_WINDOW = 10
+STEADY_TOLERANCE = 0.10
+
+# Runs _child_main in a fresh interpreter (kernel, size and calls follow as argv)
+_CHILD_CODE = "import sys; from tests.warmup_test import _child_main; _child_main(sys.argv[1:])"
+
+
+def jit_status() -> Dict[str, bool]:
+    """
+    Report whether this interpreter has a JIT and whether it is enabled.
+
+    Returns:
+        Dictionary with 'available' and 'enabled' flags (both False before
+        3.14, which added sys._jit)
+    """
+    jit = getattr(sys, '_jit', None)
+    if jit is None:
+        return {'available': False, 'enabled': False}
+    return {'available': bool(jit.is_available()), 'enabled': bool(jit.is_enabled())}
+
+
+def measure_warmup_curve(kernel: str, size: int, calls: int) -> List[int]:
+    """
+    Time each of the first `calls` calls of a kernel in this process.
+
+    Args:
+        kernel: Key into WARMUP_KERNELS
+        size: Problem size passed to the kernel
+        calls: Number of calls to time
+
+    Returns:
+        Per-call durations in nanoseconds, in call order
+    """
+    func, args = WARMUP_KERNELS[kernel](size)
+    clock = time.perf_counter_ns
+    curve = []
+    for _ in range(calls):
+        start_time = clock()
+        func(*args)
+        curve.append(clock() - start_time)
+    return curve
+
+
+def find_steady_state(curve: List[float], window: int = STEADY_WINDOW,
+                      tolerance: float = STEADY_TOLERANCE) -> int:
+    """
+    Find the call index from which a warmup curve stays steady.
+
+    The steady level is the median of the last quarter of the curve. The
+    curve is steady from the earliest window after which every rolling-window
+    median stays within `tolerance` of that level; slow calls at the start of
+    that window are skipped, so a step down is found at the step itself.
+
+    Args:
+        curve: Per-call durations
+        window: Rolling window size in calls
+        tolerance: Allowed relative excess over the steady level
+
+    Returns:
+        Index of the first steady call (len(curve) if it never settles)
+    """
+    if len(curve) < window * 2:
+        return len(curve)
+
+    steady_level = statistics.median(curve[-max(window, len(curve) // 4):])
+    limit = steady_level * (1 + tolerance)
+    steady_from = len(curve)
+    for start in range(len(curve) - window, -1, -1):
+        if statistics.median(curve[start:start + window]) > limit:
+            break
+        steady_from = start
+    while steady_from < len(curve) and curve[steady_from] > limit:
+        steady_from += 1
+    return steady_from
+
+
+def warmup_curve_test(kernel: str, size: int, calls: int, jit_mode: str = 'default',
+                      interpreter: str = sys.executable) -> Dict[str, Any]:
+    """
+    Capture one warmup curve in a fresh interpreter.
+
+    Args:
+        kernel: Key into WARMUP_KERNELS
+        size: Problem size passed to the kernel
+        calls: Number of calls to time
+        jit_mode: Key into JIT_MODES
+        interpreter: Interpreter executable to launch
+
+    Returns:
+        Dictionary with the 'curve' in nanoseconds and the child's 'jit' status
+
+    Raises:
+        BenchmarkUnavailable: If the JIT mode cannot be honoured by the interpreter
+    """
+    env = os.environ.copy()
+    env.pop('PYTHON_JIT', None)
+    if JIT_MODES[jit_mode] is not None:
+        env['PYTHON_JIT'] = JIT_MODES[jit_mode]
+
+    command = [interpreter, '-c', _CHILD_CODE, kernel, str(size), str(calls)]
+    completed = subprocess.run(command, env=env, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"warmup child failed: {completed.stderr.strip()}")
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    if jit_mode != 'default' and not report['jit']['available']:
+        raise BenchmarkUnavailable(f"{interpreter} was not built with the JIT; {jit_mode} not supported")
+    if jit_mode == 'jit_on' and not report['jit']['enabled']:
+        raise BenchmarkUnavailable("PYTHON_JIT=1 did not enable the JIT")
+    return report
+
+
+def run_warmup_benchmark(kernel: str = 'fibonacci', calls: int = 200, jit_mode: str = 'default',
+                         repeats: int = 1, size: Optional[int] = None,
+                         interpreter: str = sys.executable) -> dict:
+    """
+    Run warmup-curve benchmark.
+
+    Each repeat captures a curve in a fresh interpreter. The timed quantity is
+    the warmup cost: time spent before the steady-state call, in excess of
+    what those calls would have cost at steady state.
+
+    Args:
+        kernel: Key into WARMUP_KERNELS (default: 'fibonacci')
+        calls: Calls timed per curve (default: 200)
+        jit_mode: Key into JIT_MODES (default: 'default')
+        repeats: Number of curves to capture (default: 1)
+        size: Kernel problem size (default: WARMUP_KERNEL_SIZES[kernel])
+        interpreter: Interpreter executable to launch (default: current interpreter)
+
+    Returns:
+        Dictionary in the same shape as run_benchmark's, plus 'metrics' with the
+        steady-state call index, first-call and steady-state times and the
+        median curve in nanoseconds
+    """
+    if kernel not in WARMUP_KERNELS:
+        raise ValueError(f"Unknown warmup kernel: {kernel!r}")
+    if jit_mode not in JIT_MODES:
+        raise ValueError(f"Unknown JIT mode: {jit_mode!r}")
+    if size is None:
+        size = WARMUP_KERNEL_SIZES[kernel]
+
+    curves = []
+    warmup_costs = []
+    steady_indices = []
+    for _ in range(repeats):
+        report = warmup_curve_test(kernel, size, calls, jit_mode, interpreter)
+        curve = report['curve']
+        steady_index = find_steady_state(curve)
+        steady_level = statistics.median(curve[steady_index:] or curve[-STEADY_WINDOW:])
+        excess = sum(curve[:steady_index]) - steady_level * steady_index
+        curves.append(curve)
+        steady_indices.append(steady_index)
+        warmup_costs.append(max(excess, 0) / 1e9)
+
+    median_curve = [statistics.median(call_times) for call_times in zip(*curves)]
+    steady_index = find_steady_state(median_curve)
+    return {
+        'name': f"Warmup [{kernel}, {jit_mode}] ({calls:,} calls)",
+        'repeats': repeats,
+        'result': median_curve,
+        'all_results': curves,
+        'execution_times': warmup_costs,
+        'statistics': _calculate_statistics(warmup_costs),
+        'metrics': {
+            'steady_call_index': steady_index,
+            'steady_call_indices': steady_indices,
+            'first_call_s': median_curve[0] / 1e9,
+            'steady_call_s': statistics.median(median_curve[steady_index:]) / 1e9
+            if steady_index < len(median_curve) else None,
+            'jit': report['jit'],
+            'curve_ns': median_curve,
+        },
+        'timestamp': time.time()
+    }
+
+
+def print_warmup_results(results: dict) -> None:
+    """Print formatted warmup results with the steady-state point."""
+    metrics = results['metrics']
+    print(f"\n{results['name']}")
+    print(f"   JIT: available={metrics['jit']['available']} enabled={metrics['jit']['enabled']}")
+    print(f"   First call:  {metrics['first_call_s']:.6f} seconds")
+    if metrics['steady_call_s'] is None:
+        print(f"   Never reached steady state within {len(results['result'])} calls")
+    else:
+        print(f"   Steady from call {metrics['steady_call_index']}: {metrics['steady_call_s']:.6f} seconds/call")
+    print(f"   Warmup cost: {results['statistics']['mean']:.6f} seconds")
+
+
+def _child_main(argv: List[str]) -> None:
+    """Child-process entry point: print the curve and JIT status as JSON."""
+    kernel, size, calls = argv[0], int(argv[1]), int(argv[2])
+    curve = measure_warmup_curve(kernel, size, calls)
+    print(json.dumps({'curve': curve, 'jit': jit_status()}))
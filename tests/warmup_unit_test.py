@@ -0,0 +1,37 @@
+"""
+Unit tests for warmup-curve analysis (warmup_test.find_steady_state).
+
+The curves are synthetic, so these run on interpreters without a JIT.
+"""
+
+from tests.warmup_test import find_steady_state
+
+
+def test_flat_curve_is_steady_from_the_first_call() -> None:
+    """A curve without warmup is steady from call 0."""
+    assert find_steady_state([100] * 50) == 0
+
+
+def test_step_down_is_found_at_the_step() -> None:
+    """Slow calls followed by a lower plateau settle at the first fast call."""
+    curve = [1000] * 20 + [100] * 80
+    assert find_steady_state(curve) == 20
+
+
+def test_noise_within_tolerance_does_not_delay_the_steady_state() -> None:
+    """Jitter below the tolerance after the step still counts as steady."""
+    curve = [1000] * 20 + [100, 105, 98, 103] * 20
+    assert find_steady_state(curve) == 20
+
+
+def test_curve_that_never_settles_returns_its_length() -> None:
+    """A curve that keeps getting slower has no steady state."""
+    curve = [100 * 1.1 ** i for i in range(100)]
+    assert find_steady_state(curve) == len(curve)
+
+
+def test_curve_shorter_than_two_windows_returns_its_length() -> None:
+    """Too few calls to judge: the whole curve counts as warmup."""
+    assert find_steady_state([100] * 19, window=10) == 19
+    assert find_steady_state([], window=10) == 0
+    assert find_steady_state([100] * 20, window=10) == 0